@@ -24,9 +24,13 @@ if str(_APP_ROOT) not in sys.path:
     sys.path.insert(0, str(_APP_ROOT))
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 import os
 import datetime
-from typing import Dict, Any
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional
 
 # Import our modules (resume_core avoids PyPI 'core' package shadowing on Streamlit Cloud)
 from resume_core.config import (
@@ -34,33 +38,210 @@ from resume_core.config import (
     APP_ICON,
     DEFAULT_OPENROUTER_MODEL,
     AVAILABLE_OPENROUTER_MODELS,
+    OPENROUTER_MODEL_INDEX,
+    DEFAULT_OPENROUTER_MODEL_INDEX,
     OPENROUTER_MODEL_LABELS,
+    QUICK_ACTION_QUESTIONS,
+    OPENAI_BATCH_MODEL,
+    HISTORY_TOKEN_BUDGET,
     is_production,
 )
 from ui.session_manager import SessionManager
 from ui.ui_components import UIComponents
-from services.llm_providers import LLMProviders
+from services.llm_providers import LLMProviders, StreamError
 from services.resume_service import ResumeService
-from services.document_generator import DocumentGenerator
-from services.risk_management import risk_manager
-from services.data_governance import data_governor
-from services.record_keeping import record_keeper
-from services.compliance_monitoring import compliance_monitor
-from services.audit_procedures import audit_procedures
-from services.performance_analytics import performance_analytics
-from services.conformity_assessment import conformity_assessor
-from services.certification_preparation import certification_preparer
-from services.compliance_validation import compliance_validator
-from services.technical_documentation import tech_docs
-from services.mcp_ai_act_reader import mcp_ai_act_reader
-
-def process_user_message(user_message: str) -> str:
-    """Process a user message and return AI response"""
-    import time
+from services.resume_grounding import debug_log as _dbg_log, audit_response as _audit_response, GROUNDING_FOOTER
+from services.response_cache import get_response_cache
+from services.semantic_cache import get_semantic_cache
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=256, show_spinner=False)
+def _cached_context(user_message: str, recent_history: tuple = ()) -> str:
+    """Resume context for a query, memoized across reruns and sessions.
+
+    ``recent_history`` is the (role, content) window the resolver consults for
+    follow-up routing, so identical questions in identical conversations hit.
+    """
+    history = [{"role": role, "content": content} for role, content in recent_history]
+    return ResumeService.get_resume_context(user_message, history=history)
+
+def _get_context(user_message: str, recent_history: tuple = ()) -> str:
+    """Cached resume context; routing is case- and whitespace-insensitive, so the key is too"""
+    return _cached_context(" ".join(user_message.lower().split()), recent_history)
+
+def _history_key(history: list) -> tuple:
+    """Hashable view of the last turns used for follow-up context routing."""
+    return tuple(
+        (m["role"], m.get("content", ""))
+        for m in history[-6:]
+        if m.get("role") in ("user", "assistant")
+    )
+
+def _compact_history(messages: list, model: str, max_tokens: int = HISTORY_TOKEN_BUDGET) -> list:
+    """Drop the oldest turns until the history fits the token budget; the last message is always kept"""
+    kept = [messages[-1]]
+    total = LLMProviders.count_tokens(messages[-1]["content"], model)
+    for message in reversed(messages[:-1]):
+        total += LLMProviders.count_tokens(message["content"], model)
+        if total > max_tokens:
+            break
+        kept.append(message)
+    kept.reverse()
+    # A reply whose question was trimmed away would open the history with an orphan assistant turn
+    while len(kept) > 1 and kept[0]["role"] == "assistant":
+        kept.pop(0)
+    return kept
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_quick_action_contexts() -> threading.Thread:
+    """Warm the context cache for the fixed quick-action questions once per process"""
+    def _prefetch():
+        for question in QUICK_ACTION_QUESTIONS.values():
+            try:
+                # Cache keys hit by "Ask All" (no history) and by a first click in an empty chat
+                _get_context(question)
+                _get_context(question, (("user", question),))
+            except Exception as e:
+                print(f"Error prefetching context for '{question}': {e}")
+
+    prefetch_thread = threading.Thread(target=_prefetch)
+    prefetch_thread.daemon = True
+    add_script_run_ctx(prefetch_thread)
+    prefetch_thread.start()
+    return prefetch_thread
+
+def _session_api_key(provider: str) -> str:
+    """This session's key for the provider ("" for Ollama, which needs none)"""
+    if provider == "openai":
+        return st.session_state.get('openai_api_key', '')
+    if provider == "openrouter":
+        return st.session_state.get('openrouter_api_key', '')
+    return ""
+
+def _canned_answer_store() -> Dict[tuple, str]:
+    """This session's precomputed quick-action answers, keyed by (provider, model, question)"""
+    return st.session_state.setdefault('canned_answers', {})
+
+def _precompute_canned_answers(provider: str, model: str, api_key: str, skip: str = "") -> Optional[threading.Thread]:
+    """Answer the other quick-action questions in the background with this session's own key"""
+    running = st.session_state.get('canned_answers_thread')
+    if running is not None and running.is_alive():
+        return running
+    store = _canned_answer_store()
+    pending = [
+        question for question in QUICK_ACTION_QUESTIONS.values()
+        if question != skip and (provider, model, question) not in store
+    ]
+    if not pending:
+        return None
+
+    def _precompute():
+        for question in pending:
+            context = _get_context(question, (("user", question),))
+            answer = LLMProviders.chat(
+                provider, model, [{"role": "user", "content": question}], context, api_key
+            )
+            # Errors (rate limits, bad key) are left out so the next click asks the provider again
+            if not LLMProviders.is_error_response(answer):
+                store[(provider, model, question)] = answer
+
+    precompute_thread = threading.Thread(target=_precompute)
+    precompute_thread.daemon = True
+    add_script_run_ctx(precompute_thread)
+    precompute_thread.start()
+    st.session_state.canned_answers_thread = precompute_thread
+    return precompute_thread
+
+@st.cache_resource(show_spinner=False)
+def _get_record_keeper():
+    """Import the record keeper (and load its record files) on first use only"""
+    from services.record_keeping import record_keeper
+    return record_keeper
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_risk_summary() -> Dict:
+    from services.risk_management import risk_manager
+    return risk_manager.get_risk_summary()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_governance_status() -> Dict:
+    from services.data_governance import data_governor
+    return data_governor.get_governance_compliance_status()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_record_summary(record_count: int) -> Dict:
+    # Keyed on the record count so queued log writes invalidate it as they land
+    return _get_record_keeper().get_compliance_summary()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_monitoring_data() -> Dict:
+    from services.compliance_monitoring import compliance_monitor
+    return compliance_monitor.get_compliance_dashboard_data()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_audit_summary() -> Dict:
+    from services.audit_procedures import audit_procedures
+    return audit_procedures.get_audit_summary()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_performance_data() -> Dict:
+    from services.performance_analytics import performance_analytics
+    return performance_analytics.get_dashboard_metrics()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_assessment_summary() -> Dict:
+    from services.conformity_assessment import conformity_assessor
+    return conformity_assessor.get_assessment_summary()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_certification_readiness() -> Dict:
+    from services.certification_preparation import certification_preparer
+    return certification_preparer.get_certification_readiness()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_validation_status() -> Dict:
+    from services.compliance_validation import compliance_validator
+    return compliance_validator.get_compliance_validation_status()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_risk_report() -> Dict:
+    from services.risk_management import risk_manager
+    return risk_manager.get_comprehensive_risk_report()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_governance_report() -> Dict:
+    from services.data_governance import data_governor
+    return data_governor.get_comprehensive_data_governance_report()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_docs_report() -> Dict:
+    from services.technical_documentation import tech_docs
+    return tech_docs.get_comprehensive_documentation_report()
+
+def _clear_dashboard_cache():
+    """Drop cached dashboard aggregates so the next render recomputes them"""
+    for cached in (
+        _cached_risk_summary, _cached_governance_status, _cached_record_summary,
+        _cached_monitoring_data, _cached_audit_summary, _cached_performance_data,
+        _cached_assessment_summary, _cached_certification_readiness, _cached_validation_status,
+        _cached_risk_report, _cached_governance_report, _cached_docs_report,
+    ):
+        cached.clear()
+
+@st.cache_resource(show_spinner=False)
+def _get_background_executor() -> ThreadPoolExecutor:
+    """Shared pool for post-response bookkeeping the user should not wait on"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="post-response")
+
+def _log_user_interaction(**kwargs):
+    """Queue an interaction for record keeping without blocking the rerun on file writes"""
+    _get_record_keeper().log_user_interaction_async(**kwargs)
+
+def process_user_message_stream(user_message: str) -> Iterator[str]:
+    """Process a user message and stream the AI response chunk by chunk"""
     
     # Check if emergency stop is active
     if st.session_state.get('emergency_stop', False):
-        return """🛑 **AI System Stopped by Human Operator**
+        yield """🛑 **AI System Stopped by Human Operator**
 
 The AI system has been stopped by a human operator for review.
 
@@ -75,20 +256,20 @@ The AI system has been stopped by a human operator for review.
 - Use the sidebar to check system status
 
 **To resume:** A human operator must reset the system from the Human Oversight section in the sidebar."""
+        return
     
     # Start timing for record keeping
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
 
     # Build conversation history (last 6 turns = 3 user/assistant pairs + current)
     # Strip internal fields like "timestamp" that the LLM API doesn't expect
     history_raw = st.session_state.get("messages", [])
 
     # Get context from resume service (pass history so follow-up questions route correctly)
-    context = ResumeService.get_resume_context(user_message, history=history_raw)
+    context = _get_context(user_message, _history_key(history_raw))
     # #region agent log
-    from services.resume_grounding import debug_log as _dbg_log, audit_response as _audit_response
     _dbg_log(
-        "app.py:process_user_message",
+        "app.py:process_user_message_stream",
         "context ready for LLM",
         {"query_preview": user_message[:80], "context_chars": len(context)},
         "A",
@@ -99,7 +280,8 @@ The AI system has been stopped by a human operator for review.
     model = st.session_state.get('current_model', DEFAULT_OPENROUTER_MODEL)
     
     if not provider or not model:
-        return "⚠️ Please configure an LLM provider in the sidebar first!"
+        yield "⚠️ Please configure an LLM provider in the sidebar first!"
+        return
     messages = [
         {"role": m["role"], "content": m["content"]}
         for m in history_raw[-7:]
@@ -108,13 +290,14 @@ The AI system has been stopped by a human operator for review.
     # Guarantee the current user message is the final item
     if not messages or messages[-1]["content"] != user_message:
         messages.append({"role": "user", "content": user_message})
+    messages = _compact_history(messages, model)
 
     # Get API key based on provider
     api_key = ""
     if provider == "openrouter":
-        api_key = st.session_state.get('openrouter_api_key', '').strip()
+        api_key = st.session_state.get('openrouter_api_key', '')
         if not api_key:
-            return """🔑 **OpenRouter API Key Required**
+            yield """🔑 **OpenRouter API Key Required**
 
 To chat with AI, you need a free OpenRouter API key:
 
@@ -123,37 +306,58 @@ To chat with AI, you need a free OpenRouter API key:
 3. **Start Chatting**: Ask any questions about the resume!
 
 💡 **Alternative**: Use the Quick Access buttons below - they work without any setup and provide instant resume insights!"""
+            return
     elif provider == "openai":
         api_key = st.session_state.get("openai_api_key", "")
         if not api_key:
-            return "Please add your OpenAI API key in the sidebar first!"
+            yield "Please add your OpenAI API key in the sidebar first!"
+            return
     elif provider == "ollama":
         # Ollama doesn't need an API key
         api_key = ""
     
-    # Use the appropriate chat method based on provider
-    if provider == "openrouter":
-        response = LLMProviders.chat_openrouter(model, messages, context, api_key)
-    elif provider == "ollama":
-        response = LLMProviders.chat_ollama(model, messages, context)
-    elif provider == "openai":
-        response = LLMProviders.chat_openai(model, messages, context, api_key)
+    # An identical earlier request wins; otherwise standalone questions can reuse
+    # the answer to a near-identical earlier question
+    response_cache = get_response_cache()
+    cache_key = response_cache.make_key(model, context, messages) if response_cache else None
+    semantic_cache = get_semantic_cache() if len(messages) == 1 else None
+    
+    response = response_cache.get(cache_key) if response_cache else None
+    if response is None and semantic_cache:
+        response = semantic_cache.lookup(user_message, context, provider, model)
+    
+    if response is not None:
+        yield response
     else:
-        response = f"Unsupported provider: {provider}"
+        # Stream from the appropriate provider, keeping the chunks for record keeping
+        chunks = []
+        failed = False
+        for chunk in LLMProviders.chat_stream(provider, model, messages, context, api_key):
+            # Providers flag errors (including mid-stream failures) so a partial reply is never cached
+            failed = failed or isinstance(chunk, StreamError)
+            chunks.append(chunk)
+            yield chunk
+        response = "".join(chunks)
+        if not failed:
+            if response_cache:
+                response_cache.put(cache_key, response)
+            if semantic_cache:
+                semantic_cache.add(user_message, context, provider, model, response)
     
-    # Record keeping for AI Act compliance (Article 12)
-    processing_time_ms = int((time.time() - start_time) * 1000)
+    # Record keeping for AI Act compliance (Article 12) once the stream completes
+    processing_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     user_id = st.session_state.get('user_id', 'anonymous')
     session_id = st.session_state.get('session_id', 'default')
     
-    # Store last AI response for human oversight flagging
+    # Store last exchange for human oversight flagging
+    st.session_state.last_user_query = user_message
     st.session_state.last_ai_response = response
     # #region agent log
-    _audit_response(response, context, user_message)
+    _get_background_executor().submit(_audit_response, response, context, user_message)
     # #endregion
     
     # Log the user interaction
-    record_keeper.log_user_interaction(
+    _log_user_interaction(
         user_id=user_id,
         session_id=session_id,
         query=user_message,
@@ -162,51 +366,838 @@ To chat with AI, you need a free OpenRouter API key:
         processing_time_ms=processing_time_ms,
         confidence_score=None  # Could be added if available from LLM
     )
-    
-    return response
 
 def handle_quick_actions(actions: Dict[str, bool]):
-    """Handle quick action button clicks"""
-    if actions.get("summary"):
-        question = "Give me a full summary of this candidate"
-        SessionManager.add_message("user", question)
-        SessionManager.set_processing_state(question)
-        st.toast(f"Processing: {question[:50]}...")
-        st.rerun()
-    
-    elif actions.get("experience"):
-        question = "How many years of experience does this candidate have?"
-        SessionManager.add_message("user", question)
-        SessionManager.set_processing_state(question)
-        st.toast(f"Processing: {question[:50]}...")
-        st.rerun()
-    
-    elif actions.get("skills"):
-        question = "What are their strongest technical skills?"
-        SessionManager.add_message("user", question)
-        SessionManager.set_processing_state(question)
-        st.toast(f"Processing: {question[:50]}...")
-        st.rerun()
+    """Handle quick action button clicks; the chat panel below answers in this same run"""
+    provider = st.session_state.get('current_provider', 'openrouter')
+    model = st.session_state.get('current_model', DEFAULT_OPENROUTER_MODEL)
+    api_key = _session_api_key(provider)
+    # Keyless sessions go through the chat path, which asks for a key
+    has_key = bool(api_key) or provider == "ollama"
+    for action, question in QUICK_ACTION_QUESTIONS.items():
+        if actions.get(action):
+            answer = _canned_answer_store().get((provider, model, question)) if has_key else None
+            if answer and not st.session_state.get('emergency_stop', False):
+                SessionManager.add_message("user", question)
+                SessionManager.add_message("assistant", answer)
+                st.session_state.last_user_query = question
+                st.session_state.last_ai_response = answer
+                _log_user_interaction(
+                    user_id=st.session_state.get('user_id', 'anonymous'),
+                    session_id=st.session_state.get('session_id', 'default'),
+                    query=question,
+                    response=answer,
+                    ai_model=model,
+                    processing_time_ms=0,
+                    confidence_score=None
+                )
+                return
+            SessionManager.queue_prompt(question)
+            st.toast(f"Processing: {question[:50]}...")
+            # The first click pays for the remaining quick answers with this session's key
+            if has_key and not st.session_state.get('emergency_stop', False):
+                _precompute_canned_answers(provider, model, api_key, skip=question)
+            return
     
-    elif actions.get("match"):
+    if actions.get("match"):
         st.session_state.show_job_analysis_modal = True
-        st.rerun()
+
+def run_all_quick_actions():
+    """Answer every quick-action question with one batched LLM call"""
+    if st.session_state.get('emergency_stop', False):
+        st.toast("🛑 AI system stopped by human operator", icon="🛑")
+        return
+
+    questions = list(QUICK_ACTION_QUESTIONS.values())
+    provider = st.session_state.get('current_provider', 'openrouter')
+    model = st.session_state.get('current_model', DEFAULT_OPENROUTER_MODEL)
+    api_key = _session_api_key(provider)
+    if not api_key and provider != "ollama":
+        # Same gate as the chat path: ask for a key instead of posting the key error three times
+        st.session_state.show_api_key_modal = True
+        st.toast("🔑 Add an API key to answer the quick questions")
+        return
+
+    # One shared context: each question's context once, with a single grounding footer
+    contexts = [_get_context(q).removesuffix(GROUNDING_FOOTER) for q in questions]
+    shared_context = "\n\n---\n\n".join(dict.fromkeys(contexts)) + GROUNDING_FOOTER
+
+    start_ns = time.monotonic_ns()
+    answers = LLMProviders.chat_batch(provider, model, questions, shared_context, api_key)
+    processing_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+
+    for question, answer in zip(questions, answers):
+        SessionManager.add_message("user", question)
+        SessionManager.add_message("assistant", answer)
+        _log_user_interaction(
+            user_id=st.session_state.get('user_id', 'anonymous'),
+            session_id=st.session_state.get('session_id', 'default'),
+            query=question,
+            response=answer,
+            ai_model=model,
+            processing_time_ms=processing_time_ms,
+            confidence_score=None
+        )
+    if answers:
+        st.session_state.last_user_query = questions[-1]
+        st.session_state.last_ai_response = answers[-1]
+
+@st.fragment
+def render_compliance_dashboard():
+    """Compliance dashboard body; reruns on its own so its buttons skip the rest of the app"""
+    # Expanders don't report whether they are open, so aggregation waits for an explicit toggle
+    if not st.toggle("Load compliance data", key="compliance_open"):
+        st.caption("Turn on to load live compliance metrics")
+        return
+
+    # Compliance services load their state files at import; the cached loaders import them on first use
+    from services.mcp_ai_act_reader import mcp_ai_act_reader
+
+    # Get real compliance data from mcp-ai-act reports
+    mcp_report = mcp_ai_act_reader.get_latest_report()
+    mcp_metadata = mcp_ai_act_reader.get_report_metadata()
+
+    # Load system data
+    risk_summary = _cached_risk_summary()
+    governance_status = _cached_governance_status()
+    record_summary = _cached_record_summary(len(_get_record_keeper().records))
+    monitoring_data = _cached_monitoring_data()
+    audit_summary = _cached_audit_summary()
+    performance_data = _cached_performance_data()
+    assessment_summary = _cached_assessment_summary()
+    certification_readiness = _cached_certification_readiness()
+    validation_status = _cached_validation_status()
+
+    # ===== SECTION 1: CURRENT STATUS (SHOW FIRST) =====
+    st.markdown("**✅ Current Compliance Status**")
+
+    # Show current status from system
+    col1, col2 = st.columns(2)
+    with col1:
+        # Get current compliance score from validation
+        if 'overall_score' in validation_status and validation_status['overall_score']:
+            current_score = validation_status['overall_score'] * 100
+        elif mcp_report:
+            current_score = mcp_ai_act_reader.get_compliance_score() * 100
+        else:
+            current_score = None
+
+        if current_score:
+            st.metric("Compliance Score", f"{current_score:.1f}%", 
+                     delta=f"{current_score - 33:.1f}%" if current_score > 33 else None)
+        else:
+            st.metric("Compliance Score", "Calculating...")
+
+        st.metric("Certification Ready", 
+                 "✅ Yes" if validation_status.get('certification_ready', False) else "⏳ In Progress")
+
+    with col2:
+        st.metric("Migration Status", "✅ Complete", "100%")
+        st.metric("Systems Operational", "9/9", "All Active")
+
+    # System operational status
+    st.markdown("**System Status**")
+    status_items = [
+        ("Risk Management", risk_summary.get('status', 'Active')),
+        ("Data Governance", governance_status.get('status', 'Active')),
+        ("Record Keeping", record_summary.get('status', 'Active')),
+        ("Monitoring", monitoring_data.get('monitoring_status', 'Active')),
+        ("Audit Procedures", audit_summary.get('status', 'Active')),
+        ("Validation", validation_status.get('overall_status', 'Active'))
+    ]
+
+    col1, col2 = st.columns(2)
+    for i, (name, status) in enumerate(status_items):
+        col = col1 if i < 3 else col2
+        with col:
+            status_icon = "✅" if status in ["Active", "Operational", "Complete", "Functional"] else "⚠️"
+            st.markdown(f"{status_icon} **{name}**")
+
+    st.markdown("---")
+
+    # ===== SECTION 2: LAST REPORT (MCP AI ACT ASSESSMENT) =====
+    st.markdown("**📋 Last Compliance Assessment Report**")
+
+    if mcp_report:
+        # Show report summary first
+        risk_level = mcp_ai_act_reader.get_risk_level()
+        risk_emoji = "🔴" if "high" in risk_level.lower() else "🟡" if "medium" in risk_level.lower() else "🟢"
+        compliance_score = mcp_ai_act_reader.get_compliance_score()
+        articles = mcp_ai_act_reader.get_applicable_articles()
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Report Risk Level", f"{risk_emoji} {risk_level.replace('_', ' ').title()}")
+            st.metric("Report Score", f"{compliance_score * 100:.1f}%")
+        with col2:
+            st.metric("Applicable Articles", len(articles))
+            if mcp_metadata.get("available"):
+                report_date = mcp_metadata.get('analysis_timestamp', 'Unknown')
+                if report_date != 'Unknown':
+                    try:
+                        dt = datetime.datetime.fromisoformat(report_date.replace('Z', '+00:00'))
+                        st.metric("Report Date", dt.strftime("%Y-%m-%d"))
+                    except:
+                        st.metric("Report Date", "Recent")
+                else:
+                    st.metric("Report Date", "Unknown")
+
+        st.caption(f"📅 Session: {mcp_metadata.get('session_id', 'Unknown')}")
+    else:
+        st.warning("⚠️ No MCP AI Act compliance report found.")
+        st.caption("Run a compliance assessment using the MCP AI Act tool to see assessment data.")
+
+    with st.expander("📋 Full Assessment Details", expanded=False):
+        st.caption("Detailed assessment information from MCP AI Act tool")
+
+        if mcp_report:
+            # Risk breakdown
+            risk_breakdown = mcp_ai_act_reader.get_risk_breakdown()
+            if risk_breakdown:
+                st.markdown("**Risk Breakdown**")
+                for risk_type, percentage in risk_breakdown.items():
+                    st.metric(risk_type.replace('_', ' ').title(), f"{percentage}%")
+
+            # Applicable articles
+            applicable_articles = mcp_ai_act_reader.get_applicable_articles()
+            if applicable_articles:
+                st.markdown("**📋 Applicable Articles**")
+                for article in applicable_articles:
+                    st.markdown(f"✅ {article}")
+
+            # Compliance categories
+            compliance_categories = mcp_ai_act_reader.get_compliance_categories()
+            if compliance_categories:
+                st.markdown("**📊 Compliance Categories**")
+                for cat_name, cat_data in compliance_categories.items():
+                    if isinstance(cat_data, dict) and cat_data.get("applicable"):
+                        cat_display = cat_name.replace('_', ' ').title()
+                        st.markdown(f"✅ **{cat_display}**")
+                        if cat_data.get("requirements"):
+                            for req in cat_data["requirements"][:2]:
+                                st.caption(f"• {req}")
+
+            # Recommendations
+            recommendations = mcp_ai_act_reader.get_recommendations()
+            if recommendations:
+                st.markdown("**💡 Recommendations**")
+                for i, rec in enumerate(recommendations[:5], 1):
+                    st.markdown(f"{i}. {rec}")
+                if len(recommendations) > 5:
+                    st.caption(f"... +{len(recommendations) - 5} more")
+
+    st.markdown("---")
+
+    # ===== SECTION 3: HOW AWP MADE IT GOOD =====
+    st.markdown("**🔄 How AWP Made It Good**")
+
+    st.markdown("""
+    <div style="background: #e0e7ff; border-left: 3px solid #6366f1; border-radius: 4px; padding: 0.5rem; margin-bottom: 0.75rem;">
+        <p style="margin: 0; color: #312e81; font-size: 0.75rem; line-height: 1.4;">
+            <strong>🤖 AWP Controlled Development</strong><br>
+            All compliance fixes were systematically implemented through AWP methodology.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Show improvement metrics
+    if mcp_report:
+        baseline_score = mcp_ai_act_reader.get_compliance_score() * 100
+        current_score = validation_status.get('overall_score', 0) * 100 if validation_status.get('overall_score') else baseline_score
+        improvement = current_score - baseline_score if current_score > baseline_score else 0
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Before (Report)", f"{baseline_score:.1f}%")
+            st.metric("Phases Completed", "5/5")
+        with col2:
+            st.metric("After (Current)", f"{current_score:.1f}%", delta=f"+{improvement:.1f}%")
+            st.metric("Systems Implemented", "9")
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Before", "33%")
+            st.metric("Phases", "5/5")
+        with col2:
+            st.metric("After", "100%", delta="+67%")
+            st.metric("Systems", "9")
+
+    with st.expander("📋 AWP Migration Details", expanded=False):
+        st.caption("Complete migration plan and implementation details")
+
+        # AWP Phases
+        st.markdown("**Migration Phases**")
+        phases = [
+            ("P1", "Immediate Compliance", "AI transparency, human oversight"),
+            ("P2", "Core Implementation", "Risk mgmt, data governance, docs"),
+            ("P3", "Advanced Compliance", "Monitoring, audit, analytics"),
+            ("P4", "Certification", "Documentation, validation"),
+            ("P5", "Maintenance", "Continuous monitoring")
+        ]
+
+        for phase_num, phase_name, phase_desc in phases:
+            st.markdown(f"**{phase_num}:** {phase_name} - {phase_desc}")
+
+        # AWP Implementation Details
+        st.markdown("**🛠️ Implemented Systems**")
+        systems = [
+            "✅ Risk Management", "✅ Data Governance", "✅ Technical Docs",
+            "✅ Compliance Monitoring", "✅ Audit Procedures", "✅ Performance Analytics",
+            "✅ Conformity Assessment", "✅ Certification Prep", "✅ Validation"
+        ]
+
+        for system in systems:
+            st.markdown(system)
+
+        st.markdown("**Key Achievements:**")
+        achievements = [
+            "🎯 8 critical requirements addressed",
+            "📊 Real-time dashboard with MCP AI Act integration",
+            "📝 Complete technical documentation",
+            "🛡️ Comprehensive human oversight",
+            "📈 Automated compliance monitoring",
+            "✅ Ready for EU AI Act certification"
+        ]
+
+        for achievement in achievements:
+            st.markdown(f"• {achievement}")
+
+        st.caption("📄 See `agentic-sdlc/PROJECT_COMPLETION_SUMMARY.md` for complete details")
+
+    st.markdown("---")
+
+    # ===== SECTION 5: SYSTEM STATUS & MONITORING =====
+    st.markdown("**🔄 System Status**")
+
+    # Monitoring section (mobile-first: 2 columns)
+    with st.expander("📈 Monitoring & Alerts", expanded=False):
+        st.caption("Real-time system monitoring")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Active Alerts", monitoring_data['active_alerts'])
+            st.metric("Status", monitoring_data['monitoring_status'])
+        with col2:
+            st.metric("Critical Alerts", monitoring_data['critical_alerts'])
+
+        if monitoring_data['metrics_summary']:
+            st.markdown("**Recent Metrics**")
+            for metric_type, stats in monitoring_data['metrics_summary'].items():
+                if isinstance(stats, dict) and 'latest' in stats:
+                    st.metric(metric_type.replace('_', ' ').title(), 
+                             f"{stats['latest']:.2f}")
+
+    # Performance analytics
+    with st.expander("📊 Performance Analytics", expanded=False):
+        st.caption("System performance metrics and KPIs")
+        if 'kpis' in performance_data:
+            st.markdown("**Key Performance Indicators**")
+            for category, kpi in performance_data['kpis'].items():
+                st.metric(
+                    category.replace('_', ' ').title(),
+                    f"{kpi['current_value']:.2f}",
+                    delta=f"{kpi['trend']}"
+                )
+        else:
+            st.write("No performance data available")
+
+    # Audit procedures
+    with st.expander("🔍 Audit Procedures", expanded=False):
+        st.caption("Compliance audit status and history")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Audits", audit_summary['total_audits'])
+        with col2:
+            st.metric("Completed", audit_summary['completed_audits'])
+
+        if audit_summary['latest_audit']:
+            latest = audit_summary['latest_audit']
+            st.markdown("**Latest Audit**")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Score", f"{latest['score']:.1f}" if latest['score'] else "N/A")
+            with col2:
+                st.metric("Result", latest['result'] or "Pending")
+
+    # Record keeping
+    with st.expander("📝 Record Keeping", expanded=False):
+        st.caption("System records and audit trail status")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("System Records", record_summary['total_records'])
+        with col2:
+            st.metric("Audit Trails", record_summary['total_audit_trails'])
+        with col3:
+            st.metric("Retention Compliance", 
+                     f"{record_summary['retention_compliance']['compliance_percentage']:.1f}%")
+
+    st.markdown("---")
+
+    # ===== SECTION 6: CERTIFICATION & VALIDATION =====
+    st.markdown("**✅ Certification**")
+
+    # Conformity assessment (mobile-first: single column metrics)
+    with st.expander("✅ Conformity Assessment", expanded=False):
+        st.caption("EU AI Act conformity assessment status")
+        st.metric("Total Assessments", assessment_summary['total_assessments'])
+        st.metric("Completed", assessment_summary['completed_assessments'])
+
+        if assessment_summary['latest_assessment']:
+            latest = assessment_summary['latest_assessment']
+            st.markdown("**Latest Assessment**")
+            st.metric("Score", f"{latest['score']:.1f}" if latest['score'] else "N/A")
+            st.metric("Certification Ready", "Yes" if latest['certification_ready'] else "No")
+
+    # Certification preparation (mobile-first: single column)
+    with st.expander("📋 Certification Preparation", expanded=False):
+        st.caption("Certification readiness and document status")
+        st.metric("Readiness", f"{certification_readiness['readiness_percentage']:.1f}%")
+        st.metric("Ready for Submission", "Yes" if certification_readiness['ready_for_submission'] else "No")
+        st.metric("Approved Docs", f"{certification_readiness['approved_documents']}/{certification_readiness['total_required_documents']}")
+
+    # Compliance validation (mobile-first: single column)
+    with st.expander("✔️ Compliance Validation", expanded=False):
+        st.caption("Overall compliance validation status")
+        if 'overall_status' in validation_status:
+            st.markdown("**Validation Status**")
+            st.metric("Status", validation_status['overall_status'].replace('_', ' ').title())
+            st.metric("Score", f"{validation_status['overall_score']:.1f}" if validation_status['overall_score'] else "N/A")
+            st.metric("Certification Ready", "Yes" if validation_status['certification_ready'] else "No")
+        else:
+            st.write("No validation data available")
+
+    st.markdown("---")
+
+    # ===== SECTION 7: DETAILED COMPLIANCE REPORTS =====
+    st.markdown("**📋 Detailed Reports**")
+
+    # Risk management summary - Enhanced for Article 9 compliance
+    with st.expander("⚠️ Risk Management (Article 9)", expanded=False):
+        st.caption("EU AI Act Article 9 - Risk Management System")
+
+        # Get comprehensive risk report
+        risk_report = _cached_risk_report()
+
+        # Risk metrics (mobile-first: 2 columns)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Risks", risk_report['risk_metrics']['total_risks'])
+            st.metric("Critical", risk_report['risk_metrics']['critical_risks'], 
+                     delta="High" if risk_report['risk_metrics']['critical_risks'] > 0 else None)
+        with col2:
+            st.metric("Mitigated", risk_report['risk_metrics']['mitigated_risks'])
+            st.metric("Effectiveness", f"{risk_report['risk_management_effectiveness']['effectiveness_score']:.1f}%",
+                     delta=risk_report['risk_management_effectiveness']['status'])
+
+        # Risk distribution charts (mobile-first: stack vertically)
+        if risk_report['risk_distribution']['by_level']:
+            st.markdown("**Risk by Level**")
+            st.bar_chart(risk_report['risk_distribution']['by_level'])
+
+        if risk_report['risk_distribution']['by_category']:
+            st.markdown("**Risk by Category**")
+            st.bar_chart(risk_report['risk_distribution']['by_category'])
+
+        # Compliance status (mobile-first: 2 columns)
+        st.markdown("**Compliance Status**")
+        compliance_items = [
+            ("System", risk_report['compliance_status']['risk_management_system']),
+            ("Procedures", risk_report['compliance_status']['assessment_procedures']),
+            ("Strategies", risk_report['compliance_status']['mitigation_strategies']),
+            ("Monitoring", risk_report['compliance_status']['monitoring_systems']),
+            ("Documentation", risk_report['compliance_status']['documentation'])
+        ]
+
+        col1, col2 = st.columns(2)
+        for i, (label, status) in enumerate(compliance_items):
+            col = col1 if i < 3 else col2
+            with col:
+                status_icon = "✅" if status in ["Operational", "Implemented", "Active", "Functional", "Complete"] else "⚠️"
+                st.markdown(f"{status_icon} **{label}**")
+
+        # Next assessment due
+        st.markdown(f"**Next Risk Assessment Due:** {risk_report['next_assessment_due']}")
+
+        # Risk management actions (mobile-first: stack vertically)
+        st.markdown("---")
+        if st.button("📊 Generate Report", key="generate_risk_report", use_container_width=True):
+            st.toast("📊 Generating comprehensive risk report", icon="📊")
+        if st.button("🔍 Start Assessment", key="start_risk_assessment", use_container_width=True):
+            st.toast("🔍 Starting new risk assessment", icon="🔍")
+        if st.button("📋 View Details", key="view_risk_details", use_container_width=True):
+            st.toast("📋 Opening detailed risk view", icon="📋")
+
+    # Data governance summary - Enhanced for Article 10 compliance
+    with st.expander("📊 Data Governance (Article 10)", expanded=False):
+        st.caption("EU AI Act Article 10 - Data Governance and Quality Management")
+
+        # Get comprehensive data governance report
+        governance_report = _cached_governance_report()
+
+        # Governance metrics (mobile-first: 2 columns)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Assessments", governance_report['governance_metrics']['total_assessments'])
+            st.metric("Quality Score", f"{governance_report['governance_metrics']['overall_quality_score']:.1f}%")
+        with col2:
+            st.metric("Records", governance_report['governance_metrics']['total_processing_records'])
+            st.metric("Effectiveness", f"{governance_report['data_governance_effectiveness']['effectiveness_score']:.1f}%",
+                     delta=governance_report['data_governance_effectiveness']['status'])
+
+        # Quality metrics breakdown (mobile-first: 2 columns)
+        st.markdown("**Quality Metrics**")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Completeness", f"{governance_report['quality_metrics']['average_completeness']:.1f}%")
+            st.metric("Accuracy", f"{governance_report['quality_metrics']['average_accuracy']:.1f}%")
+        with col2:
+            st.metric("Consistency", f"{governance_report['quality_metrics']['average_consistency']:.1f}%")
+            st.metric("Timeliness", f"{governance_report['quality_metrics']['average_timeliness']:.1f}%")
+
+        # Data distribution charts (mobile-first: stack vertically)
+        if governance_report['data_distribution']['by_quality_level']:
+            st.markdown("**Quality Distribution**")
+            st.bar_chart(governance_report['data_distribution']['by_quality_level'])
+
+        if governance_report['data_distribution']['by_category']:
+            st.markdown("**Category Distribution**")
+            st.bar_chart(governance_report['data_distribution']['by_category'])
+
+        # Compliance status (mobile-first: 2 columns)
+        st.markdown("**Compliance Status**")
+        compliance_items = [
+            ("Quality Mgmt", governance_report['compliance_status']['data_quality_management']),
+            ("Processing", governance_report['compliance_status']['processing_records']),
+            ("Assessments", governance_report['compliance_status']['quality_assessments']),
+            ("Remediation", governance_report['compliance_status']['remediation_procedures']),
+            ("Documentation", governance_report['compliance_status']['documentation'])
+        ]
+
+        col1, col2 = st.columns(2)
+        for i, (label, status) in enumerate(compliance_items):
+            col = col1 if i < 3 else col2
+            with col:
+                status_icon = "✅" if status in ["Operational", "Maintained", "Regular", "Active", "Complete"] else "⚠️"
+                st.markdown(f"{status_icon} **{label}**")
+
+        # Next assessment due
+        st.markdown(f"**Next Quality Assessment Due:** {governance_report['next_assessment_due']}")
+
+        # Data governance actions (mobile-first: stack vertically)
+        st.markdown("---")
+        if st.button("📊 Generate Report", key="generate_governance_report", use_container_width=True):
+            st.toast("📊 Generating comprehensive data governance report", icon="📊")
+        if st.button("🔍 Start Assessment", key="start_quality_assessment", use_container_width=True):
+            st.toast("🔍 Starting new data quality assessment", icon="🔍")
+        if st.button("📋 View Records", key="view_processing_records", use_container_width=True):
+            st.toast("📋 Opening processing records view", icon="📋")
+
+    # Technical documentation summary - Enhanced for Article 11 compliance
+    with st.expander("📚 Technical Documentation (Article 11)", expanded=False):
+        st.caption("EU AI Act Article 11 - Technical Documentation")
+
+        # Get comprehensive technical documentation report
+        docs_report = _cached_docs_report()
+
+        # Documentation metrics (mobile-first: 2 columns)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Docs", docs_report['documentation_metrics']['total_documents'])
+            st.metric("Approved", docs_report['documentation_metrics']['approved_documents'])
+        with col2:
+            st.metric("Published", docs_report['documentation_metrics']['published_documents'])
+            st.metric("Effectiveness", f"{docs_report['documentation_effectiveness']['effectiveness_score']:.1f}%",
+                     delta=docs_report['documentation_effectiveness']['status'])
+
+        # Documentation distribution charts (mobile-first: stack vertically)
+        if docs_report['documentation_distribution']['by_type']:
+            st.markdown("**Docs by Type**")
+            st.bar_chart(docs_report['documentation_distribution']['by_type'])
+
+        if docs_report['documentation_distribution']['by_status']:
+            st.markdown("**Docs by Status**")
+            st.bar_chart(docs_report['documentation_distribution']['by_status'])
+
+        # Compliance status (mobile-first: 2 columns)
+        st.markdown("**Compliance Status**")
+        compliance_items = [
+            ("System Architecture", docs_report['compliance_status']['system_architecture']),
+            ("Algorithm Description", docs_report['compliance_status']['algorithm_description']),
+            ("Training Data", docs_report['compliance_status']['training_data']),
+            ("Risk Assessment", docs_report['compliance_status']['risk_assessment'])
+        ]
+
+        col1, col2 = st.columns(2)
+        for i, (label, status) in enumerate(compliance_items):
+            col = col1 if i < 2 else col2
+            with col:
+                status_icon = "✅" if status == "Documented" else "⚠️"
+                st.markdown(f"{status_icon} **{label}**")
+
+        # Recent documents
+        if docs_report['recent_documents']:
+            st.markdown("**Recent Documentation Updates**")
+            for doc in docs_report['recent_documents'][:5]:
+                with st.expander(f"{doc['title']} - {doc['status']}", expanded=False):
+                    st.write(f"**Type:** {doc['type']}")
+                    st.write(f"**Version:** {doc['version']}")
+                    st.write(f"**Last Updated:** {doc['last_updated']}")
+                    st.write(f"**Author:** {doc['author']}")
+                    st.write(f"**Compliance Articles:** {', '.join(doc['compliance_articles'])}")
+
+        # Technical documentation actions (mobile-first: stack vertically)
+        st.markdown("---")
+        if st.button("📊 Generate Report", key="generate_docs_report", use_container_width=True):
+            st.toast("📊 Generating technical documentation report", icon="📊")
+        if st.button("📝 Create Document", key="create_new_document", use_container_width=True):
+            st.toast("📝 Opening document creation interface", icon="📝")
+        if st.button("📋 View All", key="view_all_documents", use_container_width=True):
+            st.toast("📋 Opening document library", icon="📋")
+
+    # Record keeping summary
+    with st.expander("📝 Record Keeping", expanded=False):
+        st.caption("System records and audit trail status")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("System Records", record_summary['total_records'])
+        with col2:
+            st.metric("Audit Trails", record_summary['total_audit_trails'])
+        with col3:
+            st.metric("Retention Compliance", 
+                     f"{record_summary['retention_compliance']['compliance_percentage']:.1f}%")
+
+    # Human oversight section - Enhanced for Article 14 compliance
+    with st.expander("🛡️ Human Oversight (Article 14)", expanded=False):
+        st.caption("EU AI Act Article 14 - Human Oversight")
+
+        # Human oversight status
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Oversight Status", "Active", "✅")
+        with col2:
+            st.metric("Human Reviewers", "Available", "👥")
+
+        # Explain what happens when review is needed
+        st.markdown("""
+        <div style="background: #f0f9ff; border-left: 3px solid #0ea5e9; border-radius: 4px; padding: 0.5rem; margin: 0.75rem 0;">
+            <p style="margin: 0; color: #0c4a6e; font-size: 0.75rem; line-height: 1.4;">
+                <strong>📋 Review Workflow:</strong><br>
+                When flagged → Stored for review → Human decision → Action taken → Logged for audit
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Flag response functionality
+        st.markdown("**🚩 Flag AI Response for Human Review**")
+        if st.button("🚩 Flag Current Response", key="flag_response", use_container_width=True):
+            if 'flagged_responses' not in st.session_state:
+                st.session_state.flagged_responses = []
+
+            # Add current response to flagged list
+            flagged_response = {
+                'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'message': st.session_state.get('last_user_query', 'No current message'),
+                'response': st.session_state.get('last_ai_response', 'No response available'),
+                'reason': 'User flagged for review',
+                'status': 'pending_review'
+            }
+            st.session_state.flagged_responses.append(flagged_response)
+
+            # Log the flagging for audit trail
+            _log_user_interaction(
+                user_id=st.session_state.get('user_id', 'anonymous'),
+                session_id=st.session_state.get('session_id', 'default'),
+                query="FLAGGED_FOR_REVIEW",
+                response=f"Response flagged: {st.session_state.get('last_ai_response', 'N/A')[:100]}",
+                ai_model=st.session_state.get('current_model', 'unknown'),
+                processing_time_ms=0,
+                confidence_score=None
+            )
+
+            st.toast("🚩 Response flagged for human review", icon="🚩")
+            st.rerun(scope="fragment")
+
+        # Display flagged responses with workflow explanation
+        if 'flagged_responses' in st.session_state and st.session_state.flagged_responses:
+            st.warning(f"🚩 {len(st.session_state.flagged_responses)} responses pending review")
+
+            st.markdown("**What Happens Next:**")
+            st.markdown("""
+            <div style="background: #fff7ed; border-left: 3px solid #f59e0b; border-radius: 4px; padding: 0.5rem; margin: 0.5rem 0;">
+                <p style="margin: 0; color: #92400e; font-size: 0.75rem; line-height: 1.4;">
+                    <strong>⚠️ Pending Review:</strong><br>
+                    1. Response is stored in audit trail<br>
+                    2. Human reviewer examines the flagged content<br>
+                    3. Decision made: Approve, Reject, or Request Changes<br>
+                    4. Action logged for compliance records<br>
+                    5. System updated based on review outcome
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            to_remove = set()
+            for i, flagged in enumerate(st.session_state.flagged_responses):
+                timestamp = flagged.get('timestamp', 'Unknown')
+                message = flagged.get('message', 'No message')
+                response = flagged.get('response', 'No response available')
+                reason = flagged.get('reason', 'User flagged for review')
+                status = flagged.get('status', 'pending_review')
+
+                status_emoji = "⏳" if status == 'pending_review' else "✅" if status == 'approved' else "❌"
+
+                with st.expander(f"{status_emoji} Flagged #{i+1} - {timestamp}", expanded=False):
+                    st.markdown(f"**Status:** {status.replace('_', ' ').title()}")
+                    st.markdown(f"**Original Query:** {message[:200]}...")
+                    st.markdown(f"**AI Response:** {response[:200]}...")
+                    st.markdown(f"**Reason:** {reason}")
+
+                    # Mobile-first: stack buttons vertically
+                    if status == 'pending_review':
+                        if st.button("✅ Approve", key=f"approve_{i}", use_container_width=True):
+                            flagged['status'] = 'approved'
+                            flagged['reviewed_at'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            flagged['reviewer'] = 'human_reviewer'
+
+                            # Log approval
+                            _log_user_interaction(
+                                user_id=st.session_state.get('user_id', 'anonymous'),
+                                session_id=st.session_state.get('session_id', 'default'),
+                                query="HUMAN_REVIEW_APPROVED",
+                                response=f"Response approved: {response[:100]}",
+                                ai_model=st.session_state.get('current_model', 'unknown'),
+                                processing_time_ms=0,
+                                confidence_score=None
+                            )
+
+                            st.toast("✅ Response approved by human reviewer", icon="✅")
+                            st.rerun(scope="fragment")
+
+                        if st.button("❌ Reject", key=f"reject_{i}", use_container_width=True):
+                            flagged['status'] = 'rejected'
+                            flagged['reviewed_at'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                            flagged['reviewer'] = 'human_reviewer'
+
+                            # Log rejection
+                            _log_user_interaction(
+                                user_id=st.session_state.get('user_id', 'anonymous'),
+                                session_id=st.session_state.get('session_id', 'default'),
+                                query="HUMAN_REVIEW_REJECTED",
+                                response=f"Response rejected: {response[:100]}",
+                                ai_model=st.session_state.get('current_model', 'unknown'),
+                                processing_time_ms=0,
+                                confidence_score=None
+                            )
+
+                            st.toast("❌ Response rejected - will be removed from system", icon="❌")
+                            st.rerun(scope="fragment")
+
+                        if st.button("📝 Review Details", key=f"review_{i}", use_container_width=True):
+                            st.toast("📝 Opening detailed review interface", icon="📝")
+                    else:
+                        st.info(f"**Reviewed:** {flagged.get('reviewed_at', 'Unknown')} by {flagged.get('reviewer', 'Unknown')}")
+                        if st.button("🗑️ Remove", key=f"remove_{i}", use_container_width=True):
+                            to_remove.add(i)
+
+            # Filter after the loop rather than popping from the list being iterated
+            if to_remove:
+                st.session_state.flagged_responses = [
+                    f for j, f in enumerate(st.session_state.flagged_responses) if j not in to_remove
+                ]
+                st.toast("🗑️ Review record removed", icon="🗑️")
+                st.rerun(scope="fragment")
+        else:
+            st.success("✅ No responses currently flagged for review")
+
+        # Offline re-scoring of flagged responses (Batch API: half cost, no chat latency)
+        if st.button("🔁 Reprocess Flagged Responses", key="reprocess_flagged", use_container_width=True):
+            pending = [
+                f for f in st.session_state.get('flagged_responses', [])
+                if f.get('status', 'pending_review') == 'pending_review'
+            ]
+            openai_key = st.session_state.get('openai_api_key', '')
+            if not pending:
+                st.toast("No pending flagged responses to reprocess", icon="ℹ️")
+            elif not openai_key:
+                st.toast("Batch reprocessing requires an OpenAI API key", icon="🔑")
+            else:
+                from services.batch_jobs import submit_batch
+                prompts = [
+                    "A reviewer flagged this answer. Check it against the resume context "
+                    "and return a corrected answer, listing any unsupported claims.\n\n"
+                    f"Question: {f.get('message', '')}\n\nAnswer: {f.get('response', '')}"
+                    for f in pending
+                ]
+                try:
+                    job_id = submit_batch(
+                        prompts,
+                        OPENAI_BATCH_MODEL,
+                        openai_key,
+                        context=ResumeService.get_job_match_context(),
+                        user_id=st.session_state.get('user_id', 'anonymous')
+                    )
+                    st.session_state.setdefault('batch_job_ids', []).append(job_id)
+                    st.toast(f"🔁 Queued {len(prompts)} responses as one batch job", icon="🔁")
+                except Exception as e:
+                    st.toast(f"Batch submission failed: {e}", icon="⚠️")
+
+        if st.session_state.get('batch_job_ids'):
+            from services.batch_jobs import batch_jobs
+            for job_id in st.session_state.batch_job_ids:
+                st.caption(f"Batch `{job_id[:18]}…`: {batch_jobs.get_job_status(job_id) or 'unknown'}")
+
+        # Human override capabilities (mobile-first: stack vertically)
+        st.markdown("---")
+        st.markdown("**🎛️ Human Override**")
+        if st.button("🛑 Emergency Stop", key="emergency_stop", use_container_width=True):
+            st.session_state.emergency_stop = True
+            st.toast("🛑 AI system stopped by human operator", icon="🛑")
+        if st.button("🔄 Reset System", key="reset_system", use_container_width=True):
+            st.session_state.flagged_responses = []
+            st.session_state.emergency_stop = False
+            st.toast("🔄 System reset by human operator", icon="🔄")
+            st.rerun(scope="fragment")
+
+    # Advanced compliance actions (mobile-first: stack vertically)
+    st.markdown("---")
+    st.markdown("**Actions**")
+    if st.button("📊 Generate Report", key="generate_report", use_container_width=True):
+        st.toast("📊 Generating compliance report", icon="📊")
+    if st.button("🔍 Start Audit", key="start_audit", use_container_width=True):
+        st.toast("🔍 Starting compliance audit", icon="🔍")
+    if st.button("🔄 Refresh All", key="refresh_all", use_container_width=True):
+        _clear_dashboard_cache()
+        st.toast("🔄 All systems refreshed", icon="🔄")
+        st.rerun(scope="fragment")
+
+# Static sidebar help text, built once per process rather than per rerun
+_QUICK_START_MD = """
+**🚀 Getting Started:**
+1. Choose your AI provider above
+2. Ask questions about Michael's experience
+3. Try quick actions in the main interface
+
+**💬 Sample Questions:**
+- "What are their strongest technical skills?"
+- "How many years of Python experience?"
+- "Have they worked with AI/ML technologies?"
+- "What industries have they worked in?"
+
+**🏢 Enterprise Solutions:**
+- Contact [Michael](https://www.one-front.com/en/contact) for custom AI solutions
+"""
+
+_QUICK_TIPS_MD = """
+**☁️ Cloud AI:**
+- Uses **Production (OpenRouter)** for all chat responses
+- Requires a free OpenRouter API key in the sidebar
+
+**🔧 Troubleshooting:**
+- If you hit rate limits, get a free OpenRouter key
+- Check the compliance dashboard for system status
+"""
 
 def render_sidebar():
     """Render the sidebar with configuration options"""
     with st.sidebar:
-        # Add custom CSS for sidebar styling
-        st.markdown("""
-        <style>
-        .sidebar .stExpander {
-            margin-bottom: 0.5rem;
-        }
-        .sidebar .stExpander > div {
-            border-radius: 8px;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
         # ===== COMPLIANCE & TRANSPARENCY SECTION =====
         with st.expander("🛡️ Compliance & Transparency", expanded=False):
             st.caption("EU AI Act compliance and transparency information")
@@ -244,676 +1235,7 @@ def render_sidebar():
             
             # AI Act Compliance: Advanced Dashboard
             with st.expander("📊 Compliance Dashboard", expanded=False):
-                # Get real compliance data from mcp-ai-act reports
-                mcp_report = mcp_ai_act_reader.get_latest_report()
-                mcp_metadata = mcp_ai_act_reader.get_report_metadata()
-                
-                # Load system data
-                risk_summary = risk_manager.get_risk_summary()
-                governance_status = data_governor.get_governance_compliance_status()
-                record_summary = record_keeper.get_compliance_summary()
-                monitoring_data = compliance_monitor.get_compliance_dashboard_data()
-                audit_summary = audit_procedures.get_audit_summary()
-                performance_data = performance_analytics.get_dashboard_metrics()
-                assessment_summary = conformity_assessor.get_assessment_summary()
-                certification_readiness = certification_preparer.get_certification_readiness()
-                validation_status = compliance_validator.get_compliance_validation_status()
-                
-                # ===== SECTION 1: CURRENT STATUS (SHOW FIRST) =====
-                st.markdown("**✅ Current Compliance Status**")
-                
-                # Show current status from system
-                col1, col2 = st.columns(2)
-                with col1:
-                    # Get current compliance score from validation
-                    if 'overall_score' in validation_status and validation_status['overall_score']:
-                        current_score = validation_status['overall_score'] * 100
-                    elif mcp_report:
-                        current_score = mcp_ai_act_reader.get_compliance_score() * 100
-                    else:
-                        current_score = None
-                    
-                    if current_score:
-                        st.metric("Compliance Score", f"{current_score:.1f}%", 
-                                 delta=f"{current_score - 33:.1f}%" if current_score > 33 else None)
-                    else:
-                        st.metric("Compliance Score", "Calculating...")
-                    
-                    st.metric("Certification Ready", 
-                             "✅ Yes" if validation_status.get('certification_ready', False) else "⏳ In Progress")
-                
-                with col2:
-                    st.metric("Migration Status", "✅ Complete", "100%")
-                    st.metric("Systems Operational", "9/9", "All Active")
-                
-                # System operational status
-                st.markdown("**System Status**")
-                status_items = [
-                    ("Risk Management", risk_summary.get('status', 'Active')),
-                    ("Data Governance", governance_status.get('status', 'Active')),
-                    ("Record Keeping", record_summary.get('status', 'Active')),
-                    ("Monitoring", monitoring_data.get('monitoring_status', 'Active')),
-                    ("Audit Procedures", audit_summary.get('status', 'Active')),
-                    ("Validation", validation_status.get('overall_status', 'Active'))
-                ]
-                
-                col1, col2 = st.columns(2)
-                for i, (name, status) in enumerate(status_items):
-                    col = col1 if i < 3 else col2
-                    with col:
-                        status_icon = "✅" if status in ["Active", "Operational", "Complete", "Functional"] else "⚠️"
-                        st.markdown(f"{status_icon} **{name}**")
-                
-                st.markdown("---")
-                
-                # ===== SECTION 2: LAST REPORT (MCP AI ACT ASSESSMENT) =====
-                st.markdown("**📋 Last Compliance Assessment Report**")
-                
-                if mcp_report:
-                    # Show report summary first
-                    risk_level = mcp_ai_act_reader.get_risk_level()
-                    risk_emoji = "🔴" if "high" in risk_level.lower() else "🟡" if "medium" in risk_level.lower() else "🟢"
-                    compliance_score = mcp_ai_act_reader.get_compliance_score()
-                    articles = mcp_ai_act_reader.get_applicable_articles()
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Report Risk Level", f"{risk_emoji} {risk_level.replace('_', ' ').title()}")
-                        st.metric("Report Score", f"{compliance_score * 100:.1f}%")
-                    with col2:
-                        st.metric("Applicable Articles", len(articles))
-                        if mcp_metadata.get("available"):
-                            report_date = mcp_metadata.get('analysis_timestamp', 'Unknown')
-                            if report_date != 'Unknown':
-                                try:
-                                    from datetime import datetime
-                                    dt = datetime.fromisoformat(report_date.replace('Z', '+00:00'))
-                                    st.metric("Report Date", dt.strftime("%Y-%m-%d"))
-                                except:
-                                    st.metric("Report Date", "Recent")
-                            else:
-                                st.metric("Report Date", "Unknown")
-                    
-                    st.caption(f"📅 Session: {mcp_metadata.get('session_id', 'Unknown')}")
-                else:
-                    st.warning("⚠️ No MCP AI Act compliance report found.")
-                    st.caption("Run a compliance assessment using the MCP AI Act tool to see assessment data.")
-                
-                with st.expander("📋 Full Assessment Details", expanded=False):
-                    st.caption("Detailed assessment information from MCP AI Act tool")
-                    
-                    if mcp_report:
-                        # Risk breakdown
-                        risk_breakdown = mcp_ai_act_reader.get_risk_breakdown()
-                        if risk_breakdown:
-                            st.markdown("**Risk Breakdown**")
-                            for risk_type, percentage in risk_breakdown.items():
-                                st.metric(risk_type.replace('_', ' ').title(), f"{percentage}%")
-                        
-                        # Applicable articles
-                        applicable_articles = mcp_ai_act_reader.get_applicable_articles()
-                        if applicable_articles:
-                            st.markdown("**📋 Applicable Articles**")
-                            for article in applicable_articles:
-                                st.markdown(f"✅ {article}")
-                        
-                        # Compliance categories
-                        compliance_categories = mcp_ai_act_reader.get_compliance_categories()
-                        if compliance_categories:
-                            st.markdown("**📊 Compliance Categories**")
-                            for cat_name, cat_data in compliance_categories.items():
-                                if isinstance(cat_data, dict) and cat_data.get("applicable"):
-                                    cat_display = cat_name.replace('_', ' ').title()
-                                    st.markdown(f"✅ **{cat_display}**")
-                                    if cat_data.get("requirements"):
-                                        for req in cat_data["requirements"][:2]:
-                                            st.caption(f"• {req}")
-                        
-                        # Recommendations
-                        recommendations = mcp_ai_act_reader.get_recommendations()
-                        if recommendations:
-                            st.markdown("**💡 Recommendations**")
-                            for i, rec in enumerate(recommendations[:5], 1):
-                                st.markdown(f"{i}. {rec}")
-                            if len(recommendations) > 5:
-                                st.caption(f"... +{len(recommendations) - 5} more")
-                
-                st.markdown("---")
-                
-                # ===== SECTION 3: HOW AWP MADE IT GOOD =====
-                st.markdown("**🔄 How AWP Made It Good**")
-                
-                st.markdown("""
-                <div style="background: #e0e7ff; border-left: 3px solid #6366f1; border-radius: 4px; padding: 0.5rem; margin-bottom: 0.75rem;">
-                    <p style="margin: 0; color: #312e81; font-size: 0.75rem; line-height: 1.4;">
-                        <strong>🤖 AWP Controlled Development</strong><br>
-                        All compliance fixes were systematically implemented through AWP methodology.
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Show improvement metrics
-                if mcp_report:
-                    baseline_score = mcp_ai_act_reader.get_compliance_score() * 100
-                    current_score = validation_status.get('overall_score', 0) * 100 if validation_status.get('overall_score') else baseline_score
-                    improvement = current_score - baseline_score if current_score > baseline_score else 0
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Before (Report)", f"{baseline_score:.1f}%")
-                        st.metric("Phases Completed", "5/5")
-                    with col2:
-                        st.metric("After (Current)", f"{current_score:.1f}%", delta=f"+{improvement:.1f}%")
-                        st.metric("Systems Implemented", "9")
-                else:
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Before", "33%")
-                        st.metric("Phases", "5/5")
-                    with col2:
-                        st.metric("After", "100%", delta="+67%")
-                        st.metric("Systems", "9")
-                
-                with st.expander("📋 AWP Migration Details", expanded=False):
-                    st.caption("Complete migration plan and implementation details")
-                    
-                    # AWP Phases
-                    st.markdown("**Migration Phases**")
-                    phases = [
-                        ("P1", "Immediate Compliance", "AI transparency, human oversight"),
-                        ("P2", "Core Implementation", "Risk mgmt, data governance, docs"),
-                        ("P3", "Advanced Compliance", "Monitoring, audit, analytics"),
-                        ("P4", "Certification", "Documentation, validation"),
-                        ("P5", "Maintenance", "Continuous monitoring")
-                    ]
-                    
-                    for phase_num, phase_name, phase_desc in phases:
-                        st.markdown(f"**{phase_num}:** {phase_name} - {phase_desc}")
-                    
-                    # AWP Implementation Details
-                    st.markdown("**🛠️ Implemented Systems**")
-                    systems = [
-                        "✅ Risk Management", "✅ Data Governance", "✅ Technical Docs",
-                        "✅ Compliance Monitoring", "✅ Audit Procedures", "✅ Performance Analytics",
-                        "✅ Conformity Assessment", "✅ Certification Prep", "✅ Validation"
-                    ]
-                    
-                    for system in systems:
-                        st.markdown(system)
-                    
-                    st.markdown("**Key Achievements:**")
-                    achievements = [
-                        "🎯 8 critical requirements addressed",
-                        "📊 Real-time dashboard with MCP AI Act integration",
-                        "📝 Complete technical documentation",
-                        "🛡️ Comprehensive human oversight",
-                        "📈 Automated compliance monitoring",
-                        "✅ Ready for EU AI Act certification"
-                    ]
-                    
-                    for achievement in achievements:
-                        st.markdown(f"• {achievement}")
-                    
-                    st.caption("📄 See `agentic-sdlc/PROJECT_COMPLETION_SUMMARY.md` for complete details")
-                
-                st.markdown("---")
-                
-                # ===== SECTION 5: SYSTEM STATUS & MONITORING =====
-                st.markdown("**🔄 System Status**")
-                
-                # Monitoring section (mobile-first: 2 columns)
-                with st.expander("📈 Monitoring & Alerts", expanded=False):
-                    st.caption("Real-time system monitoring")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Active Alerts", monitoring_data['active_alerts'])
-                        st.metric("Status", monitoring_data['monitoring_status'])
-                    with col2:
-                        st.metric("Critical Alerts", monitoring_data['critical_alerts'])
-                    
-                    if monitoring_data['metrics_summary']:
-                        st.markdown("**Recent Metrics**")
-                        for metric_type, stats in monitoring_data['metrics_summary'].items():
-                            if isinstance(stats, dict) and 'latest' in stats:
-                                st.metric(metric_type.replace('_', ' ').title(), 
-                                         f"{stats['latest']:.2f}")
-                
-                # Performance analytics
-                with st.expander("📊 Performance Analytics", expanded=False):
-                    st.caption("System performance metrics and KPIs")
-                    if 'kpis' in performance_data:
-                        st.markdown("**Key Performance Indicators**")
-                        for category, kpi in performance_data['kpis'].items():
-                            st.metric(
-                                category.replace('_', ' ').title(),
-                                f"{kpi['current_value']:.2f}",
-                                delta=f"{kpi['trend']}"
-                            )
-                    else:
-                        st.write("No performance data available")
-                
-                # Audit procedures
-                with st.expander("🔍 Audit Procedures", expanded=False):
-                    st.caption("Compliance audit status and history")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Total Audits", audit_summary['total_audits'])
-                    with col2:
-                        st.metric("Completed", audit_summary['completed_audits'])
-                    
-                    if audit_summary['latest_audit']:
-                        latest = audit_summary['latest_audit']
-                        st.markdown("**Latest Audit**")
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.metric("Score", f"{latest['score']:.1f}" if latest['score'] else "N/A")
-                        with col2:
-                            st.metric("Result", latest['result'] or "Pending")
-                
-                # Record keeping
-                with st.expander("📝 Record Keeping", expanded=False):
-                    st.caption("System records and audit trail status")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("System Records", record_summary['total_records'])
-                    with col2:
-                        st.metric("Audit Trails", record_summary['total_audit_trails'])
-                    with col3:
-                        st.metric("Retention Compliance", 
-                                 f"{record_summary['retention_compliance']['compliance_percentage']:.1f}%")
-                
-                st.markdown("---")
-                
-                # ===== SECTION 6: CERTIFICATION & VALIDATION =====
-                st.markdown("**✅ Certification**")
-                
-                # Conformity assessment (mobile-first: single column metrics)
-                with st.expander("✅ Conformity Assessment", expanded=False):
-                    st.caption("EU AI Act conformity assessment status")
-                    st.metric("Total Assessments", assessment_summary['total_assessments'])
-                    st.metric("Completed", assessment_summary['completed_assessments'])
-                    
-                    if assessment_summary['latest_assessment']:
-                        latest = assessment_summary['latest_assessment']
-                        st.markdown("**Latest Assessment**")
-                        st.metric("Score", f"{latest['score']:.1f}" if latest['score'] else "N/A")
-                        st.metric("Certification Ready", "Yes" if latest['certification_ready'] else "No")
-                
-                # Certification preparation (mobile-first: single column)
-                with st.expander("📋 Certification Preparation", expanded=False):
-                    st.caption("Certification readiness and document status")
-                    st.metric("Readiness", f"{certification_readiness['readiness_percentage']:.1f}%")
-                    st.metric("Ready for Submission", "Yes" if certification_readiness['ready_for_submission'] else "No")
-                    st.metric("Approved Docs", f"{certification_readiness['approved_documents']}/{certification_readiness['total_required_documents']}")
-                
-                # Compliance validation (mobile-first: single column)
-                with st.expander("✔️ Compliance Validation", expanded=False):
-                    st.caption("Overall compliance validation status")
-                    if 'overall_status' in validation_status:
-                        st.markdown("**Validation Status**")
-                        st.metric("Status", validation_status['overall_status'].replace('_', ' ').title())
-                        st.metric("Score", f"{validation_status['overall_score']:.1f}" if validation_status['overall_score'] else "N/A")
-                        st.metric("Certification Ready", "Yes" if validation_status['certification_ready'] else "No")
-                    else:
-                        st.write("No validation data available")
-                
-                st.markdown("---")
-                
-                # ===== SECTION 7: DETAILED COMPLIANCE REPORTS =====
-                st.markdown("**📋 Detailed Reports**")
-                
-                # Risk management summary - Enhanced for Article 9 compliance
-                with st.expander("⚠️ Risk Management (Article 9)", expanded=False):
-                    st.caption("EU AI Act Article 9 - Risk Management System")
-                    
-                    # Get comprehensive risk report
-                    risk_report = risk_manager.get_comprehensive_risk_report()
-                    
-                    # Risk metrics (mobile-first: 2 columns)
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Total Risks", risk_report['risk_metrics']['total_risks'])
-                        st.metric("Critical", risk_report['risk_metrics']['critical_risks'], 
-                                 delta="High" if risk_report['risk_metrics']['critical_risks'] > 0 else None)
-                    with col2:
-                        st.metric("Mitigated", risk_report['risk_metrics']['mitigated_risks'])
-                        st.metric("Effectiveness", f"{risk_report['risk_management_effectiveness']['effectiveness_score']:.1f}%",
-                                 delta=risk_report['risk_management_effectiveness']['status'])
-                    
-                    # Risk distribution charts (mobile-first: stack vertically)
-                    if risk_report['risk_distribution']['by_level']:
-                        st.markdown("**Risk by Level**")
-                        st.bar_chart(risk_report['risk_distribution']['by_level'])
-                    
-                    if risk_report['risk_distribution']['by_category']:
-                        st.markdown("**Risk by Category**")
-                        st.bar_chart(risk_report['risk_distribution']['by_category'])
-                    
-                    # Compliance status (mobile-first: 2 columns)
-                    st.markdown("**Compliance Status**")
-                    compliance_items = [
-                        ("System", risk_report['compliance_status']['risk_management_system']),
-                        ("Procedures", risk_report['compliance_status']['assessment_procedures']),
-                        ("Strategies", risk_report['compliance_status']['mitigation_strategies']),
-                        ("Monitoring", risk_report['compliance_status']['monitoring_systems']),
-                        ("Documentation", risk_report['compliance_status']['documentation'])
-                    ]
-                    
-                    col1, col2 = st.columns(2)
-                    for i, (label, status) in enumerate(compliance_items):
-                        col = col1 if i < 3 else col2
-                        with col:
-                            status_icon = "✅" if status in ["Operational", "Implemented", "Active", "Functional", "Complete"] else "⚠️"
-                            st.markdown(f"{status_icon} **{label}**")
-                    
-                    # Next assessment due
-                    st.markdown(f"**Next Risk Assessment Due:** {risk_report['next_assessment_due']}")
-                    
-                    # Risk management actions (mobile-first: stack vertically)
-                    st.markdown("---")
-                    if st.button("📊 Generate Report", key="generate_risk_report", use_container_width=True):
-                        st.toast("📊 Generating comprehensive risk report", icon="📊")
-                    if st.button("🔍 Start Assessment", key="start_risk_assessment", use_container_width=True):
-                        st.toast("🔍 Starting new risk assessment", icon="🔍")
-                    if st.button("📋 View Details", key="view_risk_details", use_container_width=True):
-                        st.toast("📋 Opening detailed risk view", icon="📋")
-                
-                # Data governance summary - Enhanced for Article 10 compliance
-                with st.expander("📊 Data Governance (Article 10)", expanded=False):
-                    st.caption("EU AI Act Article 10 - Data Governance and Quality Management")
-                    
-                    # Get comprehensive data governance report
-                    governance_report = data_governor.get_comprehensive_data_governance_report()
-                    
-                    # Governance metrics (mobile-first: 2 columns)
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Assessments", governance_report['governance_metrics']['total_assessments'])
-                        st.metric("Quality Score", f"{governance_report['governance_metrics']['overall_quality_score']:.1f}%")
-                    with col2:
-                        st.metric("Records", governance_report['governance_metrics']['total_processing_records'])
-                        st.metric("Effectiveness", f"{governance_report['data_governance_effectiveness']['effectiveness_score']:.1f}%",
-                                 delta=governance_report['data_governance_effectiveness']['status'])
-                    
-                    # Quality metrics breakdown (mobile-first: 2 columns)
-                    st.markdown("**Quality Metrics**")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Completeness", f"{governance_report['quality_metrics']['average_completeness']:.1f}%")
-                        st.metric("Accuracy", f"{governance_report['quality_metrics']['average_accuracy']:.1f}%")
-                    with col2:
-                        st.metric("Consistency", f"{governance_report['quality_metrics']['average_consistency']:.1f}%")
-                        st.metric("Timeliness", f"{governance_report['quality_metrics']['average_timeliness']:.1f}%")
-                    
-                    # Data distribution charts (mobile-first: stack vertically)
-                    if governance_report['data_distribution']['by_quality_level']:
-                        st.markdown("**Quality Distribution**")
-                        st.bar_chart(governance_report['data_distribution']['by_quality_level'])
-                    
-                    if governance_report['data_distribution']['by_category']:
-                        st.markdown("**Category Distribution**")
-                        st.bar_chart(governance_report['data_distribution']['by_category'])
-                    
-                    # Compliance status (mobile-first: 2 columns)
-                    st.markdown("**Compliance Status**")
-                    compliance_items = [
-                        ("Quality Mgmt", governance_report['compliance_status']['data_quality_management']),
-                        ("Processing", governance_report['compliance_status']['processing_records']),
-                        ("Assessments", governance_report['compliance_status']['quality_assessments']),
-                        ("Remediation", governance_report['compliance_status']['remediation_procedures']),
-                        ("Documentation", governance_report['compliance_status']['documentation'])
-                    ]
-                    
-                    col1, col2 = st.columns(2)
-                    for i, (label, status) in enumerate(compliance_items):
-                        col = col1 if i < 3 else col2
-                        with col:
-                            status_icon = "✅" if status in ["Operational", "Maintained", "Regular", "Active", "Complete"] else "⚠️"
-                            st.markdown(f"{status_icon} **{label}**")
-                    
-                    # Next assessment due
-                    st.markdown(f"**Next Quality Assessment Due:** {governance_report['next_assessment_due']}")
-                    
-                    # Data governance actions (mobile-first: stack vertically)
-                    st.markdown("---")
-                    if st.button("📊 Generate Report", key="generate_governance_report", use_container_width=True):
-                        st.toast("📊 Generating comprehensive data governance report", icon="📊")
-                    if st.button("🔍 Start Assessment", key="start_quality_assessment", use_container_width=True):
-                        st.toast("🔍 Starting new data quality assessment", icon="🔍")
-                    if st.button("📋 View Records", key="view_processing_records", use_container_width=True):
-                        st.toast("📋 Opening processing records view", icon="📋")
-                
-                # Technical documentation summary - Enhanced for Article 11 compliance
-                with st.expander("📚 Technical Documentation (Article 11)", expanded=False):
-                    st.caption("EU AI Act Article 11 - Technical Documentation")
-                    
-                    # Get comprehensive technical documentation report
-                    docs_report = tech_docs.get_comprehensive_documentation_report()
-                    
-                    # Documentation metrics (mobile-first: 2 columns)
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Total Docs", docs_report['documentation_metrics']['total_documents'])
-                        st.metric("Approved", docs_report['documentation_metrics']['approved_documents'])
-                    with col2:
-                        st.metric("Published", docs_report['documentation_metrics']['published_documents'])
-                        st.metric("Effectiveness", f"{docs_report['documentation_effectiveness']['effectiveness_score']:.1f}%",
-                                 delta=docs_report['documentation_effectiveness']['status'])
-                    
-                    # Documentation distribution charts (mobile-first: stack vertically)
-                    if docs_report['documentation_distribution']['by_type']:
-                        st.markdown("**Docs by Type**")
-                        st.bar_chart(docs_report['documentation_distribution']['by_type'])
-                    
-                    if docs_report['documentation_distribution']['by_status']:
-                        st.markdown("**Docs by Status**")
-                        st.bar_chart(docs_report['documentation_distribution']['by_status'])
-                    
-                    # Compliance status (mobile-first: 2 columns)
-                    st.markdown("**Compliance Status**")
-                    compliance_items = [
-                        ("System Architecture", docs_report['compliance_status']['system_architecture']),
-                        ("Algorithm Description", docs_report['compliance_status']['algorithm_description']),
-                        ("Training Data", docs_report['compliance_status']['training_data']),
-                        ("Risk Assessment", docs_report['compliance_status']['risk_assessment'])
-                    ]
-                    
-                    col1, col2 = st.columns(2)
-                    for i, (label, status) in enumerate(compliance_items):
-                        col = col1 if i < 2 else col2
-                        with col:
-                            status_icon = "✅" if status == "Documented" else "⚠️"
-                            st.markdown(f"{status_icon} **{label}**")
-                    
-                    # Recent documents
-                    if docs_report['recent_documents']:
-                        st.markdown("**Recent Documentation Updates**")
-                        for doc in docs_report['recent_documents'][:5]:
-                            with st.expander(f"{doc['title']} - {doc['status']}", expanded=False):
-                                st.write(f"**Type:** {doc['type']}")
-                                st.write(f"**Version:** {doc['version']}")
-                                st.write(f"**Last Updated:** {doc['last_updated']}")
-                                st.write(f"**Author:** {doc['author']}")
-                                st.write(f"**Compliance Articles:** {', '.join(doc['compliance_articles'])}")
-                    
-                    # Technical documentation actions (mobile-first: stack vertically)
-                    st.markdown("---")
-                    if st.button("📊 Generate Report", key="generate_docs_report", use_container_width=True):
-                        st.toast("📊 Generating technical documentation report", icon="📊")
-                    if st.button("📝 Create Document", key="create_new_document", use_container_width=True):
-                        st.toast("📝 Opening document creation interface", icon="📝")
-                    if st.button("📋 View All", key="view_all_documents", use_container_width=True):
-                        st.toast("📋 Opening document library", icon="📋")
-                
-                # Record keeping summary
-                with st.expander("📝 Record Keeping", expanded=False):
-                    st.caption("System records and audit trail status")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("System Records", record_summary['total_records'])
-                    with col2:
-                        st.metric("Audit Trails", record_summary['total_audit_trails'])
-                    with col3:
-                        st.metric("Retention Compliance", 
-                                 f"{record_summary['retention_compliance']['compliance_percentage']:.1f}%")
-                
-                # Human oversight section - Enhanced for Article 14 compliance
-                with st.expander("🛡️ Human Oversight (Article 14)", expanded=False):
-                    st.caption("EU AI Act Article 14 - Human Oversight")
-                    
-                    # Human oversight status
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Oversight Status", "Active", "✅")
-                    with col2:
-                        st.metric("Human Reviewers", "Available", "👥")
-                    
-                    # Explain what happens when review is needed
-                    st.markdown("""
-                    <div style="background: #f0f9ff; border-left: 3px solid #0ea5e9; border-radius: 4px; padding: 0.5rem; margin: 0.75rem 0;">
-                        <p style="margin: 0; color: #0c4a6e; font-size: 0.75rem; line-height: 1.4;">
-                            <strong>📋 Review Workflow:</strong><br>
-                            When flagged → Stored for review → Human decision → Action taken → Logged for audit
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Flag response functionality
-                    st.markdown("**🚩 Flag AI Response for Human Review**")
-                    if st.button("🚩 Flag Current Response", key="flag_response", use_container_width=True):
-                        if 'flagged_responses' not in st.session_state:
-                            st.session_state.flagged_responses = []
-                        
-                        # Add current response to flagged list
-                        flagged_response = {
-                            'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            'message': st.session_state.get('current_processing_message', 'No current message'),
-                            'response': st.session_state.get('last_ai_response', 'No response available'),
-                            'reason': 'User flagged for review',
-                            'status': 'pending_review'
-                        }
-                        st.session_state.flagged_responses.append(flagged_response)
-                        
-                        # Log the flagging for audit trail
-                        record_keeper.log_user_interaction(
-                            user_id=st.session_state.get('user_id', 'anonymous'),
-                            session_id=st.session_state.get('session_id', 'default'),
-                            query="FLAGGED_FOR_REVIEW",
-                            response=f"Response flagged: {st.session_state.get('last_ai_response', 'N/A')[:100]}",
-                            ai_model=st.session_state.get('current_model', 'unknown'),
-                            processing_time_ms=0,
-                            confidence_score=None
-                        )
-                        
-                        st.toast("🚩 Response flagged for human review", icon="🚩")
-                        st.rerun()
-                    
-                    # Display flagged responses with workflow explanation
-                    if 'flagged_responses' in st.session_state and st.session_state.flagged_responses:
-                        st.warning(f"🚩 {len(st.session_state.flagged_responses)} responses pending review")
-                        
-                        st.markdown("**What Happens Next:**")
-                        st.markdown("""
-                        <div style="background: #fff7ed; border-left: 3px solid #f59e0b; border-radius: 4px; padding: 0.5rem; margin: 0.5rem 0;">
-                            <p style="margin: 0; color: #92400e; font-size: 0.75rem; line-height: 1.4;">
-                                <strong>⚠️ Pending Review:</strong><br>
-                                1. Response is stored in audit trail<br>
-                                2. Human reviewer examines the flagged content<br>
-                                3. Decision made: Approve, Reject, or Request Changes<br>
-                                4. Action logged for compliance records<br>
-                                5. System updated based on review outcome
-                            </p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        for i, flagged in enumerate(st.session_state.flagged_responses):
-                            timestamp = flagged.get('timestamp', 'Unknown')
-                            message = flagged.get('message', 'No message')
-                            response = flagged.get('response', 'No response available')
-                            reason = flagged.get('reason', 'User flagged for review')
-                            status = flagged.get('status', 'pending_review')
-                            
-                            status_emoji = "⏳" if status == 'pending_review' else "✅" if status == 'approved' else "❌"
-                            
-                            with st.expander(f"{status_emoji} Flagged #{i+1} - {timestamp}", expanded=False):
-                                st.markdown(f"**Status:** {status.replace('_', ' ').title()}")
-                                st.markdown(f"**Original Query:** {message[:200]}...")
-                                st.markdown(f"**AI Response:** {response[:200]}...")
-                                st.markdown(f"**Reason:** {reason}")
-                                
-                                # Mobile-first: stack buttons vertically
-                                if status == 'pending_review':
-                                    if st.button("✅ Approve", key=f"approve_{i}", use_container_width=True):
-                                        flagged['status'] = 'approved'
-                                        flagged['reviewed_at'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                        flagged['reviewer'] = 'human_reviewer'
-                                        
-                                        # Log approval
-                                        record_keeper.log_user_interaction(
-                                            user_id=st.session_state.get('user_id', 'anonymous'),
-                                            session_id=st.session_state.get('session_id', 'default'),
-                                            query="HUMAN_REVIEW_APPROVED",
-                                            response=f"Response approved: {response[:100]}",
-                                            ai_model=st.session_state.get('current_model', 'unknown'),
-                                            processing_time_ms=0,
-                                            confidence_score=None
-                                        )
-                                        
-                                        st.toast("✅ Response approved by human reviewer", icon="✅")
-                                        st.rerun()
-                                    
-                                    if st.button("❌ Reject", key=f"reject_{i}", use_container_width=True):
-                                        flagged['status'] = 'rejected'
-                                        flagged['reviewed_at'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                        flagged['reviewer'] = 'human_reviewer'
-                                        
-                                        # Log rejection
-                                        record_keeper.log_user_interaction(
-                                            user_id=st.session_state.get('user_id', 'anonymous'),
-                                            session_id=st.session_state.get('session_id', 'default'),
-                                            query="HUMAN_REVIEW_REJECTED",
-                                            response=f"Response rejected: {response[:100]}",
-                                            ai_model=st.session_state.get('current_model', 'unknown'),
-                                            processing_time_ms=0,
-                                            confidence_score=None
-                                        )
-                                        
-                                        st.toast("❌ Response rejected - will be removed from system", icon="❌")
-                                        st.rerun()
-                                    
-                                    if st.button("📝 Review Details", key=f"review_{i}", use_container_width=True):
-                                        st.toast("📝 Opening detailed review interface", icon="📝")
-                                else:
-                                    st.info(f"**Reviewed:** {flagged.get('reviewed_at', 'Unknown')} by {flagged.get('reviewer', 'Unknown')}")
-                                    if st.button("🗑️ Remove", key=f"remove_{i}", use_container_width=True):
-                                        st.session_state.flagged_responses.pop(i)
-                                        st.toast("🗑️ Review record removed", icon="🗑️")
-                                        st.rerun()
-                    else:
-                        st.success("✅ No responses currently flagged for review")
-                    
-                    # Human override capabilities (mobile-first: stack vertically)
-                    st.markdown("---")
-                    st.markdown("**🎛️ Human Override**")
-                    if st.button("🛑 Emergency Stop", key="emergency_stop", use_container_width=True):
-                        st.session_state.emergency_stop = True
-                        st.toast("🛑 AI system stopped by human operator", icon="🛑")
-                    if st.button("🔄 Reset System", key="reset_system", use_container_width=True):
-                        st.session_state.flagged_responses = []
-                        st.session_state.emergency_stop = False
-                        st.toast("🔄 System reset by human operator", icon="🔄")
-                        st.rerun()
-                
-                # Advanced compliance actions (mobile-first: stack vertically)
-                st.markdown("---")
-                st.markdown("**Actions**")
-                if st.button("📊 Generate Report", key="generate_report", use_container_width=True):
-                    st.toast("📊 Generating compliance report", icon="📊")
-                if st.button("🔍 Start Audit", key="start_audit", use_container_width=True):
-                    st.toast("🔍 Starting compliance audit", icon="🔍")
-                if st.button("🔄 Refresh All", key="refresh_all", use_container_width=True):
-                    st.toast("🔄 All systems refreshed", icon="🔄")
-                    st.rerun()
+                render_compliance_dashboard()
         
         # ===== AI SYSTEM INFORMATION & USER RIGHTS SECTION =====
         with st.expander("🤖 AI System Information & User Rights", expanded=False):
@@ -1001,7 +1323,7 @@ def render_sidebar():
                 </div>
                 """, unsafe_allow_html=True)
                 if st.button("Start Application", type="primary", use_container_width=True, key="quick_start_main"):
-                    if not st.session_state.get('openrouter_api_key', '').strip():
+                    if not st.session_state.get('has_api_key', False):
                         st.session_state.show_api_key_modal = True
                         st.rerun()
                     else:
@@ -1029,10 +1351,6 @@ def render_sidebar():
             # Production (OpenRouter) only
             st.markdown("**Provider**")
             st.caption("Cloud AI via OpenRouter")
-            st.session_state.current_provider = "openrouter"
-            st.session_state.current_model = st.session_state.get(
-                'current_model', DEFAULT_OPENROUTER_MODEL
-            )
 
             current_provider = st.session_state.get('current_provider', 'openrouter')
             current_model = st.session_state.get('current_model', DEFAULT_OPENROUTER_MODEL)
@@ -1044,26 +1362,24 @@ def render_sidebar():
 
             st.markdown("**API Key Management**")
             st.caption("Manage your OpenRouter API key")
-            if st.session_state.openrouter_api_key:
-                masked_key = st.session_state.openrouter_api_key[:8] + "..." + st.session_state.openrouter_api_key[-4:] if len(st.session_state.openrouter_api_key) > 12 else "***"
-                st.write(f"🔑 API Key: {masked_key}")
+            if st.session_state.get('has_api_key', False):
+                st.write(f"🔑 API Key: {st.session_state.masked_api_key}")
 
-                if st.button("🔄 Change Key", use_container_width=True, key="sidebar_change_key"):
-                    st.session_state.openrouter_api_key = ""
+                if st.button("🗑️ Clear Key", use_container_width=True, key="sidebar_clear_key",
+                             help="Remove this key; enter a new one below to change it"):
+                    SessionManager.set_openrouter_api_key("")
                     st.toast("API key cleared")
                     st.rerun()
-                if st.button("🗑️ Remove Key", use_container_width=True, key="sidebar_remove_key"):
-                    st.session_state.openrouter_api_key = ""
-                    st.toast("API key removed")
-                    st.rerun()
             else:
                 st.write("⚠️ No API key configured")
                 api_key_input = st.text_input("Enter API key", type="password", placeholder="sk-or-...", key="sidebar_openrouter_api_key_input", label_visibility="collapsed")
                 if st.button("➕ Add Key", use_container_width=True, key="sidebar_add_openrouter_api_key"):
-                    if api_key_input:
-                        st.session_state.openrouter_api_key = api_key_input
+                    if LLMProviders.is_valid_openrouter_key(api_key_input):
+                        SessionManager.set_openrouter_api_key(api_key_input)
                         st.toast("OpenRouter API key added!")
                         st.rerun()
+                    elif api_key_input:
+                        st.toast("⚠️ Key format looks wrong — expected sk-or-v1-...")
                     else:
                         st.toast("Please enter an API key")
 
@@ -1071,51 +1387,29 @@ def render_sidebar():
 
             st.markdown("**Model Selection**")
             st.caption("Auto rotates through free models when one is rate-limited")
-            current_model_pick = st.session_state.get('current_model', DEFAULT_OPENROUTER_MODEL)
-            if current_model_pick not in AVAILABLE_OPENROUTER_MODELS:
-                current_model_pick = DEFAULT_OPENROUTER_MODEL
             selected_model = st.selectbox(
                 "Choose a model:",
                 AVAILABLE_OPENROUTER_MODELS,
-                index=AVAILABLE_OPENROUTER_MODELS.index(current_model_pick),
+                index=OPENROUTER_MODEL_INDEX.get(
+                    st.session_state.get('current_model'), DEFAULT_OPENROUTER_MODEL_INDEX
+                ),
                 format_func=lambda m: OPENROUTER_MODEL_LABELS.get(m, m),
                 key="sidebar_openrouter_model_select"
             )
-            st.session_state['current_model'] = selected_model
+            if selected_model != st.session_state.get('current_model'):
+                st.session_state['current_model'] = selected_model
             st.write(f"✅ Selected: {selected_model}")
         
         # ===== HELP & GUIDANCE SECTION =====
         # Help & Tips
         with st.expander("📚 Quick Start Guide", expanded=False):
             st.caption("Get started with the AI Resume system")
-            st.markdown("""
-            **🚀 Getting Started:**
-            1. Choose your AI provider above
-            2. Ask questions about Michael's experience
-            3. Try quick actions in the main interface
-            
-            **💬 Sample Questions:**
-            - "What are their strongest technical skills?"
-            - "How many years of Python experience?"
-            - "Have they worked with AI/ML technologies?"
-            - "What industries have they worked in?"
-            
-            **🏢 Enterprise Solutions:**
-            - Contact [Michael](https://www.one-front.com/en/contact) for custom AI solutions
-            """)
+            st.markdown(_QUICK_START_MD)
         
         # Add a quick tips section
         with st.expander("💡 Quick Tips", expanded=False):
             st.caption("Helpful tips and troubleshooting")
-            st.markdown("""
-            **☁️ Cloud AI:**
-            - Uses **Production (OpenRouter)** for all chat responses
-            - Requires a free OpenRouter API key in the sidebar
-            
-            **🔧 Troubleshooting:**
-            - If you hit rate limits, get a free OpenRouter key
-            - Check the compliance dashboard for system status
-            """)
+            st.markdown(_QUICK_TIPS_MD)
         
         # Quick Actions Panel
         with st.expander("⚡ Quick Actions", expanded=False):
@@ -1123,6 +1417,31 @@ def render_sidebar():
             if st.button("🔄 Clear Chat", key="sidebar_clear_chat", use_container_width=True):
                 SessionManager.clear_chat()
                 st.rerun()
+            if st.button("🚀 Ask All Quick Questions", key="sidebar_run_all_quick", use_container_width=True,
+                         help="Summary, experience and skills answered in a single LLM call"):
+                with st.spinner("MikeGPT is answering all quick questions..."):
+                    run_all_quick_actions()
+                st.rerun()
+
+@st.fragment
+def chat_fragment():
+    """Chat history, input and streaming reply; reruns without the header or sidebar"""
+    # Chat input — answered in this same run, no rerun round-trip
+    if user_input := st.chat_input("💬 Ask MikeGPT here..."):
+        SessionManager.queue_prompt(user_input)
+    # Quick actions and pending questions queue theirs earlier in the run
+    pending_prompt = SessionManager.pop_pending_prompt()
+    
+    # Display chat messages
+    if st.session_state.messages:
+        UIComponents.render_chat_messages(st.session_state.messages)
+    else:
+        UIComponents.render_welcome_message()
+    
+    # Answer the pending prompt below the history it was just added to
+    if pending_prompt:
+        response = UIComponents.render_streaming_response(process_user_message_stream(pending_prompt))
+        SessionManager.add_message("assistant", response)
 
 def main():
     """Main application function"""
@@ -1140,6 +1459,9 @@ def main():
     # Initialize session state
     SessionManager.initialize_session_state()
     
+    # Resolve quick-action contexts in the background so the first click skips retrieval
+    _prefetch_quick_action_contexts()
+    
     # Check API key modal trigger
     SessionManager.check_api_key_modal_trigger()
     
@@ -1166,12 +1488,6 @@ def main():
         SessionManager.quick_start_setup()
         handle_quick_actions(actions)
     
-    # Chat input
-    if user_input := st.chat_input("💬 Ask MikeGPT here..."):
-        SessionManager.add_message("user", user_input)
-        SessionManager.set_processing_state(user_input)
-        st.rerun()
-    
     # Modal Management
     if st.session_state.get('show_api_key_modal', False):
         st.session_state.show_job_analysis_modal = False
@@ -1179,23 +1495,8 @@ def main():
     elif st.session_state.get('show_job_analysis_modal', False):
         UIComponents.render_job_analysis_modal()
     
-    # Display chat messages
-    if st.session_state.messages:
-        UIComponents.render_chat_messages(st.session_state.messages)
-    else:
-        UIComponents.render_welcome_message()
-    
-    # Handle message processing
-    if st.session_state.get('processing_message', False):
-        user_input = st.session_state.current_processing_message
-
-        with st.spinner("MikeGPT is thinking... ⚡ Free LLM tier — responses may take 5–30 seconds"):
-            response = process_user_message(user_input)
-
-        SessionManager.add_message("assistant", response)
-        SessionManager.clear_processing_state()
-
-        st.rerun()
+    # Chat panel reruns on its own when a message is submitted
+    chat_fragment()
     
     # Render sidebar
     render_sidebar()
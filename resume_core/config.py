@@ -3,6 +3,7 @@ Configuration settings for AI Resume application
 """
 
 import os
+from functools import lru_cache
 
 # Production Detection
 def is_production() -> bool:
@@ -32,6 +33,8 @@ def is_production() -> bool:
     return False
 
 # API Keys and Secrets
+# Resolved once per process; call .cache_clear() after rotating a deployment key
+@lru_cache(maxsize=1)
 def get_openrouter_api_key():
     """Get OpenRouter API key from secrets or environment"""
     try:
@@ -40,6 +43,7 @@ def get_openrouter_api_key():
     except Exception:
         return os.getenv("OPENROUTER_API_KEY", "")
 
+@lru_cache(maxsize=1)
 def get_openai_api_key():
     """Get OpenAI API key from environment"""
     return os.getenv("OPENAI_API_KEY", "")
@@ -60,7 +64,11 @@ OPENROUTER_FALLBACK_MODELS = [
     "meta-llama/llama-3.3-70b-instruct:free",
 ]
 DEFAULT_OPENROUTER_MODEL = AUTO_OPENROUTER_MODEL
-AVAILABLE_OPENROUTER_MODELS = [AUTO_OPENROUTER_MODEL, *OPENROUTER_FALLBACK_MODELS]
+# Single source for the model list; resume_core.models reuses this tuple
+AVAILABLE_OPENROUTER_MODELS = (AUTO_OPENROUTER_MODEL, *OPENROUTER_FALLBACK_MODELS)
+# Selectbox positions, computed once instead of list.index() on every rerun
+OPENROUTER_MODEL_INDEX = {model: i for i, model in enumerate(AVAILABLE_OPENROUTER_MODELS)}
+DEFAULT_OPENROUTER_MODEL_INDEX = OPENROUTER_MODEL_INDEX[DEFAULT_OPENROUTER_MODEL]
 OPENROUTER_MODEL_LABELS = {
     AUTO_OPENROUTER_MODEL: "Auto (best available free)",
     "openrouter/free": "OpenRouter Free Router",
@@ -77,6 +85,13 @@ DEPRECATED_OPENROUTER_MODELS = frozenset({
     "microsoft/phi-3-mini-128k-instruct:free",
     "google/gemma-2-9b-it:free",
 })
+# Offline batch jobs (OpenAI Batch API) — half price, results within 24h
+OPENAI_BATCH_MODEL = "gpt-4o-mini"
+# Token budget for prior chat turns sent with each request (oldest turns dropped first)
+HISTORY_TOKEN_BUDGET = 2000
+# Latest chat messages that keep their feedback buttons; older ones render as plain markdown
+CHAT_RENDER_WINDOW = 20
+
 DEFAULT_GIST_ID = "dabf368473d41748e9d6051afb67efcf"
 DEFAULT_SERVER_PATH = "../build/index.js"
 
@@ -88,18 +103,25 @@ CHAT_HEIGHT = "65vh"
 # File Paths
 CV_PDF_FILENAME = "data/CV_Michael_Wybraniec_15_Jun_2025.pdf"
 
+# Quick Actions: button key -> question sent to the LLM
+QUICK_ACTION_QUESTIONS = {
+    "summary": "Give me a full summary of this candidate",
+    "experience": "How many years of experience does this candidate have?",
+    "skills": "What are their strongest technical skills?",
+}
+
 # Quick Questions
 QUICK_QUESTIONS = {
-    "general": [
+    "general": (
         "👤 Summarize Profile",
         "📅 Years Experience", 
         "🛠️ Technical Skills",
         "🎯 Smart Match"
-    ],
-    "detailed": [
+    ),
+    "detailed": (
         "What are their strongest technical skills?",
         "How many years of Python experience?",
         "Have they worked with AI/ML technologies?",
         "What industries have they worked in?"
-    ]
+    )
 } 
\ No newline at end of file
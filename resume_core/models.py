@@ -3,40 +3,53 @@ Data models and types for AI Resume application
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 import datetime
+import time
 
-@dataclass
-class MCPResponse:
+from resume_core.config import AVAILABLE_OPENROUTER_MODELS
+
+@lru_cache(maxsize=4)
+def _timestamp_for_minute(minute_epoch: int) -> str:
+    return datetime.datetime.fromtimestamp(minute_epoch * 60).strftime("%b %d, %I:%M %p")
+
+def chat_timestamp() -> str:
+    """Chat message timestamp; messages in the same minute reuse one formatted string"""
+    return _timestamp_for_minute(int(time.time()) // 60)
+
+class MCPResponse(NamedTuple):
     """Response from MCP server"""
     success: bool
     data: Any
     error: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
     """Chat message structure"""
     role: str  # "user" or "assistant"
     content: str
     timestamp: str
 
+    @classmethod
+    def _create(cls, role: str, content: str) -> 'ChatMessage':
+        return cls(role=role, content=content, timestamp=chat_timestamp())
+
     @classmethod
     def create_user_message(cls, content: str) -> 'ChatMessage':
         """Create a user message with current timestamp"""
-        timestamp = datetime.datetime.now().strftime("%b %d, %I:%M %p")
-        return cls(role="user", content=content, timestamp=timestamp)
+        return cls._create("user", content)
     
     @classmethod
     def create_assistant_message(cls, content: str) -> 'ChatMessage':
         """Create an assistant message with current timestamp"""
-        timestamp = datetime.datetime.now().strftime("%b %d, %I:%M %p")
-        return cls(role="assistant", content=content, timestamp=timestamp)
+        return cls._create("assistant", content)
 
-@dataclass
+@dataclass(slots=True)
 class LLMProvider:
     """LLM Provider configuration"""
     name: str
-    models: List[str]
+    models: Tuple[str, ...]
     requires_api_key: bool
     api_key_env_var: Optional[str] = None
 
@@ -44,26 +57,19 @@ class LLMProvider:
 LLM_PROVIDERS = {
     "openrouter": LLMProvider(
         name="OpenRouter",
-        models=[
-            "auto",
-            "openrouter/free",
-            "google/gemma-4-26b-a4b-it:free",
-            "openai/gpt-oss-20b:free",
-            "deepseek/deepseek-v4-flash:free",
-            "meta-llama/llama-3.2-3b-instruct:free",
-        ],
+        models=AVAILABLE_OPENROUTER_MODELS,
         requires_api_key=True,
         api_key_env_var="OPENROUTER_API_KEY"
     ),
     "openai": LLMProvider(
         name="OpenAI",
-        models=["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo"],
+        models=("gpt-3.5-turbo", "gpt-4", "gpt-4-turbo"),
         requires_api_key=True,
         api_key_env_var="OPENAI_API_KEY"
     ),
     "ollama": LLMProvider(
         name="Ollama (Local)",
-        models=["llama2", "codellama", "mistral"],
+        models=("llama2", "codellama", "mistral"),
         requires_api_key=False
     )
 } 
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Batch Job Processing for Offline LLM Workloads
+
+This module routes non-interactive workloads (re-scoring flagged responses,
+regenerating compliance audit samples) through the OpenAI Batch API instead of
+the interactive chat path. Batch jobs cost half as much and have far higher
+throughput; the latency they trade away is irrelevant offline.
+"""
+
+import json
+import datetime
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+from services.llm_providers import LLMProviders
+from services.record_keeping import record_keeper, RecordType
+
+# Batch statuses after which the job will not change any more
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Consecutive polling errors (revoked key, deleted batch) before a job is given up as failed
+MAX_POLL_FAILURES = 5
+
+class BatchJobManager:
+    """Submits prompt batches and collects their results in the background"""
+
+    def __init__(self, poll_interval_seconds: int = 60):
+        self.poll_interval_seconds = poll_interval_seconds
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _build_batch_file(self, prompts: List[str], model: str, context: str) -> bytes:
+        """Build the JSONL request file, one chat completion per prompt"""
+        system_message = {
+            "role": "system",
+            "content": LLMProviders.create_system_message(context)
+        }
+        lines = []
+        for i, prompt in enumerate(prompts):
+            lines.append(json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [system_message, {"role": "user", "content": prompt}]
+                }
+            }))
+        return "\n".join(lines).encode("utf-8")
+
+    def submit_batch(self, prompts: List[str], model: str, api_key: str,
+                     context: str = "", user_id: Optional[str] = None) -> str:
+        """Upload prompts as one batch job and start polling it; returns the job id"""
+        client = LLMProviders.get_openai_client(api_key)
+        batch_file = client.files.create(
+            file=("batch.jsonl", self._build_batch_file(prompts, model, context)),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        with self._lock:
+            self.jobs[batch.id] = {
+                "status": batch.status,
+                "model": model,
+                "prompts": list(prompts),
+                "user_id": user_id,
+                "submitted_at": datetime.datetime.now().isoformat(),
+                "results": {}
+            }
+
+        poll_thread = threading.Thread(target=self._poll_job, args=(batch.id, api_key))
+        poll_thread.daemon = True
+        poll_thread.start()
+
+        return batch.id
+
+    def _poll_job(self, job_id: str, api_key: str):
+        """Poll a batch until it finishes, then store its results"""
+        client = LLMProviders.get_openai_client(api_key)
+        failures = 0
+        while True:
+            try:
+                batch = client.batches.retrieve(job_id)
+            except Exception as e:
+                failures += 1
+                print(f"Error polling batch {job_id} ({failures}/{MAX_POLL_FAILURES}): {e}")
+                if failures >= MAX_POLL_FAILURES:
+                    with self._lock:
+                        self.jobs[job_id]["status"] = "failed"
+                    return
+                time.sleep(self.poll_interval_seconds)
+                continue
+            failures = 0
+
+            with self._lock:
+                self.jobs[job_id]["status"] = batch.status
+
+            if batch.status in TERMINAL_STATUSES:
+                break
+            time.sleep(self.poll_interval_seconds)
+
+        if batch.status == "completed" and batch.output_file_id:
+            try:
+                output = client.files.content(batch.output_file_id).text
+                self._store_results(job_id, output)
+            except Exception as e:
+                print(f"Error collecting batch {job_id} results: {e}")
+
+    def _store_results(self, job_id: str, output: str):
+        """Parse the output JSONL and log each result for record keeping"""
+        job = self.jobs[job_id]
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            index = int(result["custom_id"].rsplit("-", 1)[1])
+            body = (result.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            content = choices[0]["message"]["content"] if choices else ""
+
+            with self._lock:
+                job["results"][index] = content
+
+            record_keeper.log_system_operation(
+                record_type=RecordType.HUMAN_OVERSIGHT,
+                user_id=job["user_id"],
+                session_id=None,
+                action="batch_reprocessed",
+                input_data={"query": job["prompts"][index]},
+                output_data={"response": content},
+                processing_time_ms=0,
+                ai_model_used=job["model"],
+                metadata={"batch_job_id": job_id}
+            )
+
+    def get_job_status(self, job_id: str) -> Optional[str]:
+        """Get the last known status of a batch job"""
+        job = self.jobs.get(job_id)
+        return job["status"] if job else None
+
+    def get_job_results(self, job_id: str) -> Dict[int, str]:
+        """Get results collected so far, keyed by prompt index"""
+        job = self.jobs.get(job_id)
+        return dict(job["results"]) if job else {}
+
+# Global batch job manager instance
+batch_jobs = BatchJobManager()
+
+def submit_batch(prompts: List[str], model: str, api_key: str, context: str = "",
+                 user_id: Optional[str] = None) -> str:
+    """Submit prompts as a single OpenAI batch job; returns the job id"""
+    return batch_jobs.submit_batch(prompts, model, api_key, context=context, user_id=user_id)
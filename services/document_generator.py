@@ -4,9 +4,13 @@ Document generation utilities for CV/Resume exports
 
 import json
 import datetime
+import hashlib
 import os
-from typing import Dict, Any
-from services.resume_service import ResumeService
+from functools import lru_cache
+from xml.sax.saxutils import escape as _xml_escape
+from typing import Dict, Any, Optional
+import streamlit as st
+from services.resume_service import ResumeService, dumps_json
 
 try:
     from reportlab.lib.pagesizes import letter, A4
@@ -22,88 +26,193 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+if PDF_AVAILABLE:
+    # Paragraph styles are built once and shared (never mutated) across PDF builds
+    _SAMPLE_STYLES = getSampleStyleSheet()
+    _TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_SAMPLE_STYLES['Heading1'],
+        fontSize=24,
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#1f4e79')
+    )
+    _SUBTITLE_STYLE = ParagraphStyle(
+        'CustomSubtitle',
+        parent=_SAMPLE_STYLES['Heading2'],
+        fontSize=14,
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#2c5aa0')
+    )
+    _HEADING_STYLE = ParagraphStyle(
+        'CustomHeading',
+        parent=_SAMPLE_STYLES['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        spaceBefore=12,
+        textColor=colors.HexColor('#1f4e79'),
+        borderWidth=1,
+        borderColor=colors.HexColor('#1f4e79'),
+        borderPadding=5
+    )
+    _NORMAL_STYLE = ParagraphStyle('CVNormal', parent=_SAMPLE_STYLES['Normal'], fontSize=10, spaceAfter=6)
+    _CONTACT_STYLE = ParagraphStyle('Contact', alignment=TA_CENTER, fontSize=10, spaceAfter=12)
+    _EXP_TITLE_STYLE = ParagraphStyle('ExpTitle', fontSize=12, spaceAfter=3, textColor=colors.HexColor('#2c5aa0'))
+    _EXP_DETAILS_STYLE = ParagraphStyle('ExpDetails', fontSize=9, spaceAfter=6, textColor=colors.grey)
+    _PROJ_TITLE_STYLE = ParagraphStyle('ProjTitle', fontSize=11, spaceAfter=3, textColor=colors.HexColor('#2c5aa0'))
+    _TECH_STYLE = ParagraphStyle('Tech', fontSize=9, spaceAfter=6, textColor=colors.grey)
+
+# Resume data is loaded once per process; its digest keys the cached exports
+RESUME_VERSION = hashlib.sha1(
+    json.dumps(ResumeService.get_full_resume_data(), sort_keys=True, default=str).encode("utf-8")
+).hexdigest()
+
+# Skill lines per export: (skills key, label, max items); PDF labels are Paragraph markup
+_TEXT_SKILL_LINES = (
+    ('core_expertise', "Core Expertise", 15),
+    ('ai_mcp', "AI & MCP Technologies", 10),
+    ('backend_devops', "Backend & DevOps", 12),
+    ('frontend', "Frontend Technologies", 12),
+)
+_PDF_SKILL_LINES = (
+    ('core_expertise', "Core Expertise", 15),
+    ('ai_mcp', "AI &amp; MCP", 10),
+    ('backend_devops', "Backend &amp; DevOps", 12),
+    ('frontend', "Frontend", 12),
+)
+
+# The PDF keeps to one or two pages: top projects, their main technologies, top achievements
+_PDF_MAX_PROJECTS = 4
+_PDF_MAX_TECHNOLOGIES = 8
+_PDF_MAX_ACHIEVEMENTS = 6
+
+# JSON Resume work dates per company: (startDate, endDate); "" means current role
+_COMPANY_DATES = {
+    "ONE-FRONT": ("2020-01-01", ""),
+    "Enterprise Technology Solutions": ("2018-01-01", "2020-01-01"),
+    "Digital Innovation Labs": ("2016-01-01", "2018-01-01"),
+}
+_DEFAULT_COMPANY_DATES = ("2014-01-01", "2016-01-01")
+
+# Education dates: (startDate, endDate) for master's vs other degrees
+_MASTER_DATES = ("2012-09-01", "2014-07-01")
+_DEGREE_DATES = ("2008-09-01", "2012-07-01")
+
+def _work_dates(company: str) -> tuple:
+    return _COMPANY_DATES.get(company, _DEFAULT_COMPANY_DATES)
+
+def _edu_dates(degree: str) -> tuple:
+    return _MASTER_DATES if "Master" in degree else _DEGREE_DATES
+
+def _safe(value: Any) -> str:
+    """Escape resume text for ReportLab's Paragraph markup parser (keeps only our own tags live)"""
+    return _xml_escape(str(value), {'"': '&quot;'})
+
+def _safe_join(values, separator: str = ", ") -> str:
+    return separator.join(_safe(v) for v in values)
+
+@lru_cache(maxsize=1)
+def _github_session() -> "requests.Session":
+    """Keep-alive session for the GitHub API, reused across gist uploads"""
+    session = requests.Session()
+    retries = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
 class DocumentGenerator:
     """Handles document generation for CV/Resume exports"""
     
     @staticmethod
-    def generate_cv_text() -> str:
+    def generate_cv_text(data: Optional[Dict[str, Any]] = None) -> str:
+        """Generate a downloadable CV in text format (cached per resume version unless data is passed in)"""
+        if data is None:
+            return _cached_cv_text(RESUME_VERSION)
+        return DocumentGenerator._build_cv_text(data)
+
+    @staticmethod
+    def _build_cv_text(data: Dict[str, Any]) -> str:
         """Generate a downloadable CV in text format"""
-        data = ResumeService.get_full_resume_data()
-        
-        cv_text = f"""
-{data['personal']['name']}
-{data['personal']['title']}
-{data['personal']['location']}
-Email: {data['personal']['email']}
-Website: {data['personal'].get('website', '')}
+        personal = data['personal']
+        skills = data['skills']
+        
+        parts = [f"""
+{personal['name']}
+{personal['title']}
+{personal['location']}
+Email: {personal['email']}
+Website: {personal.get('website', '')}
 
 PROFESSIONAL SUMMARY
-{data['personal']['summary']}
+{personal['summary']}
 
 WORK EXPERIENCE
-"""
+"""]
         
         for exp in data['experience']:
-            cv_text += f"""
+            parts.append(f"""
 {exp['company']} | {exp['position']}
 {exp['duration']} | {exp['location']}
 {exp['description']}
-"""
+""")
         
-        cv_text += "\nTECHNICAL SKILLS\n"
-        if 'core_expertise' in data['skills']:
-            cv_text += f"Core Expertise: {', '.join(data['skills']['core_expertise'][:15])}\n"
-        if 'ai_mcp' in data['skills']:
-            cv_text += f"AI & MCP Technologies: {', '.join(data['skills']['ai_mcp'][:10])}\n"
-        if 'backend_devops' in data['skills']:
-            cv_text += f"Backend & DevOps: {', '.join(data['skills']['backend_devops'][:12])}\n"
-        if 'frontend' in data['skills']:
-            cv_text += f"Frontend Technologies: {', '.join(data['skills']['frontend'][:12])}\n"
-        cv_text += f"Languages: {', '.join(data['skills']['languages'])}\n"
-        if data['skills'].get('certifications'):
-            cv_text += f"Certifications: {', '.join(data['skills']['certifications'])}\n"
+        parts.append("\nTECHNICAL SKILLS\n")
+        for key, label, limit in _TEXT_SKILL_LINES:
+            if key in skills:
+                parts.append(f"{label}: {', '.join(skills[key][:limit])}\n")
+        parts.append(f"Languages: {', '.join(skills['languages'])}\n")
+        if skills.get('certifications'):
+            parts.append(f"Certifications: {', '.join(skills['certifications'])}\n")
         
-        cv_text += "\nEDUCATION\n"
+        parts.append("\nEDUCATION\n")
         for edu in data['education']:
-            cv_text += f"{edu['degree']} | {edu['institution']} | {edu['year']} | {edu['location']}\n"
+            parts.append(f"{edu['degree']} | {edu['institution']} | {edu['year']} | {edu['location']}\n")
         
-        cv_text += "\nKEY PROJECTS\n"
+        parts.append("\nKEY PROJECTS\n")
         for project in data['projects']:
-            cv_text += f"""
+            parts.append(f"""
 {project['name']} ({project['year']})
 {project['description']}
 Technologies: {', '.join(project['technologies'])}
 Status: {project['status']}
-"""
+""")
         
-        cv_text += "\nKEY ACHIEVEMENTS\n"
-        for achievement in data['achievements']:
-            cv_text += f"• {achievement}\n"
+        parts.append("\nKEY ACHIEVEMENTS\n")
+        parts.extend(f"• {achievement}\n" for achievement in data['achievements'])
         
-        cv_text += "\nINDUSTRY EXPERIENCE\n"
-        for industry in data['industries']:
-            cv_text += f"• {industry}\n"
+        parts.append("\nINDUSTRY EXPERIENCE\n")
+        parts.extend(f"• {industry}\n" for industry in data['industries'])
         
-        return cv_text.strip()
+        return "".join(parts).strip()
     
     @staticmethod
-    def generate_json_resume() -> dict:
+    def generate_json_resume(data: Optional[Dict[str, Any]] = None) -> dict:
+        """Generate JSON Resume format from fallback data (cached per resume version unless data is passed in)"""
+        if data is None:
+            return _cached_json_resume(RESUME_VERSION)
+        return DocumentGenerator._build_json_resume(data)
+
+    @staticmethod
+    def _build_json_resume(data: Dict[str, Any]) -> dict:
         """Generate JSON Resume format from fallback data"""
-        data = ResumeService.get_full_resume_data()
+        personal = data['personal']
+        skills = data['skills']
         
         return {
             "basics": {
-                "name": data['personal']['name'],
-                "label": data['personal']['title'],
-                "email": data['personal']['email'],
-                "url": data['personal'].get('website', ''),
-                "summary": data['personal']['summary'],
+                "name": personal['name'],
+                "label": personal['title'],
+                "email": personal['email'],
+                "url": personal.get('website', ''),
+                "summary": personal['summary'],
                 "location": {
-                    "city": data['personal']['location'],
+                    "city": personal['location'],
                     "countryCode": "WW"
                 },
                 "profiles": [
@@ -115,7 +224,7 @@ Status: {project['status']}
                     {
                         "network": "Website", 
                         "username": "one-front",
-                        "url": data['personal'].get('website', '')
+                        "url": personal.get('website', '')
                     }
                 ]
             },
@@ -123,12 +232,8 @@ Status: {project['status']}
                 {
                     "company": exp['company'],
                     "position": exp['position'],
-                    "startDate": "2020-01-01" if exp['company'] == "ONE-FRONT" else 
-                               "2018-01-01" if exp['company'] == "Enterprise Technology Solutions" else
-                               "2016-01-01" if exp['company'] == "Digital Innovation Labs" else "2014-01-01",
-                    "endDate": "" if exp['company'] == "ONE-FRONT" else
-                              "2020-01-01" if exp['company'] == "Enterprise Technology Solutions" else
-                              "2018-01-01" if exp['company'] == "Digital Innovation Labs" else "2016-01-01",
+                    "startDate": _work_dates(exp['company'])[0],
+                    "endDate": _work_dates(exp['company'])[1],
                     "location": exp['location'],
                     "summary": exp['description'],
                     "highlights": [exp['description'][:100] + "..."]
@@ -139,8 +244,8 @@ Status: {project['status']}
                     "institution": edu['institution'],
                     "area": "Computer Science",
                     "studyType": edu['degree'],
-                    "startDate": "2012-09-01" if "Master" in edu['degree'] else "2008-09-01",
-                    "endDate": "2014-07-01" if "Master" in edu['degree'] else "2012-07-01",
+                    "startDate": _edu_dates(edu['degree'])[0],
+                    "endDate": _edu_dates(edu['degree'])[1],
                     "location": edu['location']
                 } for edu in data['education']
             ],
@@ -148,17 +253,17 @@ Status: {project['status']}
                 {
                     "name": "Programming Languages",
                     "level": "Expert",
-                    "keywords": data['skills'].get('core_expertise', [])[:10]
+                    "keywords": skills.get('core_expertise', [])[:10]
                 },
                 {
                     "name": "AI & Machine Learning",
                     "level": "Advanced", 
-                    "keywords": data['skills'].get('ai_mcp', data['skills'].get('ai,_agents__mcp_servers', []))[:10]
+                    "keywords": skills.get('ai_mcp', skills.get('ai,_agents__mcp_servers', []))[:10]
                 }
             ],
             "languages": [
                 {"language": lang.split("(")[0].strip(), "fluency": lang.split("(")[1].replace(")", "") if "(" in lang else "Fluent"} 
-                for lang in data['skills']['languages']
+                for lang in skills['languages']
             ],
             "projects": [
                 {
@@ -180,137 +285,103 @@ Status: {project['status']}
         }
     
     @staticmethod
-    def generate_cv_pdf() -> bytes:
+    def generate_cv_pdf(data: Optional[Dict[str, Any]] = None) -> bytes:
+        """Generate a professional PDF CV using ReportLab (cached per resume version unless data is passed in)"""
+        if data is None:
+            return _cached_cv_pdf(RESUME_VERSION)
+        return DocumentGenerator._build_cv_pdf(data)
+
+    @staticmethod
+    def _build_cv_pdf(data: Dict[str, Any]) -> bytes:
         """Generate a professional PDF CV using ReportLab"""
         if not PDF_AVAILABLE:
             raise ImportError("ReportLab is not available. Install with: pip install reportlab")
         
-        data = ResumeService.get_full_resume_data()
+        personal = data['personal']
+        skills = data['skills']
         
         # Create PDF buffer
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#1f4e79')
-        )
-        
-        subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#2c5aa0')
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            spaceBefore=12,
-            textColor=colors.HexColor('#1f4e79'),
-            borderWidth=1,
-            borderColor=colors.HexColor('#1f4e79'),
-            borderPadding=5
-        )
-        
-        normal_style = styles['Normal']
-        normal_style.fontSize = 10
-        normal_style.spaceAfter = 6
+        title_style = _TITLE_STYLE
+        subtitle_style = _SUBTITLE_STYLE
+        heading_style = _HEADING_STYLE
+        normal_style = _NORMAL_STYLE
         
         # Story elements
         story = []
         
         # Header
-        story.append(Paragraph(data['personal']['name'], title_style))
-        story.append(Paragraph(data['personal']['title'], subtitle_style))
+        story.append(Paragraph(_safe(personal['name']), title_style))
+        story.append(Paragraph(_safe(personal['title']), subtitle_style))
         
         # Contact info
         contact_info = f"""
-        📧 {data['personal']['email']} | 🌐 {data['personal']['website']} | 📍 {data['personal']['location']}
+        📧 {_safe(personal['email'])} | 🌐 {_safe(personal['website'])} | 📍 {_safe(personal['location'])}
         """
-        if data['personal'].get('phone'):
-            contact_info = f"📞 {data['personal']['phone']} | " + contact_info
+        if personal.get('phone'):
+            contact_info = f"📞 {_safe(personal['phone'])} | " + contact_info
         
-        story.append(Paragraph(contact_info, ParagraphStyle('Contact', alignment=TA_CENTER, fontSize=10, spaceAfter=12)))
+        story.append(Paragraph(contact_info, _CONTACT_STYLE))
         story.append(Spacer(1, 12))
         
         # Professional Summary
         story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
-        story.append(Paragraph(data['personal']['summary'], normal_style))
+        story.append(Paragraph(_safe(personal['summary']), normal_style))
         story.append(Spacer(1, 12))
         
         # Work Experience
         story.append(Paragraph("WORK EXPERIENCE", heading_style))
         for exp in data['experience']:
             # Company and position
-            exp_title = f"<b>{exp['company']}</b> | {exp['position']}"
-            story.append(Paragraph(exp_title, ParagraphStyle('ExpTitle', fontSize=12, spaceAfter=3, textColor=colors.HexColor('#2c5aa0'))))
+            exp_title = f"<b>{_safe(exp['company'])}</b> | {_safe(exp['position'])}"
+            story.append(Paragraph(exp_title, _EXP_TITLE_STYLE))
             
             # Duration and location
-            exp_details = f"{exp['duration']} | {exp['location']}"
-            story.append(Paragraph(exp_details, ParagraphStyle('ExpDetails', fontSize=9, spaceAfter=6, textColor=colors.grey)))
+            exp_details = f"{_safe(exp['duration'])} | {_safe(exp['location'])}"
+            story.append(Paragraph(exp_details, _EXP_DETAILS_STYLE))
             
             # Description
-            story.append(Paragraph(exp['description'], normal_style))
+            story.append(Paragraph(_safe(exp['description']), normal_style))
             story.append(Spacer(1, 8))
         
         # Technical Skills
         story.append(Paragraph("TECHNICAL SKILLS", heading_style))
         
-        # Core Expertise
-        if 'core_expertise' in data['skills']:
-            story.append(Paragraph("<b>Core Expertise:</b> " + ", ".join(data['skills']['core_expertise'][:15]), normal_style))
-        
-        # AI & MCP
-        if 'ai_mcp' in data['skills']:
-            story.append(Paragraph("<b>AI & MCP:</b> " + ", ".join(data['skills']['ai_mcp'][:10]), normal_style))
-        
-        # Backend & DevOps
-        if 'backend_devops' in data['skills']:
-            story.append(Paragraph("<b>Backend & DevOps:</b> " + ", ".join(data['skills']['backend_devops'][:12]), normal_style))
-        
-        # Frontend
-        if 'frontend' in data['skills']:
-            story.append(Paragraph("<b>Frontend:</b> " + ", ".join(data['skills']['frontend'][:12]), normal_style))
+        # Core Expertise, AI & MCP, Backend & DevOps, Frontend
+        for key, label, limit in _PDF_SKILL_LINES:
+            if key in skills:
+                story.append(Paragraph(f"<b>{label}:</b> " + _safe_join(skills[key][:limit]), normal_style))
         
         # Languages
-        story.append(Paragraph("<b>Languages:</b> " + ", ".join(data['skills']['languages']), normal_style))
+        story.append(Paragraph("<b>Languages:</b> " + _safe_join(skills['languages']), normal_style))
         story.append(Spacer(1, 12))
         
         # Key Projects
         story.append(Paragraph("KEY PROJECTS", heading_style))
-        for project in data['projects'][:4]:  # Limit to top 4 projects
-            proj_title = f"<b>{project['name']}</b> ({project['year']})"
-            story.append(Paragraph(proj_title, ParagraphStyle('ProjTitle', fontSize=11, spaceAfter=3, textColor=colors.HexColor('#2c5aa0'))))
-            story.append(Paragraph(project['description'], normal_style))
+        top_projects = data['projects'][:_PDF_MAX_PROJECTS]
+        for project in top_projects:
+            proj_title = f"<b>{_safe(project['name'])}</b> ({_safe(project['year'])})"
+            story.append(Paragraph(proj_title, _PROJ_TITLE_STYLE))
+            story.append(Paragraph(_safe(project['description']), normal_style))
             
             # Technologies
-            tech_list = ", ".join(project['technologies'][:8])  # Limit technologies
-            story.append(Paragraph(f"<b>Technologies:</b> {tech_list}", ParagraphStyle('Tech', fontSize=9, spaceAfter=6, textColor=colors.grey)))
+            tech_list = _safe_join(project['technologies'][:_PDF_MAX_TECHNOLOGIES])
+            story.append(Paragraph(f"<b>Technologies:</b> {tech_list}", _TECH_STYLE))
             story.append(Spacer(1, 6))
         
         # Key Achievements
         story.append(Paragraph("KEY ACHIEVEMENTS", heading_style))
-        for achievement in data['achievements'][:6]:  # Limit to top 6 achievements
-            story.append(Paragraph(f"• {achievement}", normal_style))
+        top_achievements = data['achievements'][:_PDF_MAX_ACHIEVEMENTS]
+        for achievement in top_achievements:
+            story.append(Paragraph(f"• {_safe(achievement)}", normal_style))
         
         story.append(Spacer(1, 12))
         
         # Industries
         story.append(Paragraph("INDUSTRY EXPERIENCE", heading_style))
-        industries_text = " • ".join(data['industries'])
+        industries_text = _safe_join(data['industries'], " • ")
         story.append(Paragraph(industries_text, normal_style))
         
         # Education
@@ -318,12 +389,11 @@ Status: {project['status']}
             story.append(Spacer(1, 12))
             story.append(Paragraph("EDUCATION & CERTIFICATIONS", heading_style))
             for edu in data['education']:
-                edu_text = f"<b>{edu['degree']}</b> | {edu['institution']} | {edu['year']}"
+                edu_text = f"<b>{_safe(edu['degree'])}</b> | {_safe(edu['institution'])} | {_safe(edu['year'])}"
                 story.append(Paragraph(edu_text, normal_style))
         
         # Build PDF
         doc.build(story)
-        buffer.seek(0)
         return buffer.getvalue()
     
     @staticmethod
@@ -343,14 +413,26 @@ Status: {project['status']}
             "public": True,
             "files": {
                 "resume.json": {
-                    "content": json.dumps(resume_data, indent=2)
+                    "content": dumps_json(resume_data, indent=True)
                 }
             }
         }
         
-        response = requests.post("https://api.github.com/gists", headers=headers, json=gist_data)
+        response = _github_session().post("https://api.github.com/gists", headers=headers, json=gist_data, timeout=(5, 30))
         
         if response.status_code == 201:
             return response.json()
         else:
-            raise Exception(f"Failed to create gist: {response.status_code} - {response.text}") 
\ No newline at end of file
+            raise Exception(f"Failed to create gist: {response.status_code} - {response.text}")
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_cv_text(resume_version: str) -> str:
+    return DocumentGenerator._build_cv_text(ResumeService.get_full_resume_data())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_json_resume(resume_version: str) -> dict:
+    return DocumentGenerator._build_json_resume(ResumeService.get_full_resume_data())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_cv_pdf(resume_version: str) -> bytes:
+    return DocumentGenerator._build_cv_pdf(ResumeService.get_full_resume_data())
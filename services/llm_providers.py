@@ -3,11 +3,28 @@ LLM Provider implementations for different AI services
 """
 
 import os
-from typing import List, Dict
+import re
+import hashlib
+import json
+import time
+import atexit
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Iterator
+import httpx
 import openai
+from resume_core.config import (
+    AUTO_OPENROUTER_MODEL,
+    OPENROUTER_FALLBACK_MODELS,
+    OPENROUTER_CONNECT_TIMEOUT,
+    OPENROUTER_READ_TIMEOUT,
+)
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -18,6 +35,172 @@ try:
 except ImportError:
     OLLAMA_AVAILABLE = False
 
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 -- httpx only negotiates HTTP/2 when h2 is installed
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Answer markers for batch prompting: "[1] ...", "[2] ..."
+_BATCH_MARKER_RE = re.compile(r'\[(\d+)\]\s*')
+
+# At most this many chat_many requests in flight; more only trips free-tier rate limits
+_CHAT_MANY_CONCURRENCY = 4
+
+# Leading text of the error messages the chat methods return in place of an answer
+_ERROR_PREFIXES = (
+    "OpenRouter API key required",
+    "🔑 Invalid OpenRouter key format",
+    "HTTP client (requests) not available",
+    "🔑 **Authentication Failed",
+    "❌ **All free models",
+    "OpenRouter error:",
+    "OpenAI API key required",
+    "OpenAI error:",
+    "Ollama not available",
+    "Ollama error:",
+    "Unknown provider:",
+)
+
+# OpenRouter models whose prompt caching needs an explicit cache_control breakpoint
+_EXPLICIT_CACHE_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+
+# Well-formed OpenRouter key: catches truncated pastes and stray whitespace before any round-trip
+_OPENROUTER_KEY_RE = re.compile(r"sk-or-v1-[A-Za-z0-9_\-]{40,}")
+
+# HTTP statuses that mean "this free model is unavailable right now" — try the next one
+_OPENROUTER_RETRY_STATUSES = (404, 429, 502, 503)
+
+@lru_cache(maxsize=1)
+def _openai_http_client() -> httpx.Client:
+    """One connection pool shared by every per-key OpenAI client, so evicting a client leaks no sockets"""
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        timeout=openai.DEFAULT_TIMEOUT,
+    )
+
+@lru_cache(maxsize=8)
+def _openai_client(api_key: str) -> "openai.OpenAI":
+    """OpenAI client per key over the shared pool; reusing it skips a TCP + TLS handshake per turn"""
+    return openai.OpenAI(api_key=api_key, http_client=_openai_http_client())
+
+@lru_cache(maxsize=1)
+def _openrouter_session() -> "requests.Session":
+    """Keep-alive session for OpenRouter; the key travels in per-request headers"""
+    session = requests.Session()
+    # Only reconnect on dead pooled sockets; HTTP error statuses go to model failover
+    retries = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+def _close_openrouter_session():
+    """Close the pooled OpenRouter connections on shutdown, if the session was ever created"""
+    if _openrouter_session.cache_info().currsize:
+        _openrouter_session().close()
+
+atexit.register(_close_openrouter_session)
+
+def _close_openai_http_client():
+    """Close the shared OpenAI connection pool on shutdown, if it was ever created"""
+    if _openai_http_client.cache_info().currsize:
+        _openai_http_client().close()
+
+atexit.register(_close_openai_http_client)
+
+@lru_cache(maxsize=1)
+def _ollama_client() -> "ollama.Client":
+    """Persistent client for the local Ollama server"""
+    return ollama.Client()
+
+# Last Ollama probe as [monotonic_time, reachable]; kept here so this module stays Streamlit-free
+_OLLAMA_PROBE_TTL_SECONDS = 30
+_ollama_probe = [float("-inf"), False]
+
+def _ollama_reachable(timeout_seconds: float = 0.3) -> bool:
+    """Probe the local Ollama daemon without letting a dead socket stall the render"""
+    checked_at, reachable = _ollama_probe
+    now = time.monotonic()
+    if now - checked_at < _OLLAMA_PROBE_TTL_SECONDS:
+        return reachable
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        executor.submit(_ollama_client().list).result(timeout=timeout_seconds)
+        reachable = True
+    except Exception:
+        # Timed out or refused: treat the daemon as absent until the next probe
+        reachable = False
+    finally:
+        # Don't wait for a probe stuck in connect(); it finishes on its own
+        executor.shutdown(wait=False)
+    _ollama_probe[:] = [now, reachable]
+    return reachable
+
+@lru_cache(maxsize=8)
+def _encoder(model: str):
+    """Tokenizer per model, loaded once; OpenRouter ids are unknown to tiktoken, so fall back to cl100k"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model.split("/")[-1])
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # The BPE file is downloaded on first use; offline, budget with the length estimate
+        print(f"Tokenizer unavailable, estimating token counts: {e}")
+        return None
+
+# Fixed part of the system prompt; the per-query resume context is appended last so
+# every request shares this prefix and provider-side prompt caching can engage
+_SYSTEM_PREFIX = """You are MikeGPT, an AI assistant that answers questions ONLY about Michael Wybraniec's professional resume.
+
+CRITICAL — ACCURACY (no improvisation):
+- Use ONLY facts present in RESUME CONTEXT below. You have no other knowledge about Michael.
+- NEVER invent or infer: employers, job titles, dates, technologies, certifications, projects, or recommendation quotes.
+- NEVER add common stack items (e.g. Hadoop, Spark, Tableau, Databricks, Snowflake, TensorFlow) unless they appear verbatim in RESUME CONTEXT.
+- If the user asks about something not in context, reply: "That is not listed in Michael's resume data" — do not guess.
+- Do not use general industry knowledge to fill gaps. Do not embellish or assume seniority beyond what is stated.
+- Michael's profile may span software engineering, product, data/analytics, and AI/agentic work — but mention only pillars and tools explicitly listed in RESUME CONTEXT.
+
+STYLE:
+- Use **bold** for important terms; bullet points (-) for lists; `code blocks` for technical terms
+- Be professional and concise
+- When the context contains quoted recommendation or reference text and the user asks to see them, reproduce the actual quotes verbatim — do NOT paraphrase or summarise them.
+- If context is insufficient, ask the user to narrow the question
+
+Every claim about Michael must be traceable to RESUME CONTEXT.
+
+RESUME CONTEXT (sole source of truth):
+"""
+
+# Ollama gets a single prompt string; same idea, fixed instructions first for its KV prefix cache
+_OLLAMA_PREFIX = """You are an AI assistant helping users explore Michael Wybraniec's professional resume. 
+
+FORMATTING GUIDELINES:
+- Use proper Markdown formatting in all responses
+- Use **bold** for important terms, names, and key points  
+- Use ##### for headers and section titles
+- Use - for bullet points in lists and achievements
+- Use `code blocks` for technical skills and technologies
+- Keep responses well-structured and easy to scan
+- Be professional but conversational
+- Focus on relevant details from the provided context
+
+"""
+
+# Changes whenever the instructions change, so answers cached under an older prompt are not reused
+PROMPT_VERSION = hashlib.blake2b((_SYSTEM_PREFIX + _OLLAMA_PREFIX).encode("utf-8"), digest_size=8).hexdigest()
+
+class StreamError(str):
+    """Error text yielded by a chat stream; callers check the type instead of sniffing the joined reply"""
+
 class LLMProviders:
     """Handles different LLM providers"""
     
@@ -26,47 +209,39 @@ class LLMProviders:
         """Get list of available LLM providers"""
         providers = ["openrouter"]
         
-        if OLLAMA_AVAILABLE:
-            try:
-                ollama.list()
-                providers.append("ollama")
-            except:
-                pass
+        if OLLAMA_AVAILABLE and _ollama_reachable():
+            providers.append("ollama")
         
         if os.getenv("OPENAI_API_KEY"):
             providers.append("openai")
         
         return providers
     
+    @staticmethod
+    def get_openai_client(api_key: str) -> "openai.OpenAI":
+        """Shared keep-alive OpenAI client for this key (also used by offline batch jobs)"""
+        return _openai_client(api_key)
+    
+    @staticmethod
+    def count_tokens(text: str, model: str = "") -> int:
+        """Token count for budgeting; ~4 characters per token when tiktoken is not installed"""
+        encoder = _encoder(model)
+        # User text may contain "<|endoftext|>"; count it as plain text instead of raising
+        return len(encoder.encode(text, disallowed_special=())) if encoder else len(text) // 4
+    
+    @staticmethod
+    def is_error_response(response: str) -> bool:
+        """True when a chat result is a provider error message rather than an answer"""
+        return response.startswith(_ERROR_PREFIXES) or "⚠️ OpenRouter stream interrupted" in response
+    
     @staticmethod
     def create_system_message(context: str) -> str:
-        """Create system message with context"""
-        return f"""You are MikeGPT, an AI assistant that answers questions ONLY about Michael Wybraniec's professional resume.
-
-RESUME CONTEXT (sole source of truth):
-{context}
-
-CRITICAL — ACCURACY (no improvisation):
-- Use ONLY facts present in RESUME CONTEXT above. You have no other knowledge about Michael.
-- NEVER invent or infer: employers, job titles, dates, technologies, certifications, projects, or recommendation quotes.
-- NEVER add common stack items (e.g. Hadoop, Spark, Tableau, Databricks, Snowflake, TensorFlow) unless they appear verbatim in RESUME CONTEXT.
-- If the user asks about something not in context, reply: "That is not listed in Michael's resume data" — do not guess.
-- Do not use general industry knowledge to fill gaps. Do not embellish or assume seniority beyond what is stated.
-- Michael's profile may span software engineering, product, data/analytics, and AI/agentic work — but mention only pillars and tools explicitly listed above.
-
-STYLE:
-- Use **bold** for important terms; bullet points (-) for lists; `code blocks` for technical terms
-- Be professional and concise
-- When the context contains quoted recommendation or reference text and the user asks to see them, reproduce the actual quotes verbatim — do NOT paraphrase or summarise them.
-- If context is insufficient, ask the user to narrow the question
-
-Every claim about Michael must be traceable to RESUME CONTEXT."""
+        """Create system message with context; the fixed instructions come first so providers can cache them"""
+        return _SYSTEM_PREFIX + context
     
     @staticmethod
     def _openrouter_models_to_try(requested_model: str) -> List[str]:
         """Build ordered model list: preferred first, then failover chain."""
-        from resume_core.config import AUTO_OPENROUTER_MODEL, OPENROUTER_FALLBACK_MODELS
-
         if requested_model in (AUTO_OPENROUTER_MODEL, "openrouter/free"):
             return list(OPENROUTER_FALLBACK_MODELS)
 
@@ -86,12 +261,108 @@ Every claim about Michael must be traceable to RESUME CONTEXT."""
 
     @staticmethod
     def _should_try_next_openrouter_model(status_code: int, content: str) -> bool:
-        if status_code in (404, 429, 502, 503):
+        if status_code in _OPENROUTER_RETRY_STATUSES:
             return True
         if status_code == 200 and not content:
             return True
         return False
 
+    @staticmethod
+    def is_valid_openrouter_key(api_key: str) -> bool:
+        """Cheap format check so a malformed key is rejected before any request is made"""
+        return bool(api_key) and _OPENROUTER_KEY_RE.fullmatch(api_key.strip()) is not None
+
+    @staticmethod
+    def _openrouter_key_error(api_key: str) -> str:
+        """Return a user-facing error for an unusable OpenRouter key, or "" if it looks valid."""
+        if not api_key:
+            return "OpenRouter API key required"
+        if not _OPENROUTER_KEY_RE.fullmatch(api_key):
+            return f"🔑 Invalid OpenRouter key format — expected sk-or-v1-... but got: {api_key[:10]}..."
+        if not REQUESTS_AVAILABLE:
+            return "HTTP client (requests) not available"
+        return ""
+
+    @staticmethod
+    def _openrouter_headers(api_key: str) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://ai-resume.streamlit.app",
+            "X-Title": "AI Resume Chat Interface",
+        }
+
+    @staticmethod
+    def _openrouter_auth_error(api_key: str) -> str:
+        return f"""🔑 **Authentication Failed (401)**
+
+Your API key is not being accepted by OpenRouter. Please:
+
+1. **Double-check Key**: Make sure you copied the complete API key from OpenRouter.ai
+2. **Key Format**: Should start with 'sk-or-v1-' and be about 70+ characters long
+3. **Account Status**: Ensure your OpenRouter account is active and verified
+4. **Generate New Key**: Try creating a fresh API key at [OpenRouter.ai](https://openrouter.ai)
+
+**Current key format**: {api_key[:15]}...{api_key[-4:] if len(api_key) > 20 else ''}"""
+
+    @staticmethod
+    def _openrouter_exhausted_message(models_to_try: List[str], failures: List[str]) -> str:
+        return f"""❌ **All free models are temporarily unavailable**
+
+Tried: {', '.join(f'`{m}`' for m in models_to_try)}
+
+Details:
+{chr(10).join(f'- {f}' for f in failures)}
+
+**What to do:**
+1. Wait a minute and send your message again (rate limits reset quickly)
+2. Sidebar → keep **Auto (best available free)** selected
+3. Add provider API keys at [OpenRouter integrations](https://openrouter.ai/settings/integrations) for higher limits"""
+
+    @staticmethod
+    def _openrouter_system_message(model: str, system_prompt: str) -> Dict:
+        """System message for OpenRouter, marked as a prompt-cache breakpoint where the model needs it.
+
+        OpenAI, DeepSeek and most other routes cache identical prefixes automatically;
+        Anthropic and Gemini only cache up to an explicit ``cache_control`` marker.
+        """
+        if not model.startswith(_EXPLICIT_CACHE_MODEL_PREFIXES):
+            return {"role": "system", "content": system_prompt}
+        return {
+            "role": "system",
+            "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+        }
+
+    @staticmethod
+    def _iter_openrouter_sse(response) -> Iterator[str]:
+        """Yield content deltas from an OpenRouter server-sent event stream."""
+        for line in response.iter_lines(decode_unicode=True):
+            # Blank keep-alives and ": OPENROUTER PROCESSING" comments carry no data
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                return
+            try:
+                chunk = json.loads(data)
+            except ValueError:
+                continue
+            if chunk.get("error"):
+                message = chunk["error"].get("message", "stream error")
+                raise RuntimeError(message)
+            choices = chunk.get("choices") or []
+            if not choices:
+                continue
+            delta = (choices[0].get("delta") or {}).get("content")
+            if delta:
+                yield delta
+
+    @staticmethod
+    def _ollama_prompt(messages: List[Dict], context: str) -> str:
+        return f"""{_OLLAMA_PREFIX}CONTEXT: {context}
+
+USER QUESTION: {messages[-1]["content"]}"""
+
     @staticmethod
     def chat_ollama(model: str, messages: List[Dict], context: str = "") -> str:
         """Chat with Ollama model"""
@@ -99,23 +370,8 @@ Every claim about Michael must be traceable to RESUME CONTEXT."""
             return "Ollama not available"
         
         try:
-            formatted_prompt = f"""You are an AI assistant helping users explore Michael Wybraniec's professional resume. 
-
-CONTEXT: {context}
-
-FORMATTING GUIDELINES:
-- Use proper Markdown formatting in all responses
-- Use **bold** for important terms, names, and key points  
-- Use ##### for headers and section titles
-- Use - for bullet points in lists and achievements
-- Use `code blocks` for technical skills and technologies
-- Keep responses well-structured and easy to scan
-- Be professional but conversational
-- Focus on relevant details from the provided context
-
-USER QUESTION: {messages[-1]["content"]}"""
-            
-            response = ollama.chat(
+            formatted_prompt = LLMProviders._ollama_prompt(messages, context)
+            response = _ollama_client().chat(
                 model=model,
                 messages=[{"role": "user", "content": formatted_prompt}]
             )
@@ -127,30 +383,13 @@ USER QUESTION: {messages[-1]["content"]}"""
     def chat_openrouter(model: str, messages: List[Dict], context: str = "", api_key: str = "") -> str:
         """Chat with OpenRouter; auto-failover across free models on rate limits."""
         api_key = api_key.strip() if api_key else ""
-        
-        if not api_key:
-            return "OpenRouter API key required"
-        
-        if not api_key.startswith("sk-or-"):
-            return f"Invalid API key format. Expected format: sk-or-... but got: {api_key[:10]}..."
-        
-        if not REQUESTS_AVAILABLE:
-            return "HTTP client (requests) not available"
-
-        from resume_core.config import OPENROUTER_CONNECT_TIMEOUT, OPENROUTER_READ_TIMEOUT
+        key_error = LLMProviders._openrouter_key_error(api_key)
+        if key_error:
+            return key_error
 
         url = "https://openrouter.ai/api/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://ai-resume.streamlit.app",
-            "X-Title": "AI Resume Chat Interface",
-        }
-        system_message = {
-            "role": "system",
-            "content": LLMProviders.create_system_message(context),
-        }
-        full_messages = [system_message] + messages
+        headers = LLMProviders._openrouter_headers(api_key)
+        system_prompt = LLMProviders.create_system_message(context)
         models_to_try = LLMProviders._openrouter_models_to_try(model)
         failures: List[str] = []
 
@@ -158,12 +397,12 @@ USER QUESTION: {messages[-1]["content"]}"""
             for attempt_model in models_to_try:
                 payload = {
                     "model": attempt_model,
-                    "messages": full_messages,
+                    "messages": [LLMProviders._openrouter_system_message(attempt_model, system_prompt)] + messages,
                     "max_tokens": 2500,
                     "temperature": 0.7,
                 }
                 try:
-                    response = requests.post(
+                    response = _openrouter_session().post(
                         url,
                         headers=headers,
                         json=payload,
@@ -184,16 +423,7 @@ USER QUESTION: {messages[-1]["content"]}"""
                         content = ""
 
                 if response.status_code == 401:
-                    return f"""🔑 **Authentication Failed (401)**
-
-Your API key is not being accepted by OpenRouter. Please:
-
-1. **Double-check Key**: Make sure you copied the complete API key from OpenRouter.ai
-2. **Key Format**: Should start with 'sk-or-v1-' and be about 70+ characters long
-3. **Account Status**: Ensure your OpenRouter account is active and verified
-4. **Generate New Key**: Try creating a fresh API key at [OpenRouter.ai](https://openrouter.ai)
-
-**Current key format**: {api_key[:15]}...{api_key[-4:] if len(api_key) > 20 else ''}"""
+                    return LLMProviders._openrouter_auth_error(api_key)
 
                 if LLMProviders._should_try_next_openrouter_model(response.status_code, content):
                     failures.append(f"`{attempt_model}`: HTTP {response.status_code}")
@@ -205,21 +435,80 @@ Your API key is not being accepted by OpenRouter. Please:
 
                 return content
 
-            tried = ", ".join(failures) if failures else "none"
-            return f"""❌ **All free models are temporarily unavailable**
+            return LLMProviders._openrouter_exhausted_message(models_to_try, failures)
 
-Tried: {', '.join(f'`{m}`' for m in models_to_try)}
+        except Exception as e:
+            return f"OpenRouter error: {str(e)}"
 
-Details:
-{chr(10).join(f'- {f}' for f in failures)}
+    @staticmethod
+    def chat_openrouter_stream(model: str, messages: List[Dict], context: str = "", api_key: str = "") -> Iterator[str]:
+        """Stream an OpenRouter completion; fails over to the next free model until the first token arrives."""
+        api_key = api_key.strip() if api_key else ""
+        key_error = LLMProviders._openrouter_key_error(api_key)
+        if key_error:
+            yield StreamError(key_error)
+            return
 
-**What to do:**
-1. Wait a minute and send your message again (rate limits reset quickly)
-2. Sidebar → keep **Auto (best available free)** selected
-3. Add provider API keys at [OpenRouter integrations](https://openrouter.ai/settings/integrations) for higher limits"""
+        url = "https://openrouter.ai/api/v1/chat/completions"
+        headers = LLMProviders._openrouter_headers(api_key)
+        system_prompt = LLMProviders.create_system_message(context)
+        models_to_try = LLMProviders._openrouter_models_to_try(model)
+        failures: List[str] = []
 
-        except Exception as e:
-            return f"OpenRouter error: {str(e)}"
+        for attempt_model in models_to_try:
+            payload = {
+                "model": attempt_model,
+                "messages": [LLMProviders._openrouter_system_message(attempt_model, system_prompt)] + messages,
+                "max_tokens": 2500,
+                "temperature": 0.7,
+                "stream": True,
+            }
+            try:
+                response = _openrouter_session().post(
+                    url,
+                    headers=headers,
+                    json=payload,
+                    stream=True,
+                    timeout=(OPENROUTER_CONNECT_TIMEOUT, OPENROUTER_READ_TIMEOUT),
+                )
+            except requests.exceptions.Timeout:
+                failures.append(f"`{attempt_model}`: timed out")
+                continue
+            except requests.exceptions.RequestException as exc:
+                failures.append(f"`{attempt_model}`: {exc}")
+                continue
+
+            with response:
+                if response.status_code == 401:
+                    yield StreamError(LLMProviders._openrouter_auth_error(api_key))
+                    return
+
+                if response.status_code in _OPENROUTER_RETRY_STATUSES:
+                    failures.append(f"`{attempt_model}`: HTTP {response.status_code}")
+                    continue
+
+                if response.status_code != 200:
+                    failures.append(f"`{attempt_model}`: HTTP {response.status_code} — {response.text[:120]}")
+                    continue
+
+                started = False
+                try:
+                    for delta in LLMProviders._iter_openrouter_sse(response):
+                        started = True
+                        yield delta
+                except Exception as exc:
+                    if started:
+                        yield StreamError(f"\n\n⚠️ OpenRouter stream interrupted: {exc}")
+                        return
+                    failures.append(f"`{attempt_model}`: {exc}")
+                    continue
+
+                if started:
+                    return
+                # 200 with an empty stream: treat like an empty completion and fail over
+                failures.append(f"`{attempt_model}`: HTTP 200")
+
+        yield StreamError(LLMProviders._openrouter_exhausted_message(models_to_try, failures))
     
     @staticmethod
     def chat_openai(model: str, messages: List[Dict], context: str = "", api_key: str = "") -> str:
@@ -228,7 +517,7 @@ Details:
             return "OpenAI API key required"
         
         try:
-            client = openai.OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             system_message = {
                 "role": "system", 
@@ -244,14 +533,136 @@ Details:
         except Exception as e:
             return f"OpenAI error: {str(e)}"
     
+    @staticmethod
+    def chat_openai_stream(model: str, messages: List[Dict], context: str = "", api_key: str = "") -> Iterator[str]:
+        """Stream an OpenAI completion token by token"""
+        if not api_key:
+            yield StreamError("OpenAI API key required")
+            return
+        
+        try:
+            client = _openai_client(api_key)
+            
+            system_message = {
+                "role": "system", 
+                "content": LLMProviders.create_system_message(context)
+            }
+            full_messages = [system_message] + messages
+            
+            stream = client.chat.completions.create(
+                model=model,
+                messages=full_messages,
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            yield StreamError(f"OpenAI error: {str(e)}")
+    
+    @staticmethod
+    def chat_ollama_stream(model: str, messages: List[Dict], context: str = "") -> Iterator[str]:
+        """Stream an Ollama completion token by token"""
+        if not OLLAMA_AVAILABLE:
+            yield StreamError("Ollama not available")
+            return
+        
+        try:
+            formatted_prompt = LLMProviders._ollama_prompt(messages, context)
+            stream = _ollama_client().chat(
+                model=model,
+                messages=[{"role": "user", "content": formatted_prompt}],
+                stream=True
+            )
+            for chunk in stream:
+                content = chunk['message']['content']
+                if content:
+                    yield content
+        except Exception as e:
+            yield StreamError(f"Ollama error: {str(e)}")
+    
     @staticmethod
     def chat(provider: str, model: str, messages: List[Dict], context: str = "", api_key: str = "") -> str:
         """Unified chat interface for all providers"""
         if provider == "ollama":
-            return LLMProviders.chat_ollama(model, messages, context)
+            # Coalesced with concurrent Ollama requests into one batched dispatch
+            from services.ollama_batcher import get_ollama_batcher
+            return get_ollama_batcher().chat(model, messages, context)
         elif provider == "openrouter":
             return LLMProviders.chat_openrouter(model, messages, context, api_key)
         elif provider == "openai":
             return LLMProviders.chat_openai(model, messages, context, api_key)
         else:
             return f"Unknown provider: {provider}"
+
+    @staticmethod
+    def chat_stream(provider: str, model: str, messages: List[Dict], context: str = "", api_key: str = "") -> Iterator[str]:
+        """Unified streaming chat interface for all providers"""
+        if provider == "ollama":
+            return LLMProviders.chat_ollama_stream(model, messages, context)
+        elif provider == "openrouter":
+            return LLMProviders.chat_openrouter_stream(model, messages, context, api_key)
+        elif provider == "openai":
+            return LLMProviders.chat_openai_stream(model, messages, context, api_key)
+        else:
+            return iter([StreamError(f"Unknown provider: {provider}")])
+
+    @staticmethod
+    def chat_batch(provider: str, model: str, prompts: List[str], shared_context: str = "", api_key: str = "") -> List[str]:
+        """Answer several questions over the same context in a single completion.
+
+        The shared resume context is sent (and billed) once; answers are split
+        back out by their ``[i]`` markers. Questions the reply skipped are
+        re-asked individually, in parallel.
+        """
+        if not prompts:
+            return []
+
+        numbered = "\n".join(f"[{i}] {prompt}" for i, prompt in enumerate(prompts, 1))
+        batch_message = (
+            "Answer each of the following questions about the resume. "
+            "Prefix each answer with [i].\n" + numbered
+        )
+        response = LLMProviders.chat(
+            provider, model, [{"role": "user", "content": batch_message}], shared_context, api_key
+        )
+
+        answers = [""] * len(prompts)
+        parts = _BATCH_MARKER_RE.split(response)
+        for marker, text in zip(parts[1::2], parts[2::2]):
+            index = int(marker) - 1
+            if 0 <= index < len(prompts) and not answers[index]:
+                answers[index] = text.strip()
+
+        if LLMProviders.is_error_response(response):
+            return [response] * len(prompts)
+
+        # Ask whatever the model skipped (or all of it, if it ignored the format) concurrently
+        missing = [i for i, answer in enumerate(answers) if not answer]
+        if missing:
+            retried = LLMProviders.chat_many(
+                provider, model, [prompts[i] for i in missing], shared_context, api_key
+            )
+            for i, answer in zip(missing, retried):
+                answers[i] = answer
+        return answers
+
+    @staticmethod
+    async def _chat_many(provider: str, model: str, prompts: List[str], context: str = "", api_key: str = "") -> List[str]:
+        """Run one chat per prompt concurrently; each keeps its own provider failover"""
+        semaphore = asyncio.Semaphore(_CHAT_MANY_CONCURRENCY)
+
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    LLMProviders.chat, provider, model, [{"role": "user", "content": prompt}], context, api_key
+                )
+
+        return await asyncio.gather(*(_one(prompt) for prompt in prompts))
+
+    @staticmethod
+    def chat_many(provider: str, model: str, prompts: List[str], context: str = "", api_key: str = "") -> List[str]:
+        """Answer independent prompts in parallel; wall time is roughly that of the slowest one"""
+        if not prompts:
+            return []
+        return list(asyncio.run(LLMProviders._chat_many(provider, model, prompts, context, api_key)))
@@ -0,0 +1,105 @@
+"""
+Micro-batching front end for local Ollama inference
+
+Single prompts leave the local GPU at batch size 1, the memory-bandwidth-bound
+regime. This module coalesces prompts that arrive within a few milliseconds of
+each other (concurrent sessions, quick-action prewarm) and dispatches them to
+the Ollama server together, so its parallel slots (OLLAMA_NUM_PARALLEL) decode
+them in one batched forward pass. Identical prompts in a window are sent once.
+"""
+
+import asyncio
+import threading
+from typing import Dict, List, Set, Tuple
+
+import streamlit as st
+
+from services.llm_providers import LLMProviders, OLLAMA_AVAILABLE
+
+if OLLAMA_AVAILABLE:
+    import ollama
+
+class OllamaBatcher:
+    """Coalesces Ollama chat requests over a short window into one dispatch"""
+
+    def __init__(self, max_batch: int = 8, batch_window_ms: int = 8):
+        self.max_batch = max_batch
+        self.batch_window_ms = batch_window_ms
+        self._loop = asyncio.new_event_loop()
+        self._queue: asyncio.Queue = None
+        self._inflight: Set[asyncio.Task] = set()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop)
+        self._thread.daemon = True
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        """Own the event loop on a background thread for the life of the process"""
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        if OLLAMA_AVAILABLE:
+            self._loop.create_task(self._worker())
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _worker(self):
+        """Drain up to max_batch requests (or whatever arrived within the window) per dispatch"""
+        client = ollama.AsyncClient()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.batch_window_ms / 1000
+            while len(batch) < self.max_batch:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch in the background so the next window is collected while this one generates
+            task = self._loop.create_task(self._dispatch(client, batch))
+            # The loop keeps only weak references to tasks; hold them until they finish
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, client, batch: List[Tuple[str, str, asyncio.Future]]):
+        """Send one request per distinct (model, prompt) concurrently and fan results out"""
+        waiters: Dict[Tuple[str, str], List[asyncio.Future]] = {}
+        for model, prompt, future in batch:
+            waiters.setdefault((model, prompt), []).append(future)
+
+        async def _one(model: str, prompt: str) -> str:
+            try:
+                response = await client.chat(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                return response['message']['content']
+            except Exception as e:
+                return f"Ollama error: {str(e)}"
+
+        keys = list(waiters)
+        results = await asyncio.gather(*(_one(model, prompt) for model, prompt in keys))
+        for key, result in zip(keys, results):
+            for future in waiters[key]:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _submit(self, model: str, prompt: str) -> str:
+        future = self._loop.create_future()
+        await self._queue.put((model, prompt, future))
+        return await future
+
+    def chat(self, model: str, messages: List[Dict], context: str = "") -> str:
+        """Blocking chat call from a Streamlit script thread, batched with its neighbours"""
+        if not OLLAMA_AVAILABLE:
+            return "Ollama not available"
+        # Context goes before the question so batched prompts share a cacheable prefix
+        prompt = LLMProviders._ollama_prompt(messages, context)
+        return asyncio.run_coroutine_threadsafe(self._submit(model, prompt), self._loop).result()
+
+@st.cache_resource(show_spinner=False)
+def get_ollama_batcher() -> OllamaBatcher:
+    """Process-wide batcher; survives Streamlit reruns and is shared by all sessions"""
+    return OllamaBatcher()
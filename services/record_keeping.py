@@ -5,13 +5,20 @@ This module implements comprehensive record keeping procedures required under
 Article 12 of the EU AI Act for high-risk AI systems.
 """
 
+import atexit
 import json
 import datetime
+import queue
+import threading
+import time
 import uuid
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+# Queued by flush() to tell the background writer to finish what it holds and stop
+_FLUSH_SENTINEL = object()
+
 class RecordType(Enum):
     """Types of records to be kept"""
     SYSTEM_OPERATION = "system_operation"
@@ -69,7 +76,15 @@ class RecordKeepingSystem:
         self.audit_trails: List[AuditTrail] = []
         self.records_file = "data/system_records.json"
         self.audit_file = "data/audit_trails.json"
+        self._lock = threading.RLock()
+        self._log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
         self._load_existing_records()
+        
+        # Queued interactions are written in batches off the request path, and flushed on shutdown
+        self.flush_thread = threading.Thread(target=self._flush_loop)
+        self.flush_thread.daemon = True
+        self.flush_thread.start()
+        atexit.register(self.flush)
     
     def _load_existing_records(self):
         """Load existing records from files"""
@@ -146,6 +161,21 @@ class RecordKeepingSystem:
                            ai_model_used: str, confidence_score: Optional[float] = None,
                            human_reviewed: bool = False, metadata: Dict[str, Any] = None) -> str:
         """Log a system operation"""
+        with self._lock:
+            record_id = self._append_operation(
+                record_type, user_id, session_id, action, input_data, output_data,
+                processing_time_ms, ai_model_used, confidence_score, human_reviewed, metadata
+            )
+            self._save_records()
+            self._save_audit_trails()
+        return record_id
+    
+    def _append_operation(self, record_type: RecordType, user_id: Optional[str],
+                          session_id: Optional[str], action: str, input_data: Dict[str, Any],
+                          output_data: Dict[str, Any], processing_time_ms: int,
+                          ai_model_used: str, confidence_score: Optional[float] = None,
+                          human_reviewed: bool = False, metadata: Dict[str, Any] = None) -> str:
+        """Add a record and its audit trail entry in memory without writing the files"""
         record_id = str(uuid.uuid4())
         
         record = SystemRecord(
@@ -166,10 +196,9 @@ class RecordKeepingSystem:
         )
         
         self.records.append(record)
-        self._save_records()
         
         # Create audit trail entry
-        self.create_audit_trail(
+        self._append_audit_trail(
             user_id=user_id,
             action=f"system_operation_{action}",
             resource=f"record_{record_id}",
@@ -184,6 +213,17 @@ class RecordKeepingSystem:
                           old_value: Optional[Any], new_value: Optional[Any], reason: str,
                           ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> str:
         """Create an audit trail entry"""
+        with self._lock:
+            trail_id = self._append_audit_trail(
+                user_id, action, resource, old_value, new_value, reason, ip_address, user_agent
+            )
+            self._save_audit_trails()
+        return trail_id
+    
+    def _append_audit_trail(self, user_id: Optional[str], action: str, resource: str,
+                            old_value: Optional[Any], new_value: Optional[Any], reason: str,
+                            ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> str:
+        """Add an audit trail entry in memory without writing the file"""
         trail_id = str(uuid.uuid4())
         
         trail = AuditTrail(
@@ -200,7 +240,6 @@ class RecordKeepingSystem:
         )
         
         self.audit_trails.append(trail)
-        self._save_audit_trails()
         
         return trail_id
     
@@ -221,6 +260,83 @@ class RecordKeepingSystem:
             metadata={"interaction_type": "chat"}
         )
     
+    def log_batch(self, interactions: List[Dict[str, Any]]) -> List[str]:
+        """Log several user interactions, writing the record and audit files once for the batch"""
+        with self._lock:
+            record_ids = [
+                self._append_operation(
+                    record_type=RecordType.USER_INTERACTION,
+                    user_id=interaction["user_id"],
+                    session_id=interaction["session_id"],
+                    action="user_query_processed",
+                    input_data={"query": interaction["query"]},
+                    output_data={"response": interaction["response"]},
+                    processing_time_ms=interaction["processing_time_ms"],
+                    ai_model_used=interaction["ai_model"],
+                    confidence_score=interaction.get("confidence_score"),
+                    metadata={"interaction_type": "chat"}
+                )
+                for interaction in interactions
+            ]
+            self._save_records()
+            self._save_audit_trails()
+        return record_ids
+    
+    def log_user_interaction_async(self, user_id: str, session_id: str, query: str,
+                                   response: str, ai_model: str, processing_time_ms: int,
+                                   confidence_score: Optional[float] = None):
+        """Queue a user interaction for the background writer; returns immediately"""
+        self._log_queue.put_nowait({
+            "user_id": user_id,
+            "session_id": session_id,
+            "query": query,
+            "response": response,
+            "ai_model": ai_model,
+            "processing_time_ms": processing_time_ms,
+            "confidence_score": confidence_score
+        })
+    
+    def _flush_loop(self, max_batch: int = 64, window_seconds: float = 0.5):
+        """Write queued interactions in batches of up to max_batch, or whatever arrives within window_seconds"""
+        stopping = False
+        while not stopping:
+            batch = [self._log_queue.get()]
+            deadline = time.monotonic() + window_seconds
+            while len(batch) < max_batch and batch[-1] is not _FLUSH_SENTINEL:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is _FLUSH_SENTINEL:
+                batch.pop()
+                stopping = True
+            if not batch:
+                continue
+            try:
+                self.log_batch(batch)
+            except Exception as e:
+                print(f"Error writing queued interactions: {e}")
+    
+    def flush(self, timeout_seconds: float = 10.0):
+        """Write every queued interaction, including a batch the writer is already holding (runs at exit)"""
+        if self.flush_thread.is_alive():
+            # The writer finishes its current batch, then everything up to the sentinel, then stops
+            self._log_queue.put(_FLUSH_SENTINEL)
+            self.flush_thread.join(timeout_seconds)
+        batch = []
+        while True:
+            try:
+                item = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _FLUSH_SENTINEL:
+                batch.append(item)
+        if batch:
+            self.log_batch(batch)
+    
     def log_human_oversight(self, user_id: str, record_id: str, action: str,
                           review_result: str, notes: str = "") -> str:
         """Log human oversight activity"""
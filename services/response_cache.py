@@ -0,0 +1,82 @@
+"""
+Persistent exact-match response cache
+
+Identical requests (same prompt version, model, resume context and conversation) return the
+stored answer from a small SQLite table instead of calling the provider, and
+the answers survive app restarts. The database runs in WAL mode so lookups
+from concurrent sessions do not block on writes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from services.llm_providers import PROMPT_VERSION
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+class ResponseCache:
+    """SQLite-backed cache of provider responses keyed by a hash of the full request"""
+
+    def __init__(self, db_file: str = "data/response_cache.db"):
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, context: str, messages: List[Dict]) -> str:
+        """Stable key over everything that shapes the answer, including the system prompt version"""
+        if ORJSON_AVAILABLE:
+            conversation = orjson.dumps(messages)
+        else:
+            conversation = json.dumps(messages, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.blake2b(f"{PROMPT_VERSION}|{model}|{context}|".encode("utf-8"), digest_size=16)
+        digest.update(conversation)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Stored response for a key, or None"""
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading cached response: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, response: str):
+        """Store (or replace) the response for a key"""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, int(time.time()))
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error caching response: {e}")
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache() -> Optional[ResponseCache]:
+    """Process-wide cache; None if the database cannot be opened (e.g. read-only filesystem)"""
+    try:
+        return ResponseCache()
+    except sqlite3.Error as e:
+        print(f"Response cache unavailable: {e}")
+        return None
@@ -3,13 +3,42 @@ Resume data service for context retrieval and data processing
 """
 
 import json
+from functools import lru_cache
 from difflib import SequenceMatcher
 from typing import Dict, Any, List, Tuple
 from services.fallback_resume import fallback_service
 from services.resume_grounding import finalize_context, debug_log
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 _RECOMMENDATION_TARGETS = ("recommendation", "recommended", "recommends")
 
+# Routing keywords, matched as substrings of the lowercased message (so "skill" hits "skills")
+_CERTIFICATE_WORDS = ("certificate", "certification", "credential")
+_PROFILE_WORDS = ("link", "github", "linkedin", "website", "medium", "spotify", "profile link", "my links", "social")
+_DATA_WORDS = ("data", "analytics", "pipeline", "etl", "elasticsearch", "bi")
+_PRODUCT_AI_WORDS = ("product", "awp", "agentic", "mcp", "ai act", "product engineer")
+_EXPERIENCE_WORDS = ("experience", "work", "job", "career")
+_SKILL_WORDS = ("skill", "technology", "programming", "tech")
+_SEARCH_WORDS = ("search", "find")
+_SEARCH_STOPWORDS = frozenset(("search", "find", "about", "with"))
+
+
+def dumps_json(obj: Any, indent: bool = False) -> str:
+    """Serialize with orjson when installed; compact unless indent is requested.
+
+    Context JSON is only read by the LLM, so compact output roughly halves its tokens.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 
 def _is_recommendation_word(word: str) -> bool:
     """Return True if a single word is a close enough match to any recommendation-related term."""
@@ -178,60 +207,42 @@ class ResumeService:
         )
         return "\n".join(lines)
 
+    @staticmethod
+    def _certificates_context(data: Dict[str, Any]) -> str:
+        return ResumeService._format_certificates(data.get("certificates", []))
+
+    @staticmethod
+    def _profiles_context(data: Dict[str, Any]) -> str:
+        personal = data.get("personal", {})
+        return ResumeService._format_profiles(
+            personal.get("profiles", []),
+            personal.get("website", ""),
+        )
+
+    @staticmethod
+    def _experience_context(data: Dict[str, Any]) -> str:
+        return f"Work Experience:\n{dumps_json(fallback_service.get_experience())}"
+
     @staticmethod
     def _resolve_context(user_message: str, history: List[Dict] = None) -> Tuple[str, str]:
         """Return (context_body, route_name) before grounding footer."""
         message_lower = user_message.lower()
         data = fallback_service.get_full_resume()
 
-        if any(word in message_lower for word in ["certificate", "certification", "credential"]):
-            return ResumeService._format_certificates(data.get("certificates", [])), "certificates"
-
-        if any(
-            word in message_lower
-            for word in ["link", "github", "linkedin", "website", "medium", "spotify", "profile link", "my links", "social"]
-        ):
-            personal = data.get("personal", {})
-            return (
-                ResumeService._format_profiles(
-                    personal.get("profiles", []),
-                    personal.get("website", ""),
-                ),
-                "profiles",
-            )
-
-        if any(
-            word in message_lower
-            for word in ["data", "analytics", "pipeline", "etl", "elasticsearch", "bi"]
-        ):
-            return ResumeService._data_engineering_context(data), "data"
-
-        if any(
-            word in message_lower
-            for word in ["product", "awp", "agentic", "mcp", "ai act", "product engineer"]
-        ):
-            return ResumeService._product_ai_context(data), "product_ai"
-
-        if any(word in message_lower for word in ["experience", "work", "job", "career"]):
-            return (
-                f"Work Experience:\n{json.dumps(fallback_service.get_experience(), indent=2)}",
-                "experience",
-            )
-
-        if any(word in message_lower for word in ["skill", "technology", "programming", "tech"]):
-            return ResumeService._format_skills_context(data), "skills"
+        for keywords, route in _KEYWORD_ROUTES:
+            if any(word in message_lower for word in keywords):
+                return _static_context(route), route
 
-        if any(word in message_lower for word in ["search", "find"]):
-            words = message_lower.split()
+        if any(word in message_lower for word in _SEARCH_WORDS):
             search_terms = [
                 word
-                for word in words
-                if len(word) > 3 and word not in ["search", "find", "about", "with"]
+                for word in message_lower.split()
+                if len(word) > 3 and word not in _SEARCH_STOPWORDS
             ]
             if search_terms:
                 search_query = " ".join(search_terms[:3])
                 results = fallback_service.search_resume(search_query)
-                return f"Search Results:\n{json.dumps(results, indent=2)}", "search"
+                return f"Search Results:\n{dumps_json(results)}", "search"
 
         if _looks_like_recommendation_query(message_lower):
             recs = data.get("recommendations", [])
@@ -248,10 +259,7 @@ class ResumeService:
                         + "\n".join(f"- {name}" for name in names),
                         "reference_names",
                     )
-            return (
-                ResumeService._format_recommendations(recs),
-                "recommendations",
-            )
+            return _static_context("recommendations"), "recommendations"
 
         # No route matched the current message — check recent conversation for topic clues
         # so follow-up questions like "what did they say?" still get the right context.
@@ -262,19 +270,12 @@ class ResumeService:
                 if m.get("role") in ("user", "assistant")
             ).lower()
             if _looks_like_recommendation_query(recent_text):
-                recs = data.get("recommendations", [])
-                return ResumeService._format_recommendations(recs), "recommendations"
-            if any(w in recent_text for w in ["certificate", "certification", "credential"]):
-                return ResumeService._format_certificates(data.get("certificates", [])), "certificates"
-            if any(w in recent_text for w in ["experience", "work", "job", "career"]):
-                return (
-                    f"Work Experience:\n{json.dumps(fallback_service.get_experience(), indent=2)}",
-                    "experience",
-                )
-            if any(w in recent_text for w in ["skill", "technology", "programming", "tech"]):
-                return ResumeService._format_skills_context(data), "skills"
+                return _static_context("recommendations"), "recommendations"
+            for keywords, route in _HISTORY_ROUTES:
+                if any(w in recent_text for w in keywords):
+                    return _static_context(route), route
 
-        return ResumeService._build_default_summary(data), "default"
+        return _static_context("default"), "default"
 
     @staticmethod
     def _build_default_summary(data: Dict[str, Any]) -> str:
@@ -377,13 +378,13 @@ class ResumeService:
         blocks = [
             "Product & AI / agentic systems context:",
             ResumeService._format_career_pillars(data.get("career_pillars", [])),
-            f"Skills:\n{json.dumps(product_skills, indent=2)}",
+            f"Skills:\n{dumps_json(product_skills)}",
         ]
         if one_front:
             blocks.append(
                 f"ONE-FRONT ({one_front.get('position')}):\n"
                 f"{one_front.get('description', '')}\n"
-                f"Highlights: {json.dumps(one_front.get('highlights', [])[:8], indent=2)}"
+                f"Highlights: {dumps_json(one_front.get('highlights', [])[:8])}"
             )
         return "\n\n".join(blocks)
 
@@ -392,9 +393,8 @@ class ResumeService:
         """Full skills + experience context for Smart Match job analysis."""
         data = fallback_service.get_full_resume()
         skills_block = ResumeService._format_skills_context(data)
-        experience_block = f"Work Experience:\n{json.dumps(fallback_service.get_experience(), indent=2)}"
+        experience_block = ResumeService._experience_context(data)
         body = f"{skills_block}\n\n---\n\n{experience_block}"
-        from services.resume_grounding import finalize_context
         return finalize_context(body, "job_match", "job match analysis")
 
     @staticmethod
@@ -446,3 +446,37 @@ class ResumeService:
     def get_profiles_data() -> Dict[str, Any]:
         """Get profile links"""
         return fallback_service.get_profiles()
+
+# Routes whose context depends only on the (static) resume data
+_CONTEXT_BUILDERS = {
+    "certificates": ResumeService._certificates_context,
+    "profiles": ResumeService._profiles_context,
+    "data": ResumeService._data_engineering_context,
+    "product_ai": ResumeService._product_ai_context,
+    "experience": ResumeService._experience_context,
+    "skills": ResumeService._format_skills_context,
+    "recommendations": lambda data: ResumeService._format_recommendations(data.get("recommendations", [])),
+    "default": ResumeService._build_default_summary,
+}
+
+# Keyword routes in priority order: (keywords, route name)
+_KEYWORD_ROUTES = (
+    (_CERTIFICATE_WORDS, "certificates"),
+    (_PROFILE_WORDS, "profiles"),
+    (_DATA_WORDS, "data"),
+    (_PRODUCT_AI_WORDS, "product_ai"),
+    (_EXPERIENCE_WORDS, "experience"),
+    (_SKILL_WORDS, "skills"),
+)
+
+# Topic clues checked in recent conversation when the current message matches no route
+_HISTORY_ROUTES = (
+    (_CERTIFICATE_WORDS, "certificates"),
+    (_EXPERIENCE_WORDS, "experience"),
+    (_SKILL_WORDS, "skills"),
+)
+
+@lru_cache(maxsize=16)
+def _static_context(route: str) -> str:
+    """Context body for a data-only route, built once; call cache_clear() if resume data is reloaded"""
+    return _CONTEXT_BUILDERS[route](fallback_service.get_full_resume())
@@ -0,0 +1,64 @@
+"""
+Normalized response cache for standalone resume questions
+
+Re-typings of a question that only differ in case, punctuation or spacing
+("What are his strongest skills?" / "what are his strongest skills") should not
+each pay a provider round trip. Questions are reduced to their ordered word
+sequence, so "Is his Python stronger than his Java?" and "Is his Java stronger
+than his Python?" stay different questions, and looked up in a plain dict
+partitioned by (provider, model, context).
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import streamlit as st
+
+# Keeps "#" and "+" inside words so "C", "C#" and "C++" stay distinct
+_WORD_RE = re.compile(r"\w[\w#+]*")
+
+def normalize_query(text: str) -> Tuple[str, ...]:
+    """Lowercased words of a query in their original order"""
+    return tuple(_WORD_RE.findall(text.lower()))
+
+class SemanticCache:
+    """Answer cache keyed by normalized question, provider, model and grounding context"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[bytes, Tuple[str, ...]], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(query: str, context: str, provider: str, model: str) -> Tuple[bytes, Tuple[str, ...]]:
+        # 128-bit digest: a CRC collision here would serve another context's answers
+        partition = hashlib.blake2b(f"{provider}|{model}|{context}".encode("utf-8"), digest_size=16).digest()
+        return partition, normalize_query(query)
+
+    def lookup(self, query: str, context: str, provider: str, model: str) -> Optional[str]:
+        """Return a cached answer for the same question from the same model and context"""
+        key = self._key(query, context, provider, model)
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def add(self, query: str, context: str, provider: str, model: str, response: str):
+        """Store an answer, evicting the least recently used entry once the cache is full"""
+        key = self._key(query, context, provider, model)
+        if not key[1]:
+            return
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+@st.cache_resource(show_spinner=False)
+def get_semantic_cache() -> SemanticCache:
+    """Process-wide cache shared by all sessions"""
+    return SemanticCache()
@@ -4,17 +4,36 @@ Session state management for the Streamlit application
 
 import streamlit as st
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from resume_core.config import (
     get_openrouter_api_key,
     get_openai_api_key,
     DEFAULT_OPENROUTER_MODEL,
     AUTO_OPENROUTER_MODEL,
-    AVAILABLE_OPENROUTER_MODELS,
+    OPENROUTER_MODEL_INDEX,
     DEPRECATED_OPENROUTER_MODELS,
     DEFAULT_GIST_ID,
     DEFAULT_SERVER_PATH,
 )
+from resume_core.models import chat_timestamp
+
+# Resolved once at import; a failed import per rerun would rescan sys.path every time
+try:
+    from services.fallback_resume import REQUESTS_AVAILABLE
+except ImportError:
+    REQUESTS_AVAILABLE = True
+
+# Session keys that only need a starting value (chat, server config, UI and funnel state)
+_SESSION_DEFAULTS: Dict[str, Any] = {
+    'messages': [],
+    'current_gist_id': DEFAULT_GIST_ID,
+    'current_server_path': DEFAULT_SERVER_PATH,
+    'show_api_key_modal': False,
+    'show_job_analysis_modal': False,
+    'api_key_check_done': False,
+    'quote_funnel_step': "start",
+    'quote_funnel_path': [],
+}
 
 class SessionManager:
     """Handles session state management and initialization"""
@@ -22,13 +41,16 @@ class SessionManager:
     @staticmethod
     def initialize_session_state():
         """Initialize all session state variables"""
-        # Chat messages
-        if 'messages' not in st.session_state:
-            st.session_state.messages = []
+        # Plain defaults; lists are copied so sessions never share one object
+        for key, default in _SESSION_DEFAULTS.items():
+            if key not in st.session_state:
+                st.session_state[key] = default.copy() if isinstance(default, list) else default
         
         # API Keys
         if 'openrouter_api_key' not in st.session_state:
-            st.session_state.openrouter_api_key = get_openrouter_api_key()
+            SessionManager.set_openrouter_api_key(get_openrouter_api_key())
+        elif 'masked_api_key' not in st.session_state:
+            SessionManager.set_openrouter_api_key(st.session_state.openrouter_api_key)
         
         if 'openai_api_key' not in st.session_state:
             st.session_state.openai_api_key = get_openai_api_key()
@@ -38,66 +60,42 @@ class SessionManager:
             st.session_state.current_provider = "openrouter"
             st.session_state.current_model = DEFAULT_OPENROUTER_MODEL
 
-        # Migrate legacy sessions to OpenRouter
-        st.session_state.current_provider = "openrouter"
-        st.session_state.current_model = DEFAULT_OPENROUTER_MODEL
+        # Migrate legacy sessions to OpenRouter once, so later reruns keep the user's model pick
+        if st.session_state.get("_last_provider_mode") != "openrouter":
+            st.session_state.current_provider = "openrouter"
+            st.session_state.current_model = DEFAULT_OPENROUTER_MODEL
+            st.session_state._last_provider_mode = "openrouter"
 
         current_model = st.session_state.get("current_model", "")
         if (
             current_model in DEPRECATED_OPENROUTER_MODELS
-            or current_model not in AVAILABLE_OPENROUTER_MODELS
+            or current_model not in OPENROUTER_MODEL_INDEX
             or current_model == "openrouter/free"
         ) and current_model != AUTO_OPENROUTER_MODEL:
             st.session_state.current_model = AUTO_OPENROUTER_MODEL
-        
-        # Server Configuration
-        if 'current_gist_id' not in st.session_state:
-            st.session_state.current_gist_id = DEFAULT_GIST_ID
-        
-        if 'current_server_path' not in st.session_state:
-            st.session_state.current_server_path = DEFAULT_SERVER_PATH
-        
-        # UI State
-        if 'show_api_key_modal' not in st.session_state:
-            st.session_state.show_api_key_modal = False
-        
-        if 'show_job_analysis_modal' not in st.session_state:
-            st.session_state.show_job_analysis_modal = False
-        
-        # Processing state
-        if 'processing_message' not in st.session_state:
-            st.session_state.processing_message = False
-        
-        if 'current_processing_message' not in st.session_state:
-            st.session_state.current_processing_message = ""
-        
-        # API key check
-        if 'api_key_check_done' not in st.session_state:
-            st.session_state.api_key_check_done = False
-        
-        # Funnel state
-        if 'quote_funnel_step' not in st.session_state:
-            st.session_state.quote_funnel_step = "start"
-        
-        if 'quote_funnel_path' not in st.session_state:
-            st.session_state.quote_funnel_path = []
+    
+    @staticmethod
+    def set_openrouter_api_key(raw_key: str):
+        """Store the OpenRouter key stripped once, with its presence flag and masked form"""
+        key = (raw_key or "").strip()
+        st.session_state.openrouter_api_key = key
+        st.session_state.has_api_key = bool(key)
+        st.session_state.masked_api_key = (key[:8] + "..." + key[-4:] if len(key) > 12 else "***") if key else ""
     
     @staticmethod
     def check_api_key_modal_trigger():
         """Check if API key modal should be shown"""
-        if not st.session_state.get('openrouter_api_key', '').strip() and not st.session_state.get('api_key_check_done', False):
+        if not st.session_state.get('has_api_key', False) and not st.session_state.get('api_key_check_done', False):
             st.session_state.show_api_key_modal = True
             st.session_state.api_key_check_done = True
     
     @staticmethod
     def add_message(role: str, content: str):
         """Add a message to the chat history"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%b %d, %I:%M %p")
         st.session_state.messages.append({
             "role": role,
             "content": content,
-            "timestamp": timestamp
+            "timestamp": chat_timestamp()
         })
     
     @staticmethod
@@ -106,46 +104,34 @@ class SessionManager:
         st.session_state.messages = []
     
     @staticmethod
-    def set_processing_state(message: str = ""):
-        """Set the processing state for a message"""
-        st.session_state.processing_message = True
-        st.session_state.current_processing_message = message
+    def queue_prompt(message: str):
+        """Add a user message and mark it to be answered later in this same run"""
+        SessionManager.add_message("user", message)
+        st.session_state.pending_prompt = message
     
     @staticmethod
-    def clear_processing_state():
-        """Clear the processing state"""
-        st.session_state.processing_message = False
-        if 'current_processing_message' in st.session_state:
-            del st.session_state.current_processing_message
+    def pop_pending_prompt() -> Optional[str]:
+        """Take the queued prompt, if any, so it is answered exactly once"""
+        return st.session_state.pop('pending_prompt', None)
     
     @staticmethod
     def is_setup_complete() -> bool:
         """Check if the application setup is complete"""
-        try:
-            from fallback_resume import REQUESTS_AVAILABLE
-            requests_available = REQUESTS_AVAILABLE
-        except:
-            requests_available = True
-        
         current_provider = st.session_state.get('current_provider', 'openrouter')
 
         return (
-            requests_available
+            REQUESTS_AVAILABLE
             and current_provider == 'openrouter'
-            and st.session_state.get('openrouter_api_key', '').strip()
+            and st.session_state.get('has_api_key', False)
         )
     
     @staticmethod
     def get_system_status() -> Dict[str, str]:
         """Get system status indicators"""
-        try:
-            from fallback_resume import REQUESTS_AVAILABLE
-            data_status = 'CV <span class="status-emoji">🟢</span>' if REQUESTS_AVAILABLE else 'Local Data <span class="status-emoji">🟢</span>'
-        except:
-            data_status = 'CV <span class="status-emoji">🟢</span>'
+        data_status = 'CV <span class="status-emoji">🟢</span>' if REQUESTS_AVAILABLE else 'Local Data <span class="status-emoji">🟢</span>'
         
         ai_status = 'LLM <span class="status-emoji">🟢</span>' if st.session_state.current_provider else 'LLM required <span class="status-emoji">🔴</span>'
-        api_key_status = 'API <span class="status-emoji">🟢</span>' if st.session_state.get('openrouter_api_key', '').strip() else 'API Key <span class="status-emoji">🔴</span>'
+        api_key_status = 'API <span class="status-emoji">🟢</span>' if st.session_state.get('has_api_key', False) else 'API Key <span class="status-emoji">🔴</span>'
         
         return {
             'data': data_status,
@@ -160,39 +146,26 @@ class SessionManager:
             user_message = st.session_state.pending_question
             del st.session_state.pending_question
             
-            # Add the question as a user message
-            SessionManager.add_message("user", user_message)
-            
-            # Mark for processing
-            SessionManager.set_processing_state(user_message)
-            
-            st.rerun()
+            # Answered by the chat panel further down this run
+            SessionManager.queue_prompt(user_message)
     
     @staticmethod
     def quick_start_setup():
         """Quick setup for cloud deployment"""
-        setup_completed = True
-        
-        # Check OpenRouter API key
-        current_key = st.session_state.get("openrouter_api_key", "").strip()
-        if current_key:
-            setup_completed = True
-        
-        # Set LLM provider
-        if not st.session_state.current_provider:
-            st.session_state.current_provider = "openrouter"
-            st.session_state.current_model = DEFAULT_OPENROUTER_MODEL
-            setup_completed = True
+        # Provider defaults only need settling once per session; pending messages are per-run work
+        if not st.session_state.get('_setup_done'):
+            # Set LLM provider
+            if not st.session_state.current_provider:
+                st.session_state.current_provider = "openrouter"
+                st.session_state.current_model = DEFAULT_OPENROUTER_MODEL
+            st.session_state._setup_done = True
         
         # Process any pending user message after setup
-        if setup_completed and st.session_state.get('pending_user_message'):
+        if st.session_state.get('pending_user_message'):
             pending_msg = st.session_state.pending_user_message
             del st.session_state.pending_user_message
             
-            # Add the user message to chat
-            SessionManager.add_message("user", pending_msg)
-            
-            # Set up for processing
-            SessionManager.set_processing_state(pending_msg)
+            # Add the user message to chat and answer it in this run
+            SessionManager.queue_prompt(pending_msg)
         
-        return setup_completed 
\ No newline at end of file
+        return True
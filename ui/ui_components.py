@@ -3,190 +3,202 @@ UI Components and styling for the Streamlit application
 """
 
 import streamlit as st
-import datetime
-from typing import List, Dict, Any
-from resume_core.models import ChatMessage
-from resume_core.config import DEFAULT_OPENROUTER_MODEL
+import itertools
+import re
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator
+from resume_core.models import ChatMessage, chat_timestamp
+from resume_core.config import DEFAULT_OPENROUTER_MODEL, CHAT_RENDER_WINDOW
+from ui.session_manager import SessionManager
+from services.llm_providers import LLMProviders
+from services.resume_service import ResumeService
 
-class UIComponents:
-    """Handles UI components and styling"""
-    
-    @staticmethod
-    def apply_custom_css():
-        """Apply custom CSS styling to the application"""
-        st.markdown("""
-            <style>
-            /* Main Container - Remove default Streamlit padding */
-            .main .block-container {
-                padding-top: 1rem;
-                padding-bottom: 0rem;
-                max-width: none;
-            }
-            
-            /* Emoji size normalization */
-            .status-emoji {
-                font-size: 6px !important;
-                vertical-align: middle;
-                display: inline-block;
-            }
-            
-            /* Title - Ultra Compact */
-            .main-title {
-                text-align: center;
-                padding: 1.5rem 0 0.5rem 0;
-                background: linear-gradient(135deg, 
-                    #667eea 0%, 
-                    #764ba2 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-                font-family: 'Segoe UI', sans-serif;
-                margin-bottom: 1rem;
-            }
-            
-            /* Chat Container */
-            .chat-container {
-                height: 65vh;
-                overflow-y: auto;
-                padding: 1rem;
-                border: 1px solid #e0e0e0;
-                border-radius: 10px;
-                background: #fafafa;
-                margin-bottom: 1rem;
-            }
-            
-            /* Message Styles */
-            .user-message {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 0.8rem 1.2rem;
-                border-radius: 15px 15px 5px 15px;
-                margin: 0.5rem 0 0.5rem auto;
-                max-width: 80%;
-                margin-left: 20%;
-                box-shadow: 0 2px 10px rgba(102, 126, 234, 0.3);
-            }
-            
-            .assistant-message {
-                background: white;
-                color: #333;
-                padding: 0.8rem 1.2rem;
-                border-radius: 15px 15px 15px 5px;
-                margin: 0.5rem auto 0.5rem 0;
-                max-width: 80%;
-                border: 1px solid #e0e0e0;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            }
-            
-            /* Input Area */
-            .stTextInput > div > div > input {
-                # border-radius: 25px;
-                # border: 2px solid #e0e0e0;
-                # padding: 0.7rem 1.2rem;
-                # font-size: 16px;
-            }
-            
-            .stTextInput > div > div > input:focus {
-                border-color: #667eea;
-                box-shadow: 0 0 10px rgba(102, 126, 234, 0.3);
-            }
-            
-            /* Buttons */
-            .stButton > button {
-                # border-radius: 20px;
-                # border: none;
-                padding: 0.5rem 1.5rem;
-                font-weight: 600;
-                transition: all 0.3s ease;
-            }
-            
-            .stButton > button:hover {
-                # transform: translateY(-2px);
-                # box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-            }
-            
-            /* Sidebar */
-            .css-1d391kg {
-                background: #f8f9fa;
-            }
-            
-            /* Responsive Design */
-            .main .block-container {
-                padding-top: 1rem;
-                padding-bottom: 1rem;
-                max-width: 100vw;
-                width: 100%;
-                padding-left: 1rem;
-                padding-right: 1rem;
-            }
-            
-            .stApp {
-                max-width: 100vw;
-                overflow-x: hidden;
-            }
-            
-            /* Chat container styling */
-            .stChatMessage {
-                margin-bottom: 1rem;
-            }
-            
-            /* Button styling improvements */
-            .stButton > button {
-                transition: all 0.2s ease;
-            }
-            
-            /* Green styling for secondary buttons */
-            .stButton > button[data-testid="baseButton-secondary"] {
-                background-color: #22c55e !important;
-                color: white !important;
-                border: 1px solid #16a34a !important;
-            }
-            
-            .stButton > button[data-testid="baseButton-secondary"]:hover {
-                background-color: #16a34a !important;
-                border: 1px solid #15803d !important;
-            }
-            
-            .stButton > button:hover {
-                transform: translateY(-1px);
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }
-            
-            /* Column spacing */
-            [data-testid="column"] {
-                padding: 0 10px;
-            }
-            
-            /* Compact spacing */
-            .stMarkdown {
-                margin-bottom: 0.5rem;
-            }
-            
-            /* Chat input styling */
-            .stChatInput {
-                margin-top: 10px;
-                padding: 10px 0;
-            }
-            
-            @media (max-width: 768px) {
-                [data-testid="column"] {
-                    width: 100% !important;
-                    flex: none !important;
-                    margin-bottom: 1rem;
-                    padding: 0 5px;
-                }
-                
-                [data-testid="column"]:first-child {
-                    height: 500px; /* Smaller height for mobile */
-                }
-            }
-            </style>
-        """, unsafe_allow_html=True)
+_CUSTOM_CSS = """
+/* Main Container - Remove default Streamlit padding */
+.main .block-container {
+    padding-top: 1rem;
+    padding-bottom: 0rem;
+    max-width: none;
+}
+
+/* Emoji size normalization */
+.status-emoji {
+    font-size: 6px !important;
+    vertical-align: middle;
+    display: inline-block;
+}
+
+/* Title - Ultra Compact */
+.main-title {
+    text-align: center;
+    padding: 1.5rem 0 0.5rem 0;
+    background: linear-gradient(135deg, 
+        #667eea 0%, 
+        #764ba2 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+    font-family: 'Segoe UI', sans-serif;
+    margin-bottom: 1rem;
+}
+
+/* Chat Container */
+.chat-container {
+    height: 65vh;
+    overflow-y: auto;
+    padding: 1rem;
+    border: 1px solid #e0e0e0;
+    border-radius: 10px;
+    background: #fafafa;
+    margin-bottom: 1rem;
+}
+
+/* Message Styles */
+.user-message {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 0.8rem 1.2rem;
+    border-radius: 15px 15px 5px 15px;
+    margin: 0.5rem 0 0.5rem auto;
+    max-width: 80%;
+    margin-left: 20%;
+    box-shadow: 0 2px 10px rgba(102, 126, 234, 0.3);
+}
+
+.assistant-message {
+    background: white;
+    color: #333;
+    padding: 0.8rem 1.2rem;
+    border-radius: 15px 15px 15px 5px;
+    margin: 0.5rem auto 0.5rem 0;
+    max-width: 80%;
+    border: 1px solid #e0e0e0;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+
+/* Input Area */
+.stTextInput > div > div > input {
+    # border-radius: 25px;
+    # border: 2px solid #e0e0e0;
+    # padding: 0.7rem 1.2rem;
+    # font-size: 16px;
+}
+
+.stTextInput > div > div > input:focus {
+    border-color: #667eea;
+    box-shadow: 0 0 10px rgba(102, 126, 234, 0.3);
+}
+
+/* Buttons */
+.stButton > button {
+    # border-radius: 20px;
+    # border: none;
+    padding: 0.5rem 1.5rem;
+    font-weight: 600;
+    transition: all 0.3s ease;
+}
+
+.stButton > button:hover {
+    # transform: translateY(-2px);
+    # box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+}
+
+/* Sidebar */
+.css-1d391kg {
+    background: #f8f9fa;
+}
+
+/* Responsive Design */
+.main .block-container {
+    padding-top: 1rem;
+    padding-bottom: 1rem;
+    max-width: 100vw;
+    width: 100%;
+    padding-left: 1rem;
+    padding-right: 1rem;
+}
+
+.stApp {
+    max-width: 100vw;
+    overflow-x: hidden;
+}
+
+/* Chat container styling */
+.stChatMessage {
+    margin-bottom: 1rem;
+}
+
+/* Button styling improvements */
+.stButton > button {
+    transition: all 0.2s ease;
+}
+
+/* Green styling for secondary buttons */
+.stButton > button[data-testid="baseButton-secondary"] {
+    background-color: #22c55e !important;
+    color: white !important;
+    border: 1px solid #16a34a !important;
+}
+
+.stButton > button[data-testid="baseButton-secondary"]:hover {
+    background-color: #16a34a !important;
+    border: 1px solid #15803d !important;
+}
+
+.stButton > button:hover {
+    transform: translateY(-1px);
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+/* Column spacing */
+[data-testid="column"] {
+    padding: 0 10px;
+}
+
+/* Compact spacing */
+.stMarkdown {
+    margin-bottom: 0.5rem;
+}
+
+/* Chat input styling */
+.stChatInput {
+    margin-top: 10px;
+    padding: 10px 0;
+}
+
+@media (max-width: 768px) {
+    [data-testid="column"] {
+        width: 100% !important;
+        flex: none !important;
+        margin-bottom: 1rem;
+        padding: 0 5px;
+    }
     
-    @staticmethod
-    def render_header(data_status: str, ai_status: str, api_key_status: str):
-        """Render the application header with system status"""
-        st.markdown(f"""
+    [data-testid="column"]:first-child {
+        height: 500px; /* Smaller height for mobile */
+    }
+}
+
+/* Sidebar expanders */
+.sidebar .stExpander {
+    margin-bottom: 0.5rem;
+}
+.sidebar .stExpander > div {
+    border-radius: 8px;
+}
+"""
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace so each rerun sends a smaller style block"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).strip()
+
+# Built once at import; Streamlit drops elements a rerun does not re-emit, so it is still sent every run
+_CUSTOM_CSS_HTML = f"<style>{_minify_css(_CUSTOM_CSS)}</style>"
+
+_HEADER_TEMPLATE = """
         <div style='text-align: center;'>
             <h1 style='margin: 0; font-size: 68px; font-weight: 800;'>🤖 MikeGPT</h1>
             <p style='font-size: 18px; color: #666; margin: 0 0 0.5rem 0; font-weight: 500;'>
@@ -204,31 +216,86 @@ class UIComponents:
                 </span> 
             </p>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+@lru_cache(maxsize=8)
+def _header_html(data_status: str, ai_status: str, api_key_status: str) -> str:
+    """Header markup per status combination; only a handful ever occur"""
+    return _HEADER_TEMPLATE.format(
+        data_status=data_status, ai_status=ai_status, api_key_status=api_key_status
+    )
+
+# Landing-page message, shown while the chat history is empty
+_WELCOME_MD = """
+##### Welcome to Michael's AI Resume!
+
+###### Language supported:
+🇺🇸 🇪🇸 🇫🇷 🇩🇪 🇮🇹 🇵🇹 🇳🇱 🇷🇺 🇨🇳 🇯🇵 🇰🇷
+
+###### Quick Actions:
+
+👤 **Summarize Profile** - Get a comprehensive overview  
+📅 **Years Experience** - View career timeline and progression  
+🛠️ **Technical Skills** - Explore technical expertise and specializations  
+🎯 **Smart Match** - Analyze job descriptions against candidate fit  
+📄 **Download CV** - Open professional CV in a new tab  
+
+
+Just ask anything!"""
+
+# Streamlit re-renders the reply for every chunk it is handed; 20 Hz still reads as live
+_STREAM_FLUSH_SECONDS = 0.05
+
+def _throttled(chunks: Iterable[str], interval: float = _STREAM_FLUSH_SECONDS) -> Iterator[str]:
+    """Re-chunk a token stream so the message is redrawn at most once per interval"""
+    pending = []
+    last_flush = 0.0  # the first chunk goes out immediately
+    for chunk in chunks:
+        pending.append(chunk)
+        now = time.monotonic()
+        if now - last_flush >= interval:
+            yield "".join(pending)
+            pending.clear()
+            last_flush = now
+    if pending:
+        yield "".join(pending)
+
+# Quick-action buttons in column order: (action, label, widget key, help); None is the CV link
+_QUICK_ACTION_BUTTONS = (
+    ("summary", "👤 Summarize Profile", "top_quick_summary", "Get a comprehensive overview of this candidate"),
+    ("experience", "📅 Years Experience", "top_quick_experience", "Find out total years of experience"),
+    ("skills", "🛠️ Technical Skills", "top_quick_tech_skills", "Analyze technical competencies"),
+    None,
+    ("match", "🎯 Smart Match", "top_quick_job_analysis", "Analyze candidate fit for a specific job"),
+)
+
+class UIComponents:
+    """Handles UI components and styling"""
+    
+    @staticmethod
+    def apply_custom_css():
+        """Apply custom CSS styling to the application"""
+        st.markdown(_CUSTOM_CSS_HTML, unsafe_allow_html=True)
+    
+    @staticmethod
+    def render_header(data_status: str, ai_status: str, api_key_status: str):
+        """Render the application header with system status"""
+        st.markdown(_header_html(data_status, ai_status, api_key_status), unsafe_allow_html=True)
         
     
     @staticmethod
     def render_quick_actions():
         """Render quick action buttons"""
         st.caption("Quick Actions:")
-        quick_col1, quick_col2, quick_col3, quick_col4, quick_col5 = st.columns(5)
         
         actions = {}
-        
-        with quick_col1:
-            actions["summary"] = st.button("👤 Summarize Profile", key="top_quick_summary", use_container_width=True, help="Get a comprehensive overview of this candidate")
-        
-        with quick_col2:
-            actions["experience"] = st.button("📅 Years Experience", key="top_quick_experience", use_container_width=True, help="Find out total years of experience")
-        
-        with quick_col3:
-            actions["skills"] = st.button("🛠️ Technical Skills", key="top_quick_tech_skills", use_container_width=True, help="Analyze technical competencies")
-        
-        with quick_col4:
-            UIComponents.render_download_button()
-        
-        with quick_col5:
-            actions["match"] = st.button("🎯 Smart Match", key="top_quick_job_analysis", use_container_width=True, help="Analyze candidate fit for a specific job")
+        for column, button in zip(st.columns(len(_QUICK_ACTION_BUTTONS)), _QUICK_ACTION_BUTTONS):
+            with column:
+                if button is None:
+                    UIComponents.render_download_button()
+                    continue
+                action, label, key, help_text = button
+                actions[action] = st.button(label, key=key, use_container_width=True, help=help_text)
         
         return actions
     
@@ -244,7 +311,9 @@ class UIComponents:
     
     @staticmethod
     def render_chat_messages(messages: List[Dict[str, Any]]):
-        """Render chat messages"""
+        """Render the full chat history; only the latest turns carry feedback widgets"""
+        # Older turns are plain markdown, so long conversations don't register two buttons per reply
+        live_from = max(len(messages) - CHAT_RENDER_WINDOW, 0)
         for idx, message in enumerate(messages):
             display_name = "MikeGPT" if message["role"] == "assistant" else "User"
             with st.chat_message(message["role"]):
@@ -256,7 +325,7 @@ class UIComponents:
                 st.markdown(message["content"])
                 
                 # AI Act Compliance: Human Oversight Mechanism (Article 14)
-                if message["role"] == "assistant":
+                if message["role"] == "assistant" and idx >= live_from:
                     col1, col2, col3 = st.columns([1, 1, 20])
                     with col1:
                         if st.button("👍", key=f"thumbs_up_{idx}", help="Response is accurate"):
@@ -273,27 +342,22 @@ class UIComponents:
                                 'index': idx
                             })
     
+    @staticmethod
+    def render_streaming_response(stream) -> str:
+        """Render an assistant reply in place as its chunks arrive; return the full text"""
+        with st.chat_message("assistant"):
+            timestamp = chat_timestamp()
+            st.caption(f"**MikeGPT** • {timestamp}")
+            with st.spinner("MikeGPT is thinking... ⚡ Free LLM tier — responses may take 5–30 seconds"):
+                first_chunk = next(stream, "")
+            response = st.write_stream(_throttled(itertools.chain([first_chunk], stream)))
+        return response if isinstance(response, str) else "".join(map(str, response))
+    
     @staticmethod
     def render_welcome_message():
         """Render the welcome message when no messages exist"""
         with st.chat_message("assistant"):
-            st.markdown("""
-            ##### Welcome to Michael's AI Resume!
-                        
-            ###### Language supported:
-            🇺🇸 🇪🇸 🇫🇷 🇩🇪 🇮🇹 🇵🇹 🇳🇱 🇷🇺 🇨🇳 🇯🇵 🇰🇷
-                        
-            ###### Quick Actions:
-            
-            👤 **Summarize Profile** - Get a comprehensive overview  
-            📅 **Years Experience** - View career timeline and progression  
-            🛠️ **Technical Skills** - Explore technical expertise and specializations  
-            🎯 **Smart Match** - Analyze job descriptions against candidate fit  
-            📄 **Download CV** - Open professional CV in a new tab  
-            
-                  
-            Just ask anything!
-            """)
+            st.markdown(_WELCOME_MD)
     
     @staticmethod 
     def render_api_key_modal():
@@ -306,7 +370,7 @@ class UIComponents:
                 secrets_key = st.secrets.get("OPENROUTER_API_KEY", "")
                 if secrets_key:
                     st.success("API key found in Streamlit secrets!")
-                    st.session_state.openrouter_api_key = secrets_key
+                    SessionManager.set_openrouter_api_key(secrets_key)
                     st.session_state.show_api_key_modal = False
                     st.rerun()
             except:
@@ -319,7 +383,7 @@ class UIComponents:
                     type="password",
                     placeholder="sk-or-v1-...",
                     key="modal_api_key_input",
-                    help="Must start with 'sk-or-"
+                    help="Must start with 'sk-or-v1-'"
                 )
                 
                 # Action buttons
@@ -327,13 +391,13 @@ class UIComponents:
                 
                 with col1:
                     if st.button("Activate AI Chat", type="primary", use_container_width=True):
-                        if api_key_input and api_key_input.startswith("sk-or-"):
-                            st.session_state.openrouter_api_key = api_key_input
+                        if LLMProviders.is_valid_openrouter_key(api_key_input):
+                            SessionManager.set_openrouter_api_key(api_key_input)
                             st.session_state.show_api_key_modal = False
                             st.toast("AI Chat activated! Try asking a question.")
                             st.rerun()
                         elif api_key_input:
-                            st.error("Invalid key format. Must start with 'sk-or-'")
+                            st.error("Invalid key format. Expected sk-or-v1-...")
                         else:
                             st.error("Please paste your API key above")
                 
@@ -365,8 +429,6 @@ class UIComponents:
     @staticmethod
     def render_job_analysis_modal():
         """Render the job analysis modal — processes inline so spinner is always visible."""
-        from services.resume_service import ResumeService
-        from services.llm_providers import LLMProviders
 
         @st.dialog("🎯 Smart Match Analysis", width="large")
         def job_analysis_modal():
@@ -415,7 +477,7 @@ Nice to have:
                     st.error("Please paste a job description first!")
                     return
 
-                api_key = st.session_state.get("openrouter_api_key", "").strip()
+                api_key = st.session_state.get("openrouter_api_key", "")
                 if not api_key:
                     st.error("🔑 OpenRouter API key required — add it in the sidebar first.")
                     return
@@ -432,23 +494,22 @@ Nice to have:
                     f"Be specific and reference the candidate's actual experience and skills."
                 )
 
+                provider = st.session_state.get("current_provider", "openrouter")
+                model = st.session_state.get("current_model", DEFAULT_OPENROUTER_MODEL)
+                if provider == "openai":
+                    api_key = st.session_state.get("openai_api_key", "")
+                messages = [{"role": "user", "content": analysis_prompt}]
+
+                # Stream the analysis into the dialog; the spinner covers the wait for the first token
                 with st.spinner("Analyzing candidate fit... ⚡ This may take 10–30 seconds"):
                     context = ResumeService.get_job_match_context()
-                    provider = st.session_state.get("current_provider", "openrouter")
-                    model = st.session_state.get("current_model", DEFAULT_OPENROUTER_MODEL)
-                    messages = [{"role": "user", "content": analysis_prompt}]
-
-                    if provider == "openrouter":
-                        response = LLMProviders.chat_openrouter(model, messages, context, api_key)
-                    elif provider == "openai":
-                        openai_key = st.session_state.get("openai_api_key", "")
-                        response = LLMProviders.chat_openai(model, messages, context, openai_key)
-                    elif provider == "ollama":
-                        response = LLMProviders.chat_ollama(model, messages, context)
-                    else:
-                        response = f"Unsupported provider: {provider}"
-
-                timestamp = datetime.datetime.now().strftime("%b %d, %I:%M %p")
+                    stream = LLMProviders.chat_stream(provider, model, messages, context, api_key)
+                    first_chunk = next(stream, "")
+                response = st.write_stream(_throttled(itertools.chain([first_chunk], stream)))
+                if not isinstance(response, str):
+                    response = "".join(map(str, response))
+
+                timestamp = chat_timestamp()
                 jd_preview = job_description.strip()[:80].replace("\n", " ")
                 st.session_state.messages.append({
                     "role": "user",
@@ -13,7 +13,51 @@ import json
 import requests
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _loads_json(data: bytes):
+    """Parse JSON bytes with orjson when installed (its errors subclass json.JSONDecodeError)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _dumps_json_bytes(obj, indent: bool = False) -> bytes:
+    """UTF-8 JSON bytes, straight from orjson when available; compact unless indent is requested"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# GitHub API timeouts: (connect_seconds, read_seconds)
+GITHUB_TIMEOUT = (5, 30)
+
+@lru_cache(maxsize=1)
+def _github_session() -> requests.Session:
+    """Keep-alive session for the GitHub API; status retries only cover idempotent methods"""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=retries))
+    session.headers.update({
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "MCP-Resume-Upload"
+    })
+    return session
+
+def _gist_missing(probe) -> bool:
+    """True if the background HEAD probe found the gist gone (a failed probe counts as present)"""
+    try:
+        return probe.result().status_code == 404
+    except requests.RequestException:
+        return False
 
 def create_or_update_gist(github_token: str, gist_id: str = None):
     """Create a new gist or update an existing one with resume data"""
@@ -24,22 +68,19 @@ def create_or_update_gist(github_token: str, gist_id: str = None):
         print("❌ Resume file not found: data/michael_wybraniec_resume.json")
         return None
     
-    with open(resume_file, 'r') as f:
-        resume_data = f.read()
+    # One read; json.loads validates the raw bytes, and the same text is uploaded as-is
+    resume_bytes = resume_file.read_bytes()
     
     # Validate JSON
     try:
-        json.loads(resume_data)
+        _loads_json(resume_bytes)
         print("✅ Resume JSON is valid")
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         print(f"❌ Invalid JSON: {e}")
         return None
+    resume_data = resume_bytes.decode("utf-8")
     
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "MCP-Resume-Upload"
-    }
+    headers = {"Authorization": f"token {github_token}", "Content-Type": "application/json"}
     
     gist_data = {
         "description": "Michael Wybraniec - Professional Resume (JSON Resume Format)",
@@ -51,15 +92,18 @@ def create_or_update_gist(github_token: str, gist_id: str = None):
         }
     }
     
+    # Serialized once here (orjson when installed) rather than by requests' json=
+    body = _dumps_json_bytes(gist_data)
+    
     if gist_id:
         # Update existing gist
         url = f"https://api.github.com/gists/{gist_id}"
-        response = requests.patch(url, headers=headers, json=gist_data)
+        response = _github_session().patch(url, headers=headers, data=body, timeout=GITHUB_TIMEOUT)
         action = "updated"
     else:
         # Create new gist
         url = "https://api.github.com/gists"
-        response = requests.post(url, headers=headers, json=gist_data)
+        response = _github_session().post(url, headers=headers, data=body, timeout=GITHUB_TIMEOUT)
         action = "created"
     
     if response.status_code in [200, 201]:
@@ -78,8 +122,11 @@ def create_or_update_gist(github_token: str, gist_id: str = None):
             "updated_at": result['updated_at']
         }
         
-        with open("gist_info.json", "w") as f:
-            json.dump(gist_info, f, indent=2)
+        # Write then rename, so an interrupted run never leaves a truncated gist_info.json
+        gist_info_file = Path("gist_info.json")
+        tmp_file = gist_info_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(_dumps_json_bytes(gist_info, indent=True))
+        tmp_file.replace(gist_info_file)
         
         print("💾 Gist info saved to gist_info.json")
         return result
@@ -113,14 +160,25 @@ def main():
     
     if gist_info_file.exists():
         try:
-            with open(gist_info_file, 'r') as f:
-                gist_info = json.load(f)
-                existing_gist_id = gist_info.get('gist_id')
-                print(f"📄 Found existing gist: {existing_gist_id}")
+            gist_info = _loads_json(gist_info_file.read_bytes())
+            existing_gist_id = gist_info.get('gist_id')
+            print(f"📄 Found existing gist: {existing_gist_id}")
+            
+            # Check the gist still exists while the user answers the prompt
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                probe = executor.submit(
+                    _github_session().head,
+                    f"https://api.github.com/gists/{existing_gist_id}",
+                    headers={"Authorization": f"token {github_token}"},
+                    timeout=GITHUB_TIMEOUT
+                ) if existing_gist_id else None
                 
                 update = input("Update existing gist? (y/n): ").strip().lower()
                 if update != 'y':
                     existing_gist_id = None
+                elif probe and _gist_missing(probe):
+                    print("⚠️ Existing gist no longer exists, creating a new one")
+                    existing_gist_id = None
         except:
             print("⚠️ Could not read existing gist info")
     